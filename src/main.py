@@ -1,12 +1,14 @@
+import logging
 from pathlib import Path
 from time import perf_counter
-from typing import Dict, Generator, List
+from typing import Dict, Generator, List, Optional
 
 from sualbsp_solver.data_model import Graph
 from sualbsp_solver.experiment import Experiment
 from sualbsp_solver.exporter import Exporter
 from sualbsp_solver.martino_pastor_experiment import MartinoPastor2010Experiment
-from sualbsp_solver.solver import OptimizationProcedure
+from sualbsp_solver.solution_cache import SolutionCache
+from sualbsp_solver.solver import OptimizationProcedure, accelerated
 
 # def run_experiments(
 #     instances: Generator[Graph, None, None], optimizers: List[OptimizationProcedure]
@@ -34,12 +36,22 @@ from sualbsp_solver.solver import OptimizationProcedure
 
 
 def main(
-    data_dir: Path = Path("./data/"), results_dir: Path = Path("./results/")
+    data_dir: Path = Path("./data/"),
+    results_dir: Path = Path("./results/"),
+    workers: int = 1,
+    resume: bool = True,
+    profile: bool = False,
+    cache_dir: Optional[Path] = None,
+    backend: str = "python",
 ) -> None:
 
+    accelerated.set_backend(backend)
+    cache = SolutionCache(cache_dir) if cache_dir is not None else None
+
     full_experiment = MartinoPastor2010Experiment(data_dir)
-    full_experiment.run(results_dir)
+    full_experiment.run(results_dir, workers, resume, profile, cache)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     main()
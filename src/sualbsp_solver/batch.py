@@ -0,0 +1,215 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Iterator, Optional, Sequence
+
+from sualbsp_solver import instance_cache
+from sualbsp_solver.data_model import CompiledGraph, Graph
+from sualbsp_solver.experiment import run_optimizer
+from sualbsp_solver.solution_cache import SolutionCache
+from sualbsp_solver.solver.optimizer import OptimizationProcedure
+
+# Instances a worker process keeps attached, the jobs of an instance are submitted in a row
+MAX_ATTACHED_INSTANCES = 4
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """The result of solving the instance at `instance_index` with the optimizer at
+    `optimizer_index`, see run_optimizer for the keys of `result`."""
+
+    instance_index: int
+    optimizer_index: int
+    result: dict
+
+
+@dataclass(frozen=True)
+class SharedGraph:
+    """A compiled graph in a block of shared memory, in the format of the instance cache.
+    Only the name and size of the block are pickled."""
+
+    name: str
+    size: int
+
+    @staticmethod
+    def create(compiled: CompiledGraph) -> tuple["SharedGraph", SharedMemory]:
+        """Copies the compiled graph to a new block of shared memory. The block has to be
+        released with `release` once it is not used anymore."""
+        parts = instance_cache.encode_graph(compiled)
+        size = sum(len(part) for part in parts)
+
+        memory = SharedMemory(create=True, size=size)
+        buffer = memory.buf
+        assert buffer is not None
+        offset = 0
+        for part in parts:
+            buffer[offset : offset + len(part)] = part
+            offset += len(part)
+        return SharedGraph(memory.name, size), memory
+
+    def attach(self) -> tuple[Graph, SharedMemory]:
+        """Returns the graph, whose arrays are views on the shared memory, and the block,
+        which has to stay open while the graph is used."""
+        memory = SharedMemory(self.name)
+        buffer = memory.buf
+        assert buffer is not None
+        compiled = instance_cache.decode_graph(buffer[: self.size])
+        if compiled is None:
+            memory.close()
+            raise ValueError(f"The shared memory {self.name} does not hold a graph.")
+        return Graph.from_compiled(compiled), memory
+
+
+def release(memory: SharedMemory) -> None:
+    """Closes and removes a block of shared memory created by SharedGraph.create."""
+    memory.close()
+    memory.unlink()
+
+
+def solve_batch(
+    instances: Iterable[Graph],
+    optimizers: Sequence[OptimizationProcedure],
+    workers: int = 1,
+    profile: bool = False,
+    cache: Optional[SolutionCache] = None,
+) -> Iterator[BatchResult]:
+    """Solves every instance with every optimizer and yields the results.
+
+    With one worker, the results are yielded in order. With more workers, the results are
+    yielded as soon as they are available, by a pool of processes that is started once for the
+    whole batch. The processes receive the optimizers once, at their start, and attach the
+    compiled instances from shared memory instead of receiving pickled tasks. The instances
+    are consumed lazily, at most 2 * `workers` jobs are submitted ahead. Closing the generator
+    cancels the pending jobs.
+
+    If a cache is given, cached results are yielded without solving, see run_optimizer. Only
+    the calling process uses the cache.
+    """
+
+    if workers > 1:
+        yield from _solve_in_parallel(instances, optimizers, workers, profile, cache)
+        return
+
+    for instance_index, instance in enumerate(instances):
+        for optimizer_index, optimizer in enumerate(optimizers):
+            result = run_optimizer(instance, optimizer, profile, cache)
+            yield BatchResult(instance_index, optimizer_index, result)
+
+
+def _solve_in_parallel(
+    instances: Iterable[Graph],
+    optimizers: Sequence[OptimizationProcedure],
+    workers: int,
+    profile: bool,
+    cache: Optional[SolutionCache],
+) -> Iterator[BatchResult]:
+    jobs = (
+        (instance_index, instance, optimizer_index)
+        for instance_index, instance in enumerate(instances)
+        for optimizer_index in range(len(optimizers))
+    )
+
+    # the shared memory of each instance with submitted jobs and its number of pending jobs
+    shared: dict[int, tuple[SharedGraph, SharedMemory]] = {}
+    pending_jobs: dict[int, int] = {}
+    futures: dict[Future, tuple[int, Graph, int]] = {}
+    # results of the cache, they take the place of a job until they are yielded
+    cached_results: deque[BatchResult] = deque()
+    if profile:
+        cache = None
+
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(list(optimizers), profile),
+    )
+
+    def submit() -> bool:
+        job = next(jobs, None)
+        if job is None:
+            return False
+
+        instance_index, instance, optimizer_index = job
+        if cache is not None:
+            result = cache.get(instance, optimizers[optimizer_index])
+            if result is not None:
+                cached_results.append(
+                    BatchResult(instance_index, optimizer_index, result)
+                )
+                return True
+
+        if instance_index not in shared:
+            shared[instance_index] = SharedGraph.create(instance.compile())
+            pending_jobs[instance_index] = 0
+        pending_jobs[instance_index] += 1
+
+        future = executor.submit(_solve_job, shared[instance_index][0], optimizer_index)
+        futures[future] = (instance_index, instance, optimizer_index)
+        return True
+
+    try:
+        for _ in range(2 * workers):
+            submit()
+
+        while futures or cached_results:
+            if cached_results:
+                batch_result = cached_results.popleft()
+                submit()
+                yield batch_result
+                continue
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                instance_index, instance, optimizer_index = futures.pop(future)
+                result = future.result()
+                if cache is not None:
+                    cache.add(instance, optimizers[optimizer_index], result)
+
+                pending_jobs[instance_index] -= 1
+                if not pending_jobs[instance_index]:
+                    del pending_jobs[instance_index]
+                    release(shared.pop(instance_index)[1])
+
+                submit()
+                yield BatchResult(instance_index, optimizer_index, result)
+    finally:
+        executor.shutdown(wait=not futures, cancel_futures=True)
+        for _, memory in shared.values():
+            release(memory)
+
+
+# State of a worker process, set once by the pool initializer
+_worker_optimizers: list[OptimizationProcedure] = []
+_worker_profile = False
+_worker_graphs: dict[str, tuple[Graph, SharedMemory]] = {}
+
+
+def _initialize_worker(optimizers: list[OptimizationProcedure], profile: bool) -> None:
+    global _worker_optimizers, _worker_profile
+    _worker_optimizers = optimizers
+    _worker_profile = profile
+
+
+def _attach_graph(shared_graph: SharedGraph) -> Graph:
+    """Returns the graph of the shared memory, attached once per worker."""
+    if shared_graph.name not in _worker_graphs:
+        if len(_worker_graphs) >= MAX_ATTACHED_INSTANCES:
+            _detach_graph(next(iter(_worker_graphs)))
+        _worker_graphs[shared_graph.name] = shared_graph.attach()
+    return _worker_graphs[shared_graph.name][0]
+
+
+def _detach_graph(name: str) -> None:
+    graph, memory = _worker_graphs.pop(name)
+    del graph
+    try:
+        memory.close()
+    except BufferError:
+        # a view on the memory is still referenced, the block is unmapped with the view
+        pass
+
+
+def _solve_job(shared_graph: SharedGraph, optimizer_index: int) -> dict:
+    graph = _attach_graph(shared_graph)
+    return run_optimizer(graph, _worker_optimizers[optimizer_index], _worker_profile)
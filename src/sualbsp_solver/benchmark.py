@@ -0,0 +1,295 @@
+import argparse
+import json
+import logging
+import platform
+import random
+import sys
+import tempfile
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+from typing import Callable, Optional, Sequence, TypeVar
+
+from sualbsp_solver import in2_parser
+from sualbsp_solver.config import GraphConfig
+from sualbsp_solver.data_model import TaskList
+from sualbsp_solver.experiment import create_optimizers
+from sualbsp_solver.generator import generate_instance
+from sualbsp_solver.solver import accelerated
+from sualbsp_solver.solver.local_search import improve_solution
+from sualbsp_solver.solver.rule import get_ordering_rules
+from sualbsp_solver.solver.station_oriented import StationOrientedStrategy
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Number of tasks of the synthetic instances of the benchmark suite
+SIZES = (20, 50, 100, 200, 500)
+
+
+def time_call(function: Callable[[], object], repeat: int) -> list[float]:
+    """Returns the runtimes of `repeat` calls of the function."""
+    runtimes = []
+    for _ in range(repeat):
+        start_time = perf_counter()
+        function()
+        runtimes.append(perf_counter() - start_time)
+    return runtimes
+
+
+def benchmark_parsing(config: GraphConfig, repeat: int = 3) -> list[dict]:
+    """Times the parsing of all instances of the graph and variant grid in `config`.
+    Instances that are not in the data directory are skipped."""
+
+    results = []
+    for file_path in config.get_instance_files():
+        if not file_path.exists():
+            logger.warning("Skipping %s, file not found", file_path.name)
+            continue
+
+        graph = in2_parser.parse_graph(file_path)
+        runtimes = time_call(lambda: in2_parser.parse_graph(file_path), repeat)
+        results.append(
+            {
+                "Instance": file_path.name,
+                "Num_Tasks": len(graph.tasks),
+                "Min_Runtime": min(runtimes),
+                "Median_Runtime": median(runtimes),
+            }
+        )
+
+    return results
+
+
+def benchmark_suite(sizes: Sequence[int] = SIZES, repeat: int = 3) -> list[dict]:
+    """Times parse_graph, TaskList.reassemble, improve_solution and every optimizer of
+    create_optimizers() on a generated instance of each size, with a cycle time of 500 and
+    setup times of 0 to 40% of the median processing time.
+
+    The fast operations are timed `repeat` times, improve_solution and the optimizers once.
+    The global random generator is seeded before each call, so every call does the same work.
+    """
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for num_tasks in sizes:
+            graph = generate_instance(
+                num_tasks, order_strength=0.3, setup_variability=0.4, seed=0
+            )
+            file_path = Path(directory) / f"{graph}.IN2"
+            in2_parser.write_graph(graph, file_path)
+
+            # the local search starts from a station oriented solution
+            optimizer = StationOrientedStrategy(get_ordering_rules()[0])
+            solution = _seeded_and_quiet(lambda: optimizer.solve(graph))()
+            sequence = TaskList.from_solution(solution)
+
+            cases: list[tuple[str, Callable[[], object], int]] = [
+                ("parse_graph", lambda: in2_parser.parse_graph(file_path), repeat),
+                ("reassemble", lambda: sequence.reassemble(graph.cycle_time), repeat),
+                (
+                    "improve_solution",
+                    lambda: improve_solution(
+                        solution, graph.cycle_time, rng=random.Random(0)
+                    ),
+                    1,
+                ),
+            ]
+            cases.extend(
+                (optimizer.describe(), partial(optimizer.solve, graph), 1)
+                for optimizer in create_optimizers()
+            )
+
+            logger.info("Benchmarking %s", graph)
+            for name, function, num_calls in cases:
+                runtimes = time_call(_seeded_and_quiet(function), num_calls)
+                results.append(
+                    {
+                        "Benchmark": name,
+                        "Num_Tasks": num_tasks,
+                        "Min_Runtime": min(runtimes),
+                        "Median_Runtime": median(runtimes),
+                    }
+                )
+
+    return results
+
+
+def _seeded_and_quiet(function: Callable[[], T]) -> Callable[[], T]:
+    """Returns a function that seeds the global random generator and calls `function`
+    without logging."""
+
+    def call() -> T:
+        random.seed(0)
+        previous_level = logging.root.manager.disable
+        logging.disable(logging.INFO)
+        try:
+            return function()
+        finally:
+            logging.disable(previous_level)
+
+    return call
+
+
+def write_results(results: list[dict], file_path: Path) -> None:
+    """Writes the results of a benchmark to a JSON file."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with file_path.open("w") as f:
+        json.dump(
+            {
+                "Created": datetime.now().isoformat(timespec="seconds"),
+                "Python": platform.python_version(),
+                "Results": results,
+            },
+            f,
+            indent=2,
+        )
+
+
+def read_results(file_path: Path) -> list[dict]:
+    """Reads the results of a benchmark from a JSON file written by write_results."""
+    with file_path.open() as f:
+        return json.load(f)["Results"]
+
+
+def compare_results(
+    results: list[dict],
+    baseline: list[dict],
+    tolerance: float = 0.25,
+    min_difference: float = 0.001,
+) -> list[dict]:
+    """Adds the baseline runtime and the ratio to it to each result that is in the baseline.
+    Returns the regressions, the results whose minimum runtime exceeds the baseline by more
+    than `tolerance` and by more than `min_difference` seconds, which hides the noise in the
+    runtimes of very fast calls."""
+
+    baseline_runtimes = {
+        (result["Benchmark"], result["Num_Tasks"]): result["Min_Runtime"]
+        for result in baseline
+    }
+
+    regressions = []
+    for result in results:
+        baseline_runtime = baseline_runtimes.get(
+            (result["Benchmark"], result["Num_Tasks"])
+        )
+        if not baseline_runtime:
+            continue
+
+        result["Baseline_Runtime"] = baseline_runtime
+        result["Ratio"] = result["Min_Runtime"] / baseline_runtime
+        if (
+            result["Ratio"] > 1 + tolerance
+            and result["Min_Runtime"] - baseline_runtime > min_difference
+        ):
+            regressions.append(result)
+
+    return regressions
+
+
+def format_results(results: list[dict]) -> str:
+    """Returns the results of a benchmark as a table."""
+    if not results:
+        return "No results"
+
+    fieldnames = list({name: None for result in results for name in result})
+    widths = [
+        max(len(name), *(len(_format(result.get(name, ""))) for result in results))
+        for name in fieldnames
+    ]
+    lines = ["  ".join(name.ljust(width) for name, width in zip(fieldnames, widths))]
+    for result in results:
+        lines.append(
+            "  ".join(
+                _format(result.get(name, "")).ljust(width)
+                for name, width in zip(fieldnames, widths)
+            )
+        )
+    return "\n".join(lines)
+
+
+def format_regression(regression: dict) -> str:
+    """Returns a message of a regression returned by compare_results."""
+    return (
+        f"Regression: {regression['Benchmark']} on {regression['Num_Tasks']} tasks"
+        f" takes {regression['Ratio']:.2f} times the baseline runtime"
+    )
+
+
+def _format(value: object) -> str:
+    return f"{value:.6f}" if isinstance(value, float) else f"{value}"
+
+
+def main(
+    config_file: Path = Path("./src/sualbsp_solver/config/config.json"),
+    graphs_file: Path = Path("./src/graphs/martino_pastor_graphs.txt"),
+) -> list[dict]:
+    """Benchmark the parser on all graphs of the Martino and Pastor (2010) data set,
+    using the data directory and variants of the configuration."""
+    config = GraphConfig.read(str(config_file))
+    config.graphs_file = str(graphs_file)
+    return benchmark_parsing(config)
+
+
+def run_suite(
+    sizes: Sequence[int] = SIZES,
+    repeat: int = 3,
+    output_file: Optional[Path] = None,
+    baseline_file: Optional[Path] = None,
+    tolerance: float = 0.25,
+) -> tuple[list[dict], list[dict]]:
+    """Runs the benchmark suite, writes the results to `output_file` and compares them to the
+    results in `baseline_file`. Returns the results and the regressions."""
+
+    results = benchmark_suite(sizes, repeat)
+
+    regressions = []
+    if baseline_file is not None:
+        regressions = compare_results(results, read_results(baseline_file), tolerance)
+
+    if output_file is not None:
+        write_results(results, output_file)
+    return results, regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks of the SUALBSP solver")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parsing_parser = subparsers.add_parser(
+        "parsing", help="time the parser on the Martino and Pastor (2010) data set"
+    )
+    parsing_parser.add_argument("config_file", type=Path, nargs="?")
+    parsing_parser.add_argument("graphs_file", type=Path, nargs="?")
+
+    suite_parser = subparsers.add_parser(
+        "suite", help="time the solver on synthetic instances"
+    )
+    suite_parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    suite_parser.add_argument("--repeat", type=int, default=3)
+    suite_parser.add_argument("--output", type=Path)
+    suite_parser.add_argument("--baseline", type=Path)
+    suite_parser.add_argument("--tolerance", type=float, default=0.25)
+    suite_parser.add_argument(
+        "--backend", choices=accelerated.BACKENDS, default="python"
+    )
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    args = parser.parse_args()
+    if args.command == "parsing":
+        paths = (path for path in (args.config_file, args.graphs_file) if path)
+        print(format_results(main(*paths)))
+    else:
+        accelerated.set_backend(args.backend)
+        results, regressions = run_suite(
+            args.sizes, args.repeat, args.output, args.baseline, args.tolerance
+        )
+        print(format_results(results))
+        for regression in regressions:
+            print(f">>> {format_regression(regression)}")
+        if regressions:
+            sys.exit(1)
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import json
+import logging
 from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -17,3 +21,25 @@ class GraphConfig:
         with open(config_file, "r") as file:
             data = json.load(file)
             return GraphConfig(**data)
+
+    def get_instance_files(self) -> list[Path]:
+        """Returns the files of up to 10 instances of all possible combinations of graph and variant"""
+        num_instances = self.num_instances
+        assert (
+            1 <= num_instances <= 10
+        ), f"The maximum number of instances per Graph and variation is 10, got {num_instances}."
+
+        with open(self.graphs_file, encoding="utf8") as f:
+            graphs = [line.rstrip() for line in f.readlines()]
+            logger.info("Using graphs from %s: %s", self.graphs_file, graphs)
+
+        with open(self.variants_file, encoding="utf8") as f:
+            variants = [line.rstrip() for line in f.readlines()]
+            logger.info("Using variants: %s", variants)
+
+        return [
+            Path(self.data_dir) / f"{graph}_{variant}_EJ{ident}.txt"
+            for graph in graphs
+            for variant in variants
+            for ident in range(1, num_instances + 1)
+        ]
@@ -1,3 +1,4 @@
+from .compiled_graph import CompiledGraph
 from .graph import Graph
 from .station import Station
 from .task import Task
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import hashlib
+from array import array
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Iterable, Literal
+
+from sualbsp_solver.data_model.task import Task
+
+if TYPE_CHECKING:
+    from sualbsp_solver.data_model.graph import Graph
+
+TYPECODE: Literal["i"] = "i"
+
+
+def read_only(values: Iterable[int] | bytes) -> memoryview:
+    """Returns a read-only integer view on `values`."""
+    if isinstance(values, bytes):
+        return memoryview(values).cast(TYPECODE)
+    return memoryview(array(TYPECODE, values)).toreadonly()
+
+
+def to_csr(adjacency: list[list[int]]) -> tuple[memoryview, memoryview]:
+    """Returns the offsets and indices of the compressed sparse row form of `adjacency`."""
+    offsets = [0]
+    for neighbours in adjacency:
+        offsets.append(offsets[-1] + len(neighbours))
+    indices = [neighbour for neighbours in adjacency for neighbour in neighbours]
+    return read_only(offsets), read_only(indices)
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledGraph:
+    """Immutable, array-backed form of a Graph that the solvers can share without copying.
+
+    Task i is identified by its index. The setup times are stored as a contiguous n x n matrix
+    in row-major order, the direct precedence relations as compressed sparse rows in both
+    directions.
+    """
+
+    name: str
+    cycle_time: int
+    processing_times: memoryview
+    setup_times: memoryview
+    predecessor_offsets: memoryview
+    predecessors: memoryview
+    successor_offsets: memoryview
+    successors: memoryview
+
+    def __str__(self) -> str:
+        return f"{self.name}"
+
+    def __reduce__(self):
+        """Pickle the arrays as bytes, memoryviews can not be pickled directly."""
+        buffers = (
+            self.processing_times,
+            self.setup_times,
+            self.predecessor_offsets,
+            self.predecessors,
+            self.successor_offsets,
+            self.successors,
+        )
+        return _from_bytes, (
+            self.name,
+            self.cycle_time,
+            *(buffer.tobytes() for buffer in buffers),
+        )
+
+    @property
+    def num_tasks(self) -> int:
+        """Returns the number of tasks."""
+        return len(self.processing_times)
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the number of bytes used by the arrays."""
+        return sum(
+            buffer.nbytes
+            for buffer in (
+                self.processing_times,
+                self.setup_times,
+                self.predecessor_offsets,
+                self.predecessors,
+                self.successor_offsets,
+                self.successors,
+            )
+        )
+
+    def setup_time(self, from_task: int, to_task: int) -> int:
+        """Returns the setup time from task `from_task` to task `to_task`."""
+        return self.setup_times[from_task * self.num_tasks + to_task]
+
+    def setup_row(self, task: int) -> memoryview:
+        """Returns the setup times from `task` to all other tasks."""
+        num_tasks = self.num_tasks
+        return self.setup_times[task * num_tasks : (task + 1) * num_tasks]
+
+    def predecessors_of(self, task: int) -> memoryview:
+        """Returns the direct predecessors of `task`."""
+        offsets = self.predecessor_offsets
+        return self.predecessors[offsets[task] : offsets[task + 1]]
+
+    def successors_of(self, task: int) -> memoryview:
+        """Returns the direct successors of `task`."""
+        offsets = self.successor_offsets
+        return self.successors[offsets[task] : offsets[task + 1]]
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Returns the SHA-256 hash of the cycle time and the arrays. Instances with the same
+        data have the same fingerprint, independent of their name."""
+        digest = hashlib.sha256(str(self.cycle_time).encode())
+        for buffer in (
+            self.processing_times,
+            self.setup_times,
+            self.predecessor_offsets,
+            self.predecessors,
+            self.successor_offsets,
+            self.successors,
+        ):
+            digest.update(len(buffer).to_bytes(8, "little"))
+            digest.update(buffer)
+        return digest.hexdigest()
+
+    @cached_property
+    def mean_setup_times(self) -> tuple[float, ...]:
+        """Returns for each task the mean of its setup times to all tasks, including itself."""
+        num_tasks = self.num_tasks
+        return tuple(
+            sum(self.setup_times[task * num_tasks : (task + 1) * num_tasks]) / num_tasks
+            for task in range(num_tasks)
+        )
+
+    @cached_property
+    def predecessor_masks(self) -> tuple[int, ...]:
+        """Returns for each task a bitset of its direct predecessors, bit i is set for task i."""
+        masks = []
+        for task in range(self.num_tasks):
+            mask = 0
+            for predecessor in self.predecessors_of(task):
+                mask |= 1 << predecessor
+            masks.append(mask)
+        return tuple(masks)
+
+    @cached_property
+    def closure_masks(self) -> tuple[int, ...]:
+        """Returns for each task a bitset of all its direct and indirect predecessors."""
+        masks = list(self.predecessor_masks)
+        remaining = [len(self.predecessors_of(task)) for task in range(self.num_tasks)]
+        available = [task for task in range(self.num_tasks) if not remaining[task]]
+
+        # propagate the masks in topological order
+        while available:
+            task = available.pop()
+            for successor in self.successors_of(task):
+                masks[successor] |= masks[task]
+                remaining[successor] -= 1
+                if not remaining[successor]:
+                    available.append(successor)
+
+        if any(remaining):
+            raise ValueError(f"The precedence relations of {self} contain a cycle.")
+        return tuple(masks)
+
+    def is_predecessor(self, task: int, other: int, transitive: bool = False) -> bool:
+        """Returns True if `task` is a direct predecessor of `other`, or any predecessor of
+        `other` if `transitive` is True."""
+        masks = self.closure_masks if transitive else self.predecessor_masks
+        return bool(masks[other] >> task & 1)
+
+    def create_tasks(self) -> list[Task]:
+        """Returns new Task objects with their own list of predecessors. The setup times
+        of the tasks are rows of the shared setup matrix and are not copied."""
+        return [
+            Task(
+                task,
+                self.processing_times[task],
+                list(self.predecessors_of(task)),
+                self.setup_row(task),
+            )
+            for task in range(self.num_tasks)
+        ]
+
+    @staticmethod
+    def from_graph(graph: Graph) -> CompiledGraph:
+        """Returns the compiled form of `graph`."""
+
+        num_tasks = len(graph.tasks)
+        processing_times = [0] * num_tasks
+        setup_rows: list = [[]] * num_tasks
+        predecessors: list[list[int]] = [[] for _ in range(num_tasks)]
+        successors: list[list[int]] = [[] for _ in range(num_tasks)]
+
+        for task in graph.tasks:
+            processing_times[task.id] = task.processing_time
+            setup_rows[task.id] = task.setup_times
+            for predecessor in task.predecessors:
+                predecessors[task.id].append(predecessor)
+                successors[predecessor].append(task.id)
+
+        setup_times = array(TYPECODE)
+        for row in setup_rows:
+            if len(row) != num_tasks:
+                raise ValueError(
+                    f"Expected {num_tasks} setup times per task in {graph}, got {len(row)}."
+                )
+            setup_times.extend(row)
+
+        return CompiledGraph(
+            graph.name,
+            graph.cycle_time,
+            read_only(processing_times),
+            memoryview(setup_times).toreadonly(),
+            *to_csr(predecessors),
+            *to_csr(successors),
+        )
+
+
+def _from_bytes(name: str, cycle_time: int, *buffers: bytes) -> CompiledGraph:
+    """Recreates a CompiledGraph from its pickled state."""
+    return CompiledGraph(name, cycle_time, *(read_only(buffer) for buffer in buffers))
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Generator, List
+from pathlib import Path
+from typing import Iterator, List, Optional
 
 from sualbsp_solver.config import GraphConfig
+from sualbsp_solver.data_model.compiled_graph import CompiledGraph
 from sualbsp_solver.data_model.task import Task
 
 
@@ -11,14 +13,34 @@ class Graph:
         self.tasks = tasks
         self.cycle_time = cycle_time
         self.name = name
+        self._compiled: Optional[CompiledGraph] = None
 
     def __str__(self) -> str:
         return f"{self.name}"
 
+    def __reduce__(self):
+        """Pickle the compact compiled form instead of the tasks."""
+        return Graph.from_compiled, (self.compile(),)
+
+    @staticmethod
+    def from_compiled(compiled: CompiledGraph) -> Graph:
+        """Returns a graph whose tasks read their setup times from the compiled graph."""
+        graph = Graph(compiled.create_tasks(), compiled.cycle_time, compiled.name)
+        graph._compiled = compiled
+        return graph
+
+    def compile(self) -> CompiledGraph:
+        """Returns the immutable compiled form of the graph. It is created on first use,
+        the tasks of the graph must not be modified afterwards."""
+        if self._compiled is None:
+            self._compiled = CompiledGraph.from_graph(self)
+        return self._compiled
+
     @staticmethod
     def parse_instance(filepath: str) -> Graph:
         """Import-function for the data set of Martino and Pastor (2010)
         The data is available at https://www.assembly-line-balancing.de/sualbsp
+        The name of the graph is the name of the file without suffix.
 
         line 1:                     n; number of tasks
         line 2:                     p; number of direct precedence relations
@@ -28,58 +50,24 @@ class Graph:
         lines 4+n+p to 4+2n+p-1:    tsu; setup times
         """
 
-        with open(filepath, "r") as file:
-
-            # read first three lines
-            num_tasks = int(file.readline())
-            num_relations = int(file.readline())
-            cycle_time = int(file.readline())
-
-            # Create Tasks with id and processing times
-            tasks: List[Task] = []
-            for _ in range(num_tasks):
-                task_id, processing_time = file.readline().split(",")
-                tasks.append(Task(int(task_id), int(processing_time)))
-
-            # Add the ids of the predecessor to each Task
-            for _ in range(num_relations):
-                predecessor_id, successor_id = file.readline().split(",")
-                tasks[int(successor_id)].predecessors.append(int(predecessor_id))
+        # imported here, the parser depends on this module
+        from sualbsp_solver.in2_parser import parse_graph
 
-            # Add the setup times from one Task to all other Tasks
-            for i in range(num_tasks):
-                setup_times_i = file.readline().split(",")
-                tasks[i].setup_times = list(map(int, setup_times_i))
-
-        print(f"*Import of {filepath} successful!*")
-
-        name = filepath.split("/")[-1][:-4]
-
-        return Graph(tasks, cycle_time, name)
+        path = Path(filepath)
+        return parse_graph(path, name=path.stem)
 
     @staticmethod
-    def from_IN2(config: GraphConfig) -> Generator[Graph, None, None]:
+    def from_IN2(config: GraphConfig) -> Iterator[Graph]:
         """
-        Creates up to 10 instances of all possible combinations of graph and variant
+        Creates up to 10 instances of all possible combinations of graph and variant.
+        The instances are parsed lazily, the next ones in a background thread.
         """
-        num_instances = config.num_instances
-        assert (
-            1 <= num_instances <= 10
-        ), f"The maximum number of instances per Graph and variation is 10, got {num_instances}."
-
-        with open(config.graphs_file, encoding="utf8") as f:
-            graphs = [line.rstrip() for line in f.readlines()]
-            print(f"Using graphs from {config.graphs_file}: {graphs}")
-
-        with open(config.variants_file, encoding="utf8") as f:
-            variants = [line.rstrip() for line in f.readlines()]
-            print(f"Using variants: {variants}\n")
+        # imported here, the loader depends on this module
+        from sualbsp_solver.loader import prefetch
 
-        instances = (
-            Graph.parse_instance(f"{config.data_dir}/{graph}_{variant}_EJ{ident}.txt")
-            for graph in graphs
-            for variant in variants
-            for ident in range(1, num_instances + 1)
+        instances = prefetch(
+            Graph.parse_instance(str(file_path))
+            for file_path in config.get_instance_files()
         )
 
         return instances
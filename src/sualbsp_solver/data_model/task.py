@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 
@@ -8,7 +9,7 @@ class Task:
     id: int
     processing_time: int = field(compare=False)
     predecessors: list[int] = field(default_factory=list, repr=False, compare=False)
-    setup_times: list[int] = field(default_factory=list, repr=False, compare=False)
+    setup_times: Sequence[int] = field(default_factory=list, repr=False, compare=False)
 
     def is_predecessor_of(self, other: Task) -> bool:
         """Returns True if `self` is a predecessor of `other`."""
@@ -17,9 +18,7 @@ class Task:
     def remove_predecessor(self, other: Task) -> None:
         """Remove a task from the list of predecessors.
 
-        TODO: instead of deleting predecessors, we could
-        keep track of tasks that are are already in a solution.
-        Then no copy of task lists would be necessary.
+        The solvers do not modify tasks, see `solver.construction.ConstructionState`.
         """
         self.predecessors.remove(other.id)
 
@@ -4,6 +4,7 @@ from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import overload
 
+from sualbsp_solver import profiling
 from sualbsp_solver.data_model.station import Station
 from sualbsp_solver.data_model.task import Task
 
@@ -35,20 +36,49 @@ class TaskList(Sequence):
         """Reassemble the list of tasks into a list of stations according to the following strategy:
         Assign the tasks in the list one by one, starting at index 0,  to a station as long as the
         station does not exceed the cycle time. Once it does, open a new station and continue assigning."""
+        profiling.count("reassemblies")
 
-        solution: list[Station] = [Station(cycle_time)]
-        current_station = solution[-1]
+        station_starts, station_times = self.assign_stations(cycle_time)
+        station_ends = station_starts[1:] + [len(self._tasks)]
 
-        for task in self._tasks:
-            if current_station.can_fit(task):
-                current_station.add_task(task)
-            else:
-                solution.append(Station(cycle_time))
-                current_station = solution[-1]
-                current_station.add_task(task)
+        solution: list[Station] = []
+        for start, end, station_time in zip(
+            station_starts, station_ends, station_times
+        ):
+            station = Station(cycle_time)
+            station.task_list = self._tasks[start:end]
+            station.station_time = station_time
+            solution.append(station)
 
         return solution
 
+    def assign_stations(self, cycle_time: int) -> tuple[list[int], list[int]]:
+        """Returns the position of the first task and the station time of each station that
+        `reassemble` creates, without creating the stations. An empty list has one empty station.
+        """
+        station_starts = [0]
+        station_times: list[int] = []
+
+        tasks = self._tasks
+        if not tasks:
+            return station_starts, [0]
+
+        previous = tasks[0]
+        station_time = previous.processing_time
+        for position in range(1, len(tasks)):
+            task = tasks[position]
+            additional_time = previous.setup_times[task.id] + task.processing_time
+            if station_time + additional_time <= cycle_time:
+                station_time += additional_time
+            else:
+                station_starts.append(position)
+                station_times.append(station_time)
+                station_time = task.processing_time
+            previous = task
+
+        station_times.append(station_time)
+        return station_starts, station_times
+
     def swap_tasks(self, pos1: int, pos2: int) -> TaskList:
         """Returns a new TaskList with the position of two tasks swapped"""
         new_sequence = self._tasks.copy()
@@ -1,8 +1,13 @@
+from contextlib import nullcontext
 from pathlib import Path
 from time import perf_counter
+from typing import Optional
 
-from sualbsp_solver import in2_parser
+from sualbsp_solver import instance_cache, profiling
+from sualbsp_solver.data_model import Graph
+from sualbsp_solver.solution_cache import SolutionCache
 from sualbsp_solver.solver.grasp import GRASP
+from sualbsp_solver.solver.lower_bound import lower_bound
 from sualbsp_solver.solver.optimizer import OptimizationProcedure
 from sualbsp_solver.solver.rule import get_ordering_rules
 from sualbsp_solver.solver.station_oriented import StationOrientedStrategy
@@ -24,40 +29,78 @@ def create_optimizers() -> list[OptimizationProcedure]:
     return optimizers
 
 
+def run_optimizer(
+    graph: Graph,
+    optimizer: OptimizationProcedure,
+    profile: bool = False,
+    cache: Optional[SolutionCache] = None,
+) -> dict:
+    """Solves the graph with the optimizer and returns the result of the run, including the
+    ids of the tasks of each station as "Stations". If `profile` is True, the counters and
+    timers of the run are added as "Profile".
+
+    If a cache is given, the cached result of a deterministic run is returned instead of
+    solving the graph, and the result of a new run is cached. Profiled runs are always
+    solved and not cached."""
+
+    if cache is not None and not profile:
+        cached_result = cache.get(graph, optimizer)
+        if cached_result is not None:
+            return cached_result
+
+    with profiling.profiling() if profile else nullcontext() as run_profile:
+        optimizer_start_time = perf_counter()
+
+        # Solve the instance using the optimizer
+        stations = optimizer.solve(graph)
+        runtime = perf_counter() - optimizer_start_time
+
+    result = {
+        "Instance": f"{graph}",
+        "Strategy": f"{optimizer}",
+        "Num_Stations": len(stations),
+        "Lower_Bound": lower_bound(graph.compile()),
+        "Runtime": runtime,
+        "Stations": [[task.id for task in station] for station in stations],
+    }
+    if run_profile is not None:
+        result["Profile"] = {
+            "Configuration": optimizer.describe(),
+            **run_profile.as_dict(),
+        }
+    elif cache is not None:
+        cache.add(graph, optimizer, result)
+    return result
+
+
+def add_relative_deviations(solutions: list[dict]) -> None:
+    """Add the best solution and the Average Relative Deviation to each solution of an instance."""
+    best_solution = min(solution["Num_Stations"] for solution in solutions)
+    for solution in solutions:
+        solution["Min_Stations"] = best_solution
+        solution["ARD"] = Experiment.compute_ARD(
+            solution["Num_Stations"], solution["Min_Stations"]
+        )
+
+
 class Experiment:
     """Model an experiment that takes a Graph instance and an optimizer to solve that instance"""
 
-    def __init__(self, file_path: Path) -> None:
-        self.graph = in2_parser.parse_graph(file_path)
+    def __init__(self, file_path: Path, cache: Optional[SolutionCache] = None) -> None:
+        self.graph = instance_cache.load_graph(file_path)
         self.optimizers = create_optimizers()
+        self.cache = cache
         self.solutions: list[dict] = []
 
     def run(self) -> list[dict]:
         self.start_time = perf_counter()
         for optimizer in self.optimizers:
-
-            optimizer_start_time = perf_counter()
-
-            # Solve the instance using the optimizer
-            stations = optimizer.solve(self.graph)
-
             self.solutions.append(
-                {
-                    "Instance": f"{self.graph}",
-                    "Strategy": f"{optimizer}",
-                    "Num_Stations": len(stations),
-                    "Runtime": perf_counter() - optimizer_start_time
-                    # TODO: Add the Sequence for export
-                }
+                run_optimizer(self.graph, optimizer, cache=self.cache)
             )
 
         # Add best solution and compute Average Relative Deviation to each solution
-        best_solution = self.best_solution()
-        for solution in self.solutions:
-            solution["Min_Stations"] = best_solution
-            solution["ARD"] = self.compute_ARD(
-                solution["Num_Stations"], solution["Min_Stations"]
-            )
+        add_relative_deviations(self.solutions)
 
         return self.solutions
 
@@ -1,7 +1,11 @@
 import csv
+import json
+import logging
 from pathlib import Path
 from typing import Dict, List
 
+logger = logging.getLogger(__name__)
+
 
 def write_csv(filepath: Path, solutions: list[dict]) -> None:
     """Exports solutions to csv."""
@@ -13,10 +17,11 @@ def write_csv(filepath: Path, solutions: list[dict]) -> None:
             "Strategy",
             "Num_Stations",
             "Min_Stations",
+            "Lower_Bound",
             "ARD",
             "Runtime",
         ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction="ignore")
         writer.writeheader()
 
         for solution in solutions:
@@ -35,9 +40,26 @@ class Exporter:
     ) -> None:
         """Export the results of solving an instance to a separate csv-file."""
 
-        print(f"Writing results to {destination}")
+        logger.info("Writing results to %s", destination)
 
         # Set result dir and create it, if it does not exist
         destination.parent.mkdir(parents=True, exist_ok=True)
 
         write_csv(destination, instance_solutions)
+
+    @staticmethod
+    def export_profiles(instance_solutions: list[dict], destination: Path) -> None:
+        """Export the profiles of the runs on an instance to a json-file. Runs without a
+        profile are left out."""
+
+        logger.info("Writing profiles to %s", destination)
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+
+        profiles = [
+            {"Instance": solution["Instance"], **solution["Profile"]}
+            for solution in instance_solutions
+            if "Profile" in solution
+        ]
+        with destination.open("w") as f:
+            json.dump(profiles, f, indent=2)
@@ -0,0 +1,228 @@
+import argparse
+import logging
+import random
+from array import array
+from math import ceil
+from pathlib import Path
+from statistics import median_low
+from typing import Optional, Sequence
+
+from sualbsp_solver import in2_parser
+from sualbsp_solver.data_model import CompiledGraph, Graph
+from sualbsp_solver.data_model.compiled_graph import TYPECODE, read_only, to_csr
+
+logger = logging.getLogger(__name__)
+
+# Failed attempts to add a predecessor to a task before its precedence relations are final
+MAX_ATTEMPTS = 10
+
+
+def generate_instance(
+    num_tasks: int,
+    order_strength: float = 0.5,
+    cycle_time_tightness: float = 0.2,
+    setup_variability: float = 0.25,
+    seed: int = 0,
+    processing_times: tuple[int, int] = (1, 100),
+    setup_reference: str = "median",
+    name: Optional[str] = None,
+) -> Graph:
+    """Generates a random instance. The same arguments always generate the same instance.
+
+    Parameters:
+        order_strength:         share of the task pairs that are ordered by the transitive
+                                precedence relations, between 0 and 1
+        cycle_time_tightness:   maximum processing time divided by the cycle time, between
+                                0 and 1, higher values lead to fewer tasks per station
+        setup_variability:      setup times are drawn from 0 to setup_variability times the
+                                minimum or median processing time, see `setup_reference`,
+                                like the TS0.25 and TS0.75(-med) variants of the data set
+        processing_times:       range of the processing times
+    """
+
+    if not 0 <= order_strength <= 1:
+        raise ValueError(f"The order strength must be in [0, 1], got {order_strength}.")
+    if not 0 < cycle_time_tightness <= 1:
+        raise ValueError(
+            f"The cycle time tightness must be in (0, 1], got {cycle_time_tightness}."
+        )
+    if setup_variability < 0:
+        raise ValueError(
+            f"The setup variability must not be negative, got {setup_variability}."
+        )
+    if setup_reference not in ("min", "median"):
+        raise ValueError(
+            f"The setup reference must be 'min' or 'median', got {setup_reference}."
+        )
+
+    rng = random.Random(seed)
+
+    min_time, max_time = processing_times
+    task_times = [rng.randint(min_time, max_time) for _ in range(num_tasks)]
+    cycle_time = ceil(max(task_times, default=max_time) / cycle_time_tightness)
+
+    predecessors = generate_precedence_relations(num_tasks, order_strength, rng)
+    successors: list[list[int]] = [[] for _ in range(num_tasks)]
+    for task, task_predecessors in enumerate(predecessors):
+        for predecessor in task_predecessors:
+            successors[predecessor].append(task)
+
+    reference = min(task_times) if setup_reference == "min" else median_low(task_times)
+    setup_times = generate_setup_times(
+        num_tasks, int(setup_variability * reference), rng
+    )
+
+    compiled = CompiledGraph(
+        name if name is not None else f"SYN{num_tasks}",
+        cycle_time,
+        read_only(task_times),
+        memoryview(setup_times).toreadonly(),
+        *to_csr(predecessors),
+        *to_csr(successors),
+    )
+    return Graph.from_compiled(compiled)
+
+
+def generate_precedence_relations(
+    num_tasks: int, order_strength: float, rng: random.Random
+) -> list[list[int]]:
+    """Returns the direct predecessors of each task. Tasks only succeed tasks with a lower id.
+
+    The tasks are processed in order of their id and each task gets random predecessors
+    until about `order_strength` of the tasks in front of it are its direct or indirect
+    predecessors. A predecessor that would exceed that share is skipped. Direct predecessors
+    that become indirect predecessors are removed."""
+
+    ancestors = [0] * num_tasks
+    predecessors: list[list[int]] = [[] for _ in range(num_tasks)]
+
+    for task in range(1, num_tasks):
+        # round randomly, so that the expected share matches the order strength
+        target = int(order_strength * task + rng.random())
+
+        mask, num_ancestors, attempts = 0, 0, 0
+        while num_ancestors < target and attempts < MAX_ATTEMPTS:
+            candidate = rng.randrange(task)
+            candidate_mask = ancestors[candidate] | 1 << candidate
+            new_mask = mask | candidate_mask
+            if new_mask == mask or new_mask.bit_count() > target:
+                attempts += 1
+                continue
+
+            predecessors[task] = [
+                predecessor
+                for predecessor in predecessors[task]
+                if not ancestors[candidate] >> predecessor & 1
+            ]
+            predecessors[task].append(candidate)
+            mask, num_ancestors = new_mask, new_mask.bit_count()
+
+        ancestors[task] = mask
+        predecessors[task].sort()
+
+    return predecessors
+
+
+def generate_setup_times(num_tasks: int, max_setup: int, rng: random.Random) -> array:
+    """Returns a row-major matrix of random setup times from 0 to `max_setup`, with zeros on
+    the diagonal.
+
+    For setup times below 256, each row is drawn as random bytes that are mapped to the
+    setup times by a lookup table, so the work per row stays in C. The mapping is uniform up
+    to a bias of less than (max_setup + 1) / 256 per value."""
+
+    setup_times = array(TYPECODE)
+    if max_setup < 256:
+        table = bytes(value * (max_setup + 1) // 256 for value in range(256))
+        for task in range(num_tasks):
+            row = bytearray(rng.randbytes(num_tasks).translate(table))
+            row[task] = 0
+            setup_times.extend(row)
+    else:
+        uniform = rng.random
+        for task in range(num_tasks):
+            values = [int(uniform() * (max_setup + 1)) for _ in range(num_tasks)]
+            values[task] = 0
+            setup_times.extend(values)
+    return setup_times
+
+
+def order_strength(compiled: CompiledGraph) -> float:
+    """Returns the share of the task pairs that are ordered by the precedence relations."""
+    num_tasks = compiled.num_tasks
+    if num_tasks < 2:
+        return 0.0
+    num_pairs = sum(mask.bit_count() for mask in compiled.closure_masks)
+    return num_pairs / (num_tasks * (num_tasks - 1) / 2)
+
+
+def write_instances(
+    directory: Path,
+    sizes: Sequence[int],
+    num_instances: int = 1,
+    order_strength: float = 0.5,
+    cycle_time_tightness: float = 0.2,
+    setup_variability: float = 0.25,
+    setup_reference: str = "median",
+    seed: int = 0,
+) -> list[Path]:
+    """Generates `num_instances` instances per size and writes them in the IN2-format.
+
+    The files are named like the files of the data set, {graph}_{variant}_EJ{number}.txt,
+    so they can be selected with a graphs file and a variants file. Instance number k of a
+    size is generated with the seed `seed` + k - 1."""
+
+    variant = f"TS{setup_variability:g}"
+    if setup_reference == "median":
+        variant += "-med"
+
+    directory.mkdir(parents=True, exist_ok=True)
+    file_paths = []
+    for num_tasks in sizes:
+        graph_name = f"SYN{num_tasks}-OS{order_strength:g}-CT{cycle_time_tightness:g}"
+        for number in range(1, num_instances + 1):
+            file_path = directory / f"{graph_name}_{variant}_EJ{number}.txt"
+            graph = generate_instance(
+                num_tasks,
+                order_strength,
+                cycle_time_tightness,
+                setup_variability,
+                seed + number - 1,
+                setup_reference=setup_reference,
+                name=file_path.stem,
+            )
+            in2_parser.write_graph(graph, file_path)
+            logger.info("Generated %s", file_path.name)
+            file_paths.append(file_path)
+
+    return file_paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate random SUALBSP instances in the IN2-format"
+    )
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500])
+    parser.add_argument("--num-instances", type=int, default=1)
+    parser.add_argument("--order-strength", type=float, default=0.5)
+    parser.add_argument("--cycle-time-tightness", type=float, default=0.2)
+    parser.add_argument("--setup-variability", type=float, default=0.25)
+    parser.add_argument(
+        "--setup-reference", choices=["min", "median"], default="median"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    args = parser.parse_args()
+    write_instances(
+        args.directory,
+        args.sizes,
+        args.num_instances,
+        args.order_strength,
+        args.cycle_time_tightness,
+        args.setup_variability,
+        args.setup_reference,
+        args.seed,
+    )
@@ -1,8 +1,19 @@
+import json
+import logging
 import sys
+from array import array
 from pathlib import Path
+from typing import Optional
 
+from sualbsp_solver.data_model.compiled_graph import (
+    TYPECODE,
+    CompiledGraph,
+    read_only,
+    to_csr,
+)
 from sualbsp_solver.data_model.graph import Graph
-from sualbsp_solver.data_model.task import Task
+
+logger = logging.getLogger(__name__)
 
 
 class ParseError(ValueError):
@@ -11,8 +22,9 @@ class ParseError(ValueError):
     pass
 
 
-def parse_graph(filepath: Path) -> Graph:
-    """Parses a file in the IN2-format into a Graph object.
+def parse_graph(filepath: Path, name: Optional[str] = None) -> Graph:
+    """Parses a file in the IN2-format into a Graph object. The name of the graph defaults to
+    the name of the file.
 
     IN2-format:
         line 1:                     n: number of tasks
@@ -21,42 +33,112 @@ def parse_graph(filepath: Path) -> Graph:
         lines 4 to 4+n-1:           cl, t: task id (starts with 0), processing time
         lines 4+n to 4+n+p-1:       relations: direct precedence relations in form i,j
         lines 4+n+p to 4+2n+p-1:    tsu: setup times
+
+    Each block is converted in one bulk operation: its lines are joined and split into
+    integers at once, the setup times directly into the contiguous matrix of a CompiledGraph.
     """
+    with open(filepath) as f:
+        text = f.read()
+
+    graph = parse_text(text, name if name is not None else filepath.name)
+    logger.info("Import of %s successful", filepath.name)
+    return graph
+
+
+def parse_text(text: str, name: str) -> Graph:
+    """Parses an instance in the IN2-format, see parse_graph, into a Graph with the name."""
     try:
-        with open(filepath) as f:
+        lines = text.splitlines()
+
+        # Read meta information
+        num_tasks = int(lines[0])
+        num_relations = int(lines[1])
+        cycle_time = int(lines[2])
 
-            # Read meta information
-            num_tasks = int(f.readline())
-            num_relations = int(f.readline())
-            cycle_time = int(f.readline())
+        task_block = lines[3 : 3 + num_tasks]
+        relation_block = lines[3 + num_tasks : 3 + num_tasks + num_relations]
+        setup_block = lines[
+            3 + num_tasks + num_relations : 3 + 2 * num_tasks + num_relations
+        ]
 
-            # Create Tasks with id and processing times
-            tasks: list[Task] = []
-            for _ in range(num_tasks):
-                task_id, processing_time = f.readline().split(",")
-                tasks.append(Task(int(task_id), int(processing_time)))
+        # Processing times of the tasks by id
+        task_values = parse_block(task_block, 2 * num_tasks)
+        processing_times = [0] * num_tasks
+        for task_id, processing_time in zip(task_values[::2], task_values[1::2]):
+            processing_times[task_id] = processing_time
 
-            # Add the ids of the predecessor to each Task
-            for _ in range(num_relations):
-                predecessor_id, successor_id = f.readline().split(",")
-                tasks[int(successor_id)].predecessors.append(int(predecessor_id))
+        # Direct precedence relations in both directions
+        relation_values = parse_block(relation_block, 2 * num_relations)
+        predecessors: list[list[int]] = [[] for _ in range(num_tasks)]
+        successors: list[list[int]] = [[] for _ in range(num_tasks)]
+        for predecessor_id, successor_id in zip(
+            relation_values[::2], relation_values[1::2]
+        ):
+            predecessors[successor_id].append(predecessor_id)
+            successors[predecessor_id].append(successor_id)
 
-            # Add the setup times from one Task to all other Tasks
-            for i in range(num_tasks):
-                setup_times_i = f.readline().split(",")
-                tasks[i].setup_times = list(map(int, setup_times_i))
+        # Setup times from each Task to all other Tasks
+        setup_times = parse_block(setup_block, num_tasks * num_tasks)
 
-            name = filepath.name
+        compiled = CompiledGraph(
+            name,
+            cycle_time,
+            read_only(processing_times),
+            memoryview(setup_times).toreadonly(),
+            *to_csr(predecessors),
+            *to_csr(successors),
+        )
 
-        print(f">>> Import of {name} successful!")
-        return Graph(tasks, cycle_time, name)
+        return Graph.from_compiled(compiled)
 
-    except FileNotFoundError as e:
-        raise e
-    except ValueError:
+    except (ValueError, IndexError):
         tb = sys.exc_info()[2]
         raise ParseError(
-            f"Error while parsing file {filepath}. Is the data in a valid IN2-format?"
+            f"Error while parsing {name}. Is the data in a valid IN2-format?"
         ).with_traceback(tb)
-    except Exception as ex:
-        raise ex
+
+
+def write_graph(graph: Graph, filepath: Path) -> None:
+    """Writes a Graph to a file in the IN2-format, as read by parse_graph."""
+    compiled = graph.compile()
+    num_tasks = compiled.num_tasks
+
+    lines = [
+        f"{num_tasks}",
+        f"{len(compiled.predecessors)}",
+        f"{compiled.cycle_time}",
+    ]
+    lines.extend(
+        f"{task},{processing_time}"
+        for task, processing_time in enumerate(compiled.processing_times)
+    )
+    lines.extend(
+        f"{predecessor},{task}"
+        for task in range(num_tasks)
+        for predecessor in compiled.predecessors_of(task)
+    )
+    lines.extend(
+        ",".join(map(str, compiled.setup_row(task))) for task in range(num_tasks)
+    )
+
+    with open(filepath, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def parse_block(lines: list[str], num_values: int) -> array:
+    """Parses lines of comma-separated integers into a single array.
+    Raises ValueError if the block does not contain `num_values` integers."""
+    if not num_values:
+        return array(TYPECODE)
+
+    block = ",".join(lines)
+    try:
+        # the JSON decoder converts the whole block in a single pass
+        values = array(TYPECODE, json.loads(f"[{block}]"))
+    except (ValueError, TypeError):
+        # not valid JSON, e.g. because of leading zeros
+        values = array(TYPECODE, list(map(int, block.split(","))))
+
+    if len(values) != num_values:
+        raise ValueError(f"Expected {num_values} values, got {len(values)}.")
+    return values
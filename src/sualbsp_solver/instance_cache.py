@@ -0,0 +1,154 @@
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Optional
+
+from sualbsp_solver import in2_parser
+from sualbsp_solver.data_model import CompiledGraph, Graph
+from sualbsp_solver.data_model.compiled_graph import TYPECODE
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SUALBSP\0"
+VERSION = 1
+HEADER = struct.Struct("<8s4q7q")
+ARRAY_FIELDS = (
+    "processing_times",
+    "setup_times",
+    "predecessor_offsets",
+    "predecessors",
+    "successor_offsets",
+    "successors",
+)
+ITEMSIZE = struct.calcsize(TYPECODE)
+
+
+def get_cache_path(file_path: Path, cache_dir: Optional[Path] = None) -> Path:
+    """Returns the path of the cache file of an instance, next to the instance by default."""
+    directory = cache_dir if cache_dir is not None else file_path.parent
+    return directory / f"{file_path.name}.cache"
+
+
+def load_graph(file_path: Path, cache_dir: Optional[Path] = None) -> Graph:
+    """Loads an instance in the IN2-format. If a valid cache file exists, it is memory-mapped
+    instead of parsing the instance. Otherwise the instance is parsed and a cache file is
+    written. A cache file is valid if the source file has not been modified since."""
+
+    cache_path = get_cache_path(file_path, cache_dir)
+    source = file_path.stat()
+
+    compiled = read_cache(cache_path, source.st_mtime_ns, source.st_size)
+    if compiled is not None:
+        return Graph.from_compiled(compiled)
+
+    graph = in2_parser.parse_graph(file_path)
+    try:
+        write_cache(cache_path, graph.compile(), source.st_mtime_ns, source.st_size)
+    except OSError as e:
+        logger.warning("Could not write cache file %s: %s", cache_path, e)
+    return graph
+
+
+def write_cache(
+    cache_path: Path, compiled: CompiledGraph, mtime_ns: int, size: int
+) -> None:
+    """Writes the compiled graph to a cache file, see `encode_graph`."""
+
+    # write to a temporary file first, so that readers never see a partial cache file
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with temporary_path.open("wb") as f:
+        for part in encode_graph(compiled, mtime_ns, size):
+            f.write(part)
+    os.replace(temporary_path, cache_path)
+
+
+def read_cache(cache_path: Path, mtime_ns: int, size: int) -> Optional[CompiledGraph]:
+    """Returns the memory-mapped compiled graph of a cache file or None if the cache file
+    does not exist or was not created from a source file with the given mtime and size."""
+
+    try:
+        with cache_path.open("rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        # mmap raises ValueError for empty files
+        return None
+
+    return decode_graph(buffer, mtime_ns, size)
+
+
+def encode_graph(
+    compiled: CompiledGraph, mtime_ns: int = 0, size: int = 0
+) -> list[bytes]:
+    """Returns the parts of the compiled graph in the cache-format, to be written in order.
+
+    Cache-format:
+        header:     magic, version, mtime and size of the source file, cycle time,
+                    length of the name and number of items of each of the arrays
+        name:       utf-8, padded to a multiple of 8 bytes
+        arrays:     processing times, setup times and precedence relations as in CompiledGraph
+    """
+
+    name = compiled.name.encode()
+    arrays = [getattr(compiled, field) for field in ARRAY_FIELDS]
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        mtime_ns,
+        size,
+        compiled.cycle_time,
+        len(name),
+        *(len(values) for values in arrays),
+    )
+    return [
+        header,
+        name.ljust(_padded(len(name)), b"\0"),
+        *(values.tobytes() for values in arrays),
+    ]
+
+
+def decode_graph(buffer, mtime_ns: int = 0, size: int = 0) -> Optional[CompiledGraph]:
+    """Returns the compiled graph in the cache-format in `buffer` without copying its arrays,
+    or None if the buffer is not a graph encoded with the given mtime and size."""
+
+    if len(buffer) < HEADER.size:
+        return None
+
+    (
+        magic,
+        version,
+        cached_mtime_ns,
+        cached_size,
+        cycle_time,
+        name_length,
+        *lengths,
+    ) = HEADER.unpack_from(buffer)
+    if (magic, version, cached_mtime_ns, cached_size) != (
+        MAGIC,
+        VERSION,
+        mtime_ns,
+        size,
+    ):
+        return None
+
+    offset = HEADER.size
+    name = bytes(buffer[offset : offset + name_length]).decode()
+    offset += _padded(name_length)
+
+    if len(buffer) != offset + sum(lengths) * ITEMSIZE:
+        return None
+
+    view = memoryview(buffer).toreadonly()
+    arrays = []
+    for length in lengths:
+        arrays.append(view[offset : offset + length * ITEMSIZE].cast(TYPECODE))
+        offset += length * ITEMSIZE
+
+    return CompiledGraph(name, cycle_time, *arrays)
+
+
+def _padded(length: int) -> int:
+    """Returns `length` rounded up to a multiple of 8 bytes."""
+    return (length + 7) // 8 * 8
@@ -0,0 +1,71 @@
+import queue
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, TypeVar
+
+from sualbsp_solver import instance_cache
+from sualbsp_solver.data_model import Graph
+
+T = TypeVar("T")
+
+# Marks the end of the items in the queue
+_DONE = object()
+
+
+def prefetch(items: Iterable[T], size: int = 2) -> Iterator[T]:
+    """Yields the items of an iterable that is consumed by a background thread.
+
+    The thread stays at most `size` items ahead of the consumer, so producing the next items
+    overlaps with processing the current one while memory use stays bounded. Exceptions raised
+    while producing an item are raised to the consumer when it reaches that item.
+    """
+
+    buffer: queue.Queue = queue.Queue(maxsize=size)
+    stopped = threading.Event()
+
+    def put(item: object) -> bool:
+        """Put an item into the buffer, returns False if the consumer has stopped."""
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except BaseException as e:
+            put((None, e))
+        put((_DONE, None))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stopped.set()
+
+
+def load_graphs(
+    file_paths: Iterable[Path], size: int = 2, cache_dir: Optional[Path] = None
+) -> Iterator[tuple[Path, Graph]]:
+    """Lazily loads the instances at `file_paths`, loading up to `size` instances ahead of
+    the consumer in a background thread."""
+    return prefetch(
+        (
+            (file_path, instance_cache.load_graph(file_path, cache_dir))
+            for file_path in file_paths
+        ),
+        size,
+    )
@@ -1,20 +1,27 @@
+import logging
 from io import BytesIO
 from pathlib import Path
 from time import perf_counter
+from typing import Optional
 from zipfile import ZipFile
 
 import requests
 
 from sualbsp_solver.exporter import Exporter
+from sualbsp_solver.results_store import ResultsStore
+from sualbsp_solver.scheduler import ExperimentScheduler
+from sualbsp_solver.solution_cache import SolutionCache
 
-from .experiment import Experiment
+from .experiment import create_optimizers
+
+logger = logging.getLogger(__name__)
 
 
 def get_dataset(dataset_dir: Path, url: str):
     """Download and unzip the Dataset at `url`."""
 
     dataset = requests.get(url)
-    print(">>> Download Completed")
+    logger.info("Download completed")
 
     zipfile = ZipFile(BytesIO(dataset.content))
     zipfile.extractall(dataset_dir)
@@ -32,32 +39,61 @@ class MartinoPastor2010Experiment:
         dataset_path = data_dir / self.dataset_name
 
         if not dataset_path.exists():
-            print(
-                f">>> Dataset {self.dataset_name} not found. Downloading from {self.dataset_url}..."
+            logger.info(
+                "Dataset %s not found. Downloading from %s...",
+                self.dataset_name,
+                self.dataset_url,
             )
             get_dataset(dataset_path, self.dataset_url)
 
         return list(dataset_path.rglob("*.txt"))
 
-    def run(self, results_dir: Path) -> None:
+    def run(
+        self,
+        results_dir: Path,
+        workers: int = 1,
+        resume: bool = True,
+        profile: bool = False,
+        cache: Optional[SolutionCache] = None,
+    ) -> None:
+        """Solve all instances with all optimizers. With more than one worker, the
+        (instance, optimizer) pairs are solved in parallel.
+
+        Every result is stored in `results_dir` as soon as it is available. If `resume` is True,
+        the stored results of a previous run are reused, otherwise they are discarded. If
+        `profile` is True, the profiles of the runs are exported per instance, stored results
+        are only profiled if they were profiled when they were solved. If a solution cache is
+        given, deterministic runs with a cached result are not solved again."""
 
         run_start = perf_counter()
 
-        solutions = []
-        for graph in self.graphs:
+        store = ResultsStore(results_dir / f"{self.dataset_name}.jsonl")
+        if not resume:
+            store.clear()
+        elif len(store):
+            logger.info("Resuming with %d stored results", len(store))
+
+        scheduler = ExperimentScheduler(
+            self.graphs, create_optimizers(), workers, store, profile, cache
+        )
 
-            experiment = Experiment(graph)
-            results = experiment.run()
+        instance_solutions: dict[Path, list[dict]] = {}
+        for graph, results in scheduler.run():
 
-            solutions.extend(results)
+            instance_solutions[graph] = results
 
             results_file = results_dir / f"{graph.name}.csv"
             Exporter.export_instance_result(results, destination=results_file)
+            if profile:
+                profiles_file = results_dir / f"{graph.name}.profile.json"
+                Exporter.export_profiles(results, destination=profiles_file)
 
-            print("Experiment Runtime:", perf_counter() - experiment.start_time)
-            print("=" * 50, "\n")
+        logger.info("Full runtime: %s", perf_counter() - run_start)
 
-        print(f"Full runtime: {perf_counter() - run_start}")
+        # Keep the order of the instances, independent of the order of completion
+        solutions = [
+            solution for graph in self.graphs for solution in instance_solutions[graph]
+        ]
 
         all_results_file = results_dir / f"{self.dataset_name}.csv"
         Exporter.export_results(solutions, all_results_file)
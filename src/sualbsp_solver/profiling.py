@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import ContextManager, Iterator, Optional
+
+
+class Profile:
+    """Counters and accumulated timers of a solver run."""
+
+    def __init__(self) -> None:
+        self.counters: defaultdict[str, int] = defaultdict(int)
+        self.timers: defaultdict[str, float] = defaultdict(float)
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counters[name] += value
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Adds the time spent in the context to the timer `name`."""
+        start_time = perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name] += perf_counter() - start_time
+
+    def merge(self, profile: dict) -> None:
+        """Adds the counters and timers of a profile in the form of as_dict()."""
+        for name, value in profile["counters"].items():
+            self.counters[name] += value
+        for name, value in profile["timers"].items():
+            self.timers[name] += value
+
+    def as_dict(self) -> dict:
+        return {"counters": dict(self.counters), "timers": dict(self.timers)}
+
+
+# The profile that the solvers of this process record to, None if profiling is disabled
+_active_profile: Optional[Profile] = None
+
+
+def active_profile() -> Optional[Profile]:
+    return _active_profile
+
+
+@contextmanager
+def profiling(profile: Optional[Profile] = None) -> Iterator[Profile]:
+    """Records the counters and timers of the solvers in the context to `profile` or a new
+    Profile, which is returned. Contexts can be nested, the innermost profile records."""
+    global _active_profile
+
+    previous_profile = _active_profile
+    _active_profile = profile if profile is not None else Profile()
+    try:
+        yield _active_profile
+    finally:
+        _active_profile = previous_profile
+
+
+def count(name: str, value: int = 1) -> None:
+    """Increments the counter `name` of the active profile, if any."""
+    if _active_profile is not None:
+        _active_profile.count(name, value)
+
+
+def timer(name: str) -> ContextManager:
+    """Returns a context that adds its time to the timer `name` of the active profile, if any.
+    The counters and timers are meant for whole phases, not for the innermost loops."""
+    if _active_profile is not None:
+        return _active_profile.timer(name)
+    return nullcontext()
@@ -0,0 +1,69 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
+
+def hash_file(file_path: Path) -> str:
+    """Returns the SHA-256 hash of the content of a file."""
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+class ResultsStore:
+    """Append-only store of the results of completed runs in a JSON-lines file.
+
+    A run is identified by the hash of the instance file, the optimizer and its seed. Each
+    result is written to the file as soon as it is added, so an interrupted experiment can be
+    resumed by skipping the runs that are already in the store.
+    """
+
+    def __init__(self, filepath: Path) -> None:
+        self.filepath = filepath
+        self.results: dict[str, dict] = {}
+        if filepath.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        """Returns the number of stored results."""
+        return len(self.results)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.results
+
+    @staticmethod
+    def key(instance_hash: str, optimizer: str, seed: Optional[int] = None) -> str:
+        """Returns the key of a run."""
+        return f"{instance_hash}:{optimizer}:{seed}"
+
+    def get(self, key: str) -> Optional[dict]:
+        """Returns a copy of the stored result or None if there is none."""
+        result = self.results.get(key)
+        return dict(result) if result is not None else None
+
+    def add(self, key: str, result: dict) -> None:
+        """Stores the result and appends it to the file."""
+        self.results[key] = dict(result)
+
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        with self.filepath.open("a") as f:
+            f.write(json.dumps({"key": key, "result": result}) + "\n")
+
+    def clear(self) -> None:
+        """Removes all results from the store and the file."""
+        self.results.clear()
+        self.filepath.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        content = self.filepath.read_text()
+        for line in content.splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # the last line is incomplete if a run was interrupted while writing
+                continue
+            self.results[entry["key"]] = entry["result"]
+
+        # start new results on a new line after an incomplete one
+        if content and not content.endswith("\n"):
+            with self.filepath.open("a") as f:
+                f.write("\n")
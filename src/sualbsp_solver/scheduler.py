@@ -0,0 +1,239 @@
+import logging
+from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from time import perf_counter
+from typing import Iterator, Optional
+
+from sualbsp_solver import instance_cache
+from sualbsp_solver.data_model import Graph
+from sualbsp_solver.experiment import add_relative_deviations, run_optimizer
+from sualbsp_solver.loader import load_graphs
+from sualbsp_solver.results_store import ResultsStore, hash_file
+from sualbsp_solver.solution_cache import SolutionCache
+from sualbsp_solver.solver.optimizer import OptimizationProcedure
+
+logger = logging.getLogger(__name__)
+
+
+def count_tasks(file_path: Path) -> int:
+    """Returns the number of tasks of an instance in the IN2-format without parsing it."""
+    with open(file_path) as f:
+        return int(f.readline())
+
+
+@dataclass(frozen=True)
+class Job:
+    """Solve the instance at `file_path` with the optimizer at `optimizer_index`."""
+
+    file_path: Path
+    optimizer_index: int
+    num_tasks: int
+
+
+class ExperimentScheduler:
+    """Solves a set of instances with every optimizer and yields the results per instance.
+
+    With more than one worker, every (instance, optimizer) pair is a separate job on a pool of
+    processes. The jobs of the largest instances are submitted first, which keeps the workers
+    busy until the end of the run. The results of an instance are yielded as soon as all its
+    jobs are completed, in the order of the optimizers.
+
+    If a results store is given, jobs with a stored result are skipped and the result of every
+    solved job is added to the store as soon as it is available. If `profile` is True, the
+    results of the solved jobs hold the profile of the run, see run_optimizer.
+
+    If a solution cache is given, jobs of deterministic optimizers with a cached result are
+    not solved, see run_optimizer. Only the scheduling process uses the cache.
+    """
+
+    def __init__(
+        self,
+        file_paths: list[Path],
+        optimizers: list[OptimizationProcedure],
+        workers: int = 1,
+        store: Optional[ResultsStore] = None,
+        profile: bool = False,
+        cache: Optional[SolutionCache] = None,
+    ) -> None:
+        self.file_paths = file_paths
+        self.optimizers = optimizers
+        self.workers = workers
+        self.store = store
+        self.profile = profile
+        self.cache = cache if not profile else None
+        self._instance_hashes: dict[Path, str] = {}
+
+    def create_jobs(self) -> list[Job]:
+        """Returns the jobs without a stored result, largest instances first."""
+        jobs = []
+        for file_path in self.file_paths:
+            num_tasks = count_tasks(file_path)
+            for optimizer_index in range(len(self.optimizers)):
+                if self._load_result(file_path, optimizer_index) is None:
+                    jobs.append(Job(file_path, optimizer_index, num_tasks))
+
+        jobs.sort(key=lambda job: -job.num_tasks)
+        return jobs
+
+    def _job_key(self, file_path: Path, optimizer_index: int) -> str:
+        if file_path not in self._instance_hashes:
+            self._instance_hashes[file_path] = hash_file(file_path)
+
+        optimizer = self.optimizers[optimizer_index]
+        return ResultsStore.key(
+            self._instance_hashes[file_path],
+            optimizer.describe(),
+            getattr(optimizer, "seed", None),
+        )
+
+    def _load_result(self, file_path: Path, optimizer_index: int) -> Optional[dict]:
+        if self.store is None:
+            return None
+        return self.store.get(self._job_key(file_path, optimizer_index))
+
+    def _save_result(self, file_path: Path, optimizer_index: int, result: dict) -> None:
+        if self.store is not None:
+            self.store.add(self._job_key(file_path, optimizer_index), result)
+
+    def run(self) -> Iterator[tuple[Path, list[dict]]]:
+        """Yields each instance with the results of all optimizers."""
+        if self.workers > 1:
+            yield from self._run_in_parallel()
+        else:
+            yield from self._run_sequentially()
+
+    def _run_sequentially(self) -> Iterator[tuple[Path, list[dict]]]:
+        stored_results = {
+            file_path: [
+                self._load_result(file_path, optimizer_index)
+                for optimizer_index in range(len(self.optimizers))
+            ]
+            for file_path in self.file_paths
+        }
+
+        # Load the instances with missing results in the background while solving
+        graphs = load_graphs(
+            [
+                file_path
+                for file_path in self.file_paths
+                if None in stored_results[file_path]
+            ]
+        )
+
+        for file_path in self.file_paths:
+            start_time = perf_counter()
+
+            results = stored_results.pop(file_path)
+            if None in results:
+                _, graph = next(graphs)
+                for optimizer_index, optimizer in enumerate(self.optimizers):
+                    if results[optimizer_index] is None:
+                        result = run_optimizer(
+                            graph, optimizer, self.profile, self.cache
+                        )
+                        self._save_result(file_path, optimizer_index, result)
+                        results[optimizer_index] = result
+
+            completed = [result for result in results if result is not None]
+            assert len(completed) == len(results)
+            add_relative_deviations(completed)
+
+            logger.info("Experiment Runtime: %s", perf_counter() - start_time)
+            yield file_path, completed
+
+    def _run_in_parallel(self) -> Iterator[tuple[Path, list[dict]]]:
+        jobs = self.create_jobs()
+        pending: dict[Path, int] = defaultdict(int)
+        for job in jobs:
+            pending[job.file_path] += 1
+
+        # Instances without pending jobs are completed from the results store
+        results: dict[Path, list[dict]] = {}
+        for file_path in self.file_paths:
+            stored_results = [
+                self._load_result(file_path, optimizer_index) or {}
+                for optimizer_index in range(len(self.optimizers))
+            ]
+            if pending[file_path]:
+                results[file_path] = stored_results
+            else:
+                add_relative_deviations(stored_results)
+                yield file_path, stored_results
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_initialize_worker,
+            initargs=(self.optimizers, self.profile),
+        ) as executor:
+
+            def complete(job: Job, result: dict) -> Optional[list[dict]]:
+                """Records the result of a job and returns the results of its instance
+                once all its jobs are completed."""
+                results[job.file_path][job.optimizer_index] = result
+                self._save_result(job.file_path, job.optimizer_index, result)
+
+                pending[job.file_path] -= 1
+                if pending[job.file_path]:
+                    return None
+                instance_results = results.pop(job.file_path)
+                add_relative_deviations(instance_results)
+                return instance_results
+
+            # Jobs with a cached result are completed once all other jobs are submitted
+            cached_jobs: list[tuple[Job, dict]] = []
+            futures: dict[Future, Job] = {}
+            for job in jobs:
+                cached_result = self._load_cached_result(job)
+                if cached_result is not None:
+                    cached_jobs.append((job, cached_result))
+                else:
+                    futures[executor.submit(_solve_job, job)] = job
+
+            for job, result in cached_jobs:
+                instance_results = complete(job, result)
+                if instance_results is not None:
+                    yield job.file_path, instance_results
+
+            for future in as_completed(futures):
+                job = futures[future]
+                result = future.result()
+                if self.cache is not None:
+                    graph = _load_graph(job.file_path)
+                    self.cache.add(graph, self.optimizers[job.optimizer_index], result)
+
+                instance_results = complete(job, result)
+                if instance_results is not None:
+                    yield job.file_path, instance_results
+
+    def _load_cached_result(self, job: Job) -> Optional[dict]:
+        if self.cache is None:
+            return None
+        graph = _load_graph(job.file_path)
+        return self.cache.get(graph, self.optimizers[job.optimizer_index])
+
+
+# The optimizers of a worker process, set once by the pool initializer
+_worker_optimizers: list[OptimizationProcedure] = []
+_worker_profile = False
+
+
+def _initialize_worker(optimizers: list[OptimizationProcedure], profile: bool) -> None:
+    global _worker_optimizers, _worker_profile
+    _worker_optimizers = optimizers
+    _worker_profile = profile
+
+
+@lru_cache(maxsize=4)
+def _load_graph(file_path: Path) -> Graph:
+    """Parse an instance once per worker while its jobs are being solved."""
+    return instance_cache.load_graph(file_path)
+
+
+def _solve_job(job: Job) -> dict:
+    graph = _load_graph(job.file_path)
+    return run_optimizer(
+        graph, _worker_optimizers[job.optimizer_index], _worker_profile
+    )
@@ -0,0 +1,442 @@
+"""A local job server that solves SUALBSP instances on demand, see the README."""
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Optional
+
+from sualbsp_solver import in2_parser
+from sualbsp_solver.data_model import CompiledGraph, Graph, Station
+from sualbsp_solver.data_model.compiled_graph import read_only, to_csr
+from sualbsp_solver.experiment import create_optimizers
+from sualbsp_solver.solver import accelerated
+from sualbsp_solver.solver.grasp import GRASP
+from sualbsp_solver.solver.lower_bound import lower_bound
+from sualbsp_solver.solver.optimizer import OptimizationProcedure
+from sualbsp_solver.solver.reactive_grasp import ReactiveGRASP
+
+logger = logging.getLogger(__name__)
+
+# Seconds a job may exceed its time limit before its process is stopped
+GRACE_PERIOD = 1.0
+
+# Events after which a job process sends nothing more
+FINAL_EVENTS = ("completed", "error")
+
+
+def get_context() -> Any:
+    """Returns the context that starts the job processes."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def graph_from_json(data: dict) -> Graph:
+    """Returns the graph of an instance given as JSON object, see the README."""
+    processing_times = data["processing_times"]
+    num_tasks = len(processing_times)
+    predecessors = [
+        list(task_predecessors) for task_predecessors in data["predecessors"]
+    ]
+    setup_rows = data["setup_times"]
+    if len(predecessors) != num_tasks or len(setup_rows) != num_tasks:
+        raise ValueError(
+            f"Expected predecessors and setup times for {num_tasks} tasks."
+        )
+    if any(len(row) != num_tasks for row in setup_rows):
+        raise ValueError(f"Expected {num_tasks} setup times per task.")
+
+    successors: list[list[int]] = [[] for _ in range(num_tasks)]
+    for task, task_predecessors in enumerate(predecessors):
+        for predecessor in task_predecessors:
+            if not isinstance(predecessor, int) or not 0 <= predecessor < num_tasks:
+                raise ValueError(
+                    f"Task {task} has an unknown predecessor {predecessor}."
+                )
+            successors[predecessor].append(task)
+
+    compiled = CompiledGraph(
+        data.get("name", "instance"),
+        int(data["cycle_time"]),
+        read_only(processing_times),
+        read_only(value for row in setup_rows for value in row),
+        *to_csr(predecessors),
+        *to_csr(successors),
+    )
+    return Graph.from_compiled(compiled)
+
+
+def parse_instance(instance) -> Graph:
+    """Returns the graph of an instance given as IN2-text or as JSON object."""
+    if isinstance(instance, str):
+        graph = in2_parser.parse_text(instance, "instance")
+    elif isinstance(instance, dict):
+        graph = graph_from_json(instance)
+    else:
+        raise ValueError(
+            "The instance must be a string in the IN2-format or an object."
+        )
+    check_graph(graph.compile())
+    return graph
+
+
+def check_graph(compiled: CompiledGraph) -> None:
+    """Raises ValueError if the instance can not be solved, because the precedence relations
+    refer to unknown tasks or contain a cycle, or a task does not fit into a station."""
+    if compiled.cycle_time <= 0:
+        raise ValueError("The cycle time must be positive.")
+    if any(
+        not 0 <= predecessor < compiled.num_tasks
+        for predecessor in compiled.predecessors
+    ):
+        raise ValueError("The precedence relations refer to unknown tasks.")
+    for task, processing_time in enumerate(compiled.processing_times):
+        if not 0 <= processing_time <= compiled.cycle_time:
+            raise ValueError(
+                f"The processing time of task {task} must be between 0 and the cycle time."
+            )
+    if any(setup_time < 0 for setup_time in compiled.setup_times):
+        raise ValueError("The setup times must not be negative.")
+
+    # raises ValueError if the precedence relations contain a cycle
+    compiled.closure_masks
+
+
+def get_option(
+    request: dict, key: str, minimum: Optional[int] = None, number: bool = False
+) -> Any:
+    """Returns the option `key` of a request, None if it is missing. The option must be an
+    integer, or any number if `number` is True, of at least `minimum`."""
+    value = request.get(key)
+    if value is None:
+        return None
+
+    kind = (int, float) if number else int
+    if isinstance(value, bool) or not isinstance(value, kind):
+        raise ValueError(f"{key} must be {'a number' if number else 'an integer'}.")
+    if minimum is not None and value < minimum:
+        raise ValueError(f"{key} must be at least {minimum}.")
+    return value
+
+
+def create_optimizer(request: dict) -> OptimizationProcedure:
+    """Returns the optimization procedure of a solve request."""
+    name = request.get("optimizer", "GRASP")
+    if name in ("GRASP", "ReactiveGRASP"):
+        procedure = GRASP if name == "GRASP" else ReactiveGRASP
+        return procedure(
+            get_option(request, "iterations", minimum=1),
+            seed=get_option(request, "seed"),
+            time_limit=get_option(request, "time_limit", minimum=0, number=True),
+            target_stations=get_option(request, "target_stations", minimum=1),
+            elite_size=get_option(request, "elite_size", minimum=0) or 0,
+            elite_distance=get_option(request, "elite_distance", minimum=1),
+        )
+
+    for optimizer in create_optimizers():
+        if optimizer.describe() == name:
+            return optimizer
+    raise ValueError(f"Unknown optimizer {name}.")
+
+
+@dataclass(eq=False)
+class Job:
+    """A solve request of a client."""
+
+    id: int
+    graph: Graph
+    optimizer: OptimizationProcedure
+    time_limit: Optional[float]
+    writer: asyncio.StreamWriter
+    process: Optional[multiprocessing.Process] = field(default=None, repr=False)
+    cancelled: bool = False
+    timed_out: bool = False
+
+    async def send(self, event: str, **values) -> None:
+        await send_message(self.writer, {"job": self.id, "event": event, **values})
+
+
+async def send_message(writer: asyncio.StreamWriter, message: dict) -> None:
+    if writer.is_closing():
+        return
+    writer.write(json.dumps(message).encode() + b"\n")
+    try:
+        await writer.drain()
+    except ConnectionError:
+        pass
+
+
+class SolverServer:
+    """Accepts solve requests and runs at most `workers` jobs at the same time.
+
+    Each job is solved in its own process, so that it can be cancelled by terminating the
+    process. At most `workers` job processes exist at the same time, the other jobs are
+    queued. Where available, the processes are forked from a server process that has
+    imported the solver once."""
+
+    def __init__(self, workers: int = 1) -> None:
+        self.workers = workers
+        self.jobs: dict[int, Job] = {}
+        self._job_ids = itertools.count(1)
+        self._queue: asyncio.Queue[Job] = asyncio.Queue()
+        self._threads = ThreadPoolExecutor(max_workers=workers)
+        self._runners: list[asyncio.Task] = []
+        # held from the start of a job process until it is joined
+        self._processes = asyncio.Semaphore(workers)
+        self._server: Optional[asyncio.Server] = None
+        self._context = get_context()
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 0, path: Optional[Path] = None
+    ) -> asyncio.Server:
+        """Starts to accept connections on the Unix socket at `path` if given, otherwise on
+        the TCP port, a free one for port 0."""
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self.handle_client, path)
+        else:
+            self._server = await asyncio.start_server(self.handle_client, host, port)
+        self._runners = [
+            asyncio.create_task(self._run_jobs()) for _ in range(self.workers)
+        ]
+        return self._server
+
+    async def close(self) -> None:
+        """Stops accepting connections and cancels all jobs."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for job in list(self.jobs.values()):
+            await self.cancel(job)
+        for runner in self._runners:
+            runner.cancel()
+        await asyncio.gather(*self._runners, return_exceptions=True)
+        self._threads.shutdown(wait=False)
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        client_jobs: list[Job] = []
+        try:
+            while line := await reader.readline():
+                job = await self.handle_request(line, writer)
+                if job is not None:
+                    client_jobs.append(job)
+        except ConnectionError:
+            pass
+        finally:
+            for job in client_jobs:
+                await self.cancel(job)
+            writer.close()
+
+    async def handle_request(
+        self, line: bytes, writer: asyncio.StreamWriter
+    ) -> Optional[Job]:
+        """Handles a request and returns the job it creates, if any."""
+        try:
+            request = json.loads(line)
+            if request.get("type") == "cancel":
+                job = self.jobs.get(request.get("job"))
+                if job is None:
+                    raise ValueError(f"Unknown job {request.get('job')}.")
+                await self.cancel(job)
+                return None
+            if request.get("type") != "solve":
+                raise ValueError(f"Unknown request type {request.get('type')}.")
+
+            time_limit = get_option(request, "time_limit", minimum=0, number=True)
+            graph = parse_instance(request.get("instance"))
+            optimizer = create_optimizer(request)
+        except Exception as e:
+            await send_message(writer, {"event": "error", "message": str(e)})
+            return None
+
+        job = Job(next(self._job_ids), graph, optimizer, time_limit, writer)
+        self.jobs[job.id] = job
+        await job.send("queued", tag=request.get("tag"))
+        self._queue.put_nowait(job)
+        return job
+
+    async def cancel(self, job: Job) -> None:
+        """Cancels a queued or running job. A running job reports the cancellation once its
+        process has stopped."""
+        if job.cancelled or job.id not in self.jobs:
+            return
+        job.cancelled = True
+        if job.process is not None:
+            job.process.terminate()
+        else:
+            del self.jobs[job.id]
+            await job.send("cancelled")
+
+    async def _run_jobs(self) -> None:
+        while True:
+            job = await self._queue.get()
+            if job.cancelled:
+                continue
+            try:
+                await self._run_job(job)
+            except Exception as e:
+                logger.exception("Job %d failed", job.id)
+                await job.send("error", message=str(e))
+            finally:
+                self.jobs.pop(job.id, None)
+
+    async def _run_job(self, job: Job) -> None:
+        async with self._processes:
+            if not job.cancelled:
+                await self._run_process(job)
+
+    async def _run_process(self, job: Job) -> None:
+        """Solves the job in a new process and forwards its events to the client."""
+        loop = asyncio.get_running_loop()
+
+        connection, child_connection = self._context.Pipe(duplex=False)
+        job.process = self._context.Process(
+            target=_solve,
+            args=(
+                child_connection,
+                job.graph.compile(),
+                job.optimizer,
+                accelerated.get_backend(),
+            ),
+            daemon=True,
+        )
+        job.process.start()
+        child_connection.close()
+        await job.send("started")
+
+        deadline = None
+        if job.time_limit is not None:
+            deadline = loop.time() + job.time_limit + GRACE_PERIOD
+
+        final_event = None
+        try:
+            while final_event is None:
+                receive = loop.run_in_executor(self._threads, _receive, connection)
+                timeout = None if deadline is None else max(0, deadline - loop.time())
+                done, _ = await asyncio.wait({receive}, timeout=timeout)
+                if not done:
+                    job.timed_out = True
+                    job.process.terminate()
+
+                message = await receive
+                if message is None:
+                    break
+                if message["event"] in FINAL_EVENTS:
+                    final_event = message["event"]
+                await job.send(**message)
+        finally:
+            if job.process.is_alive():
+                job.process.terminate()
+            await loop.run_in_executor(self._threads, job.process.join)
+            connection.close()
+
+        if final_event is None:
+            if job.cancelled:
+                await job.send("cancelled")
+            elif job.timed_out:
+                await job.send("timeout")
+            else:
+                await job.send("error", message="The worker process stopped.")
+
+
+def _receive(connection: Connection) -> Optional[dict]:
+    """Returns the next message of a job process or None once the process has stopped."""
+    try:
+        return connection.recv()
+    except EOFError:
+        return None
+
+
+def _solve(
+    connection: Connection,
+    compiled: CompiledGraph,
+    optimizer: OptimizationProcedure,
+    backend: str,
+) -> None:
+    """Solves the instance in a job process with the backend of the server and sends the
+    events to the server."""
+    try:
+        accelerated.set_backend(backend)
+        graph = Graph.from_compiled(compiled)
+        start_time = perf_counter()
+
+        if isinstance(optimizer, GRASP):
+            solution: list[Station] = []
+            for incumbent in optimizer.incumbents(graph):
+                solution = incumbent.solution
+                connection.send(
+                    {
+                        "event": "incumbent",
+                        "num_stations": incumbent.num_stations,
+                        "stations": _station_ids(solution),
+                        "iteration": incumbent.iteration,
+                        "runtime": incumbent.runtime,
+                    }
+                )
+        else:
+            solution = optimizer.solve(graph)
+
+        connection.send(
+            {
+                "event": "completed",
+                "strategy": optimizer.describe(),
+                "num_stations": len(solution),
+                "stations": _station_ids(solution),
+                "lower_bound": lower_bound(compiled),
+                "runtime": perf_counter() - start_time,
+            }
+        )
+    except Exception as e:
+        connection.send({"event": "error", "message": str(e)})
+    finally:
+        connection.close()
+
+
+def _station_ids(solution: list[Station]) -> list[list[int]]:
+    return [[task.id for task in station] for station in solution]
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    path: Optional[Path] = None,
+    workers: int = 1,
+) -> None:
+    """Runs a solver server until it is cancelled."""
+    server = SolverServer(workers)
+    socket_server = await server.start(host, port, path)
+    for socket in socket_server.sockets:
+        logger.info("Serving on %s", socket.getsockname())
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solve SUALBSP instances on demand")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket", type=Path)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--backend", choices=accelerated.BACKENDS, default="python")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    args = parser.parse_args()
+    accelerated.set_backend(args.backend)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix_socket, args.workers))
+    except KeyboardInterrupt:
+        pass
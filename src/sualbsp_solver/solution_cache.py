@@ -0,0 +1,134 @@
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from sualbsp_solver.data_model import Graph
+from sualbsp_solver.results_store import ResultsStore
+from sualbsp_solver.solver.optimizer import OptimizationProcedure
+
+logger = logging.getLogger(__name__)
+
+# Default bound of the total size of the entries in bytes
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+# Version of the cached results, part of every key. Increase it when a change of the solvers
+# or of run_optimizer changes the results, so that older entries are not returned anymore.
+VERSION = 2
+
+
+class SolutionCache:
+    """Content-addressed cache of the results of deterministic runs in a directory.
+
+    A run is identified by the fingerprint of the compiled instance, the description of the
+    optimizer, which includes its ordering rule, its seed and the VERSION of the results.
+    Each result is stored in its own JSON file, named by the hash of the key. Only runs of
+    deterministic optimizers are cached, see OptimizationProcedure.is_deterministic.
+
+    Once the files exceed `max_size` bytes, the least recently used entries are removed. The
+    modification time of a file is its last use, so the order survives restarts. The cache
+    is meant to be used by one process at a time.
+    """
+
+    def __init__(self, directory: Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.size = 0
+        # sizes of the entry files, least recently used first
+        self._entries: OrderedDict[Path, int] = OrderedDict()
+        if directory.exists():
+            self._load()
+
+    def __len__(self) -> int:
+        """Returns the number of cached results."""
+        return len(self._entries)
+
+    @staticmethod
+    def key(graph: Graph, optimizer: OptimizationProcedure) -> Optional[str]:
+        """Returns the key of solving the graph with the optimizer, or None if the run is
+        not deterministic."""
+        if not optimizer.is_deterministic():
+            return None
+        run_key = ResultsStore.key(
+            graph.compile().fingerprint,
+            optimizer.describe(),
+            getattr(optimizer, "seed", None),
+        )
+        return f"v{VERSION}:{run_key}"
+
+    def get(self, graph: Graph, optimizer: OptimizationProcedure) -> Optional[dict]:
+        """Returns the cached result of solving the graph with the optimizer, with the name
+        of the graph as "Instance", or None if there is none. The runtime is the one of the
+        run that was cached."""
+        key = self.key(graph, optimizer)
+        if key is None:
+            return None
+
+        path = self._path(key)
+        if path not in self._entries:
+            return None
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            self._remove(path)
+            return None
+        if entry.get("key") != key:
+            return None
+
+        self._entries.move_to_end(path)
+        os.utime(path)
+
+        result = entry["result"]
+        result["Instance"] = f"{graph}"
+        return result
+
+    def add(self, graph: Graph, optimizer: OptimizationProcedure, result: dict) -> None:
+        """Caches the result of solving the graph with the optimizer if the run is
+        deterministic, and removes the least recently used entries above the size bound."""
+        key = self.key(graph, optimizer)
+        if key is None:
+            return
+
+        path = self._path(key)
+        content = json.dumps({"key": key, "result": result})
+
+        # write to a temporary file first, so that readers never see a partial entry
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            temporary_path.write_text(content)
+            os.replace(temporary_path, path)
+        except OSError as e:
+            logger.warning("Could not write cache entry %s: %s", path, e)
+            return
+
+        self.size -= self._entries.pop(path, 0)
+        self._entries[path] = len(content)
+        self.size += len(content)
+        while self.size > self.max_size and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        for path in list(self._entries):
+            self._remove(path)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def _remove(self, path: Path) -> None:
+        self.size -= self._entries.pop(path)
+        path.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.json"):
+            stat = path.stat()
+            entries.append((stat.st_mtime_ns, path, stat.st_size))
+
+        for _, path, size in sorted(entries):
+            self._entries[path] = size
+            self.size += size
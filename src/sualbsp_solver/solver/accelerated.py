@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+from sualbsp_solver.data_model import Task, TaskList
+from sualbsp_solver.data_model.compiled_graph import TYPECODE
+from sualbsp_solver.solver.swap_evaluator import StationObjective, SwapEvaluator
+
+try:
+    import numpy as np
+    from numba import njit
+
+    _AVAILABLE = True
+except ImportError:  # the accelerated backend is optional
+    _AVAILABLE = False
+
+BACKENDS = ("python", "numba")
+
+# Station objectives implemented by the kernels, see local_search
+BALANCED = 0
+IMBALANCED = 1
+IMBALANCE_EPS = 0.001
+
+
+def is_available() -> bool:
+    """Returns True if numba and numpy are installed."""
+    return _AVAILABLE
+
+
+_backend = "python"
+
+
+def get_backend() -> str:
+    """Returns the backend that evaluates the swap neighbourhood in the local search."""
+    return _backend
+
+
+def set_backend(backend: str) -> None:
+    """Selects the backend of the local search, "python" by default. The "numba" backend
+    requires the optional numba and numpy dependencies, the "accelerated" extra.
+
+    Both backends give identical results. The numba backend only evaluates the exchanges of
+    the swap neighbourhood in compiled code, which is where the local search spends its time.
+    The reassembly of the improved sequence and the objectives of the start solution are
+    computed once per improvement step and stay in Python.
+
+    Worker processes inherit the backend only if they are forked. Processes that are spawned
+    or started by a forkserver begin with the default and have to select the backend again,
+    the job processes of the server receive it with their job."""
+    global _backend
+
+    if backend not in BACKENDS:
+        raise ValueError(f"The backend must be one of {BACKENDS}, got {backend}.")
+    if backend == "numba" and not is_available():
+        raise ValueError("The numba backend requires numba and numpy to be installed.")
+    _backend = backend
+
+
+class AcceleratedSwapEvaluator(SwapEvaluator):
+    """SwapEvaluator that evaluates exchanges in a compiled kernel.
+
+    The kernel implements the balanced or the imbalanced station objective, given by
+    `objective_kind`. It reads the setup times from the n x n matrix of the instance, see
+    setup_matrix, and only the task ids and processing times are copied per sequence.
+    """
+
+    def __init__(
+        self,
+        sequence: TaskList,
+        cycle_time: int,
+        station_objective: StationObjective,
+        objective_kind: int,
+    ) -> None:
+        super().__init__(sequence, cycle_time, station_objective)
+        self.objective_kind = objective_kind
+
+        self._ids = np.array([task.id for task in self.tasks], dtype=np.int64)
+        self._processing_times = np.array(
+            [task.processing_time for task in self.tasks], dtype=np.int64
+        )
+        self._setup_times = setup_matrix(self.tasks)
+        self._copy_stations()
+
+    def apply_swap(self, pos1: int, pos2: int) -> None:
+        super().apply_swap(pos1, pos2)
+        self._ids[[pos1, pos2]] = self._ids[[pos2, pos1]]
+        self._processing_times[[pos1, pos2]] = self._processing_times[[pos2, pos1]]
+        self._copy_stations()
+
+    def _copy_stations(self) -> None:
+        self._station_starts = np.array(self.station_starts, dtype=np.int64)
+        self._station_of = np.array(self.station_of, dtype=np.int64)
+        self._is_station_start = np.array(self.is_station_start, dtype=np.bool_)
+        self._contributions = np.array(self.contributions, dtype=np.float64)
+        self._objective_prefix = np.array(self.objective_prefix, dtype=np.float64)
+
+    def evaluate_swap(
+        self, pos1: int, pos2: int, max_stations: Optional[int] = None
+    ) -> Optional[tuple[int, float]]:
+        return self.evaluate_swaps([(pos1, pos2)], max_stations)[0]
+
+    def evaluate_swaps(
+        self, exchanges: Sequence[tuple[int, int]], max_stations: Optional[int] = None
+    ) -> list[Optional[tuple[int, float]]]:
+        self.num_evaluations += len(exchanges)
+        if max_stations is None:
+            max_stations = len(self.tasks) + 1
+
+        pairs = np.array(exchanges, dtype=np.int64).reshape(-1, 2)
+        num_stations = np.empty(len(pairs), dtype=np.int64)
+        objectives = np.empty(len(pairs), dtype=np.float64)
+        _evaluate_swaps(
+            pairs,
+            max_stations,
+            self._ids,
+            self._processing_times,
+            self._setup_times,
+            self.cycle_time,
+            self._station_starts,
+            self._station_of,
+            self._is_station_start,
+            self._contributions,
+            self._objective_prefix,
+            self.objective_kind,
+            num_stations,
+            objectives,
+        )
+        return [
+            (int(stations), float(objective)) if stations >= 0 else None
+            for stations, objective in zip(num_stations.tolist(), objectives.tolist())
+        ]
+
+
+def setup_matrix(tasks: Sequence[Task]) -> np.ndarray:
+    """Returns the setup times of the tasks as an n x n matrix, indexed by task ids.
+
+    Tasks created by CompiledGraph.create_tasks read their setup times from the rows of one
+    buffer, in this case the matrix is a read-only view on it. Otherwise, e.g. for tasks with
+    lists of setup times, the setup times are copied."""
+    num_tasks = len(tasks)
+    rows: list[Sequence[int]] = [()] * num_tasks
+    for task in tasks:
+        rows[task.id] = task.setup_times
+
+    first_row = rows[0]
+    if isinstance(first_row, memoryview) and first_row.format == TYPECODE:
+        base = memoryview(first_row.obj)
+        base_address = _address(np.frombuffer(base, dtype=np.uint8))
+        row_size = first_row.nbytes
+        offset = _address(np.frombuffer(first_row, dtype=np.uint8)) - base_address
+        if (
+            row_size == num_tasks * first_row.itemsize
+            and offset + num_tasks * row_size <= base.nbytes
+            and all(
+                isinstance(row, memoryview)
+                and row.obj is first_row.obj
+                and row.format == TYPECODE
+                and _address(np.frombuffer(row, dtype=np.uint8))
+                == base_address + offset + task * row_size
+                for task, row in enumerate(rows)
+            )
+        ):
+            matrix = np.frombuffer(
+                base, dtype=np.intc, count=num_tasks * num_tasks, offset=offset
+            ).reshape(num_tasks, num_tasks)
+            matrix.flags.writeable = False
+            return matrix
+
+    return np.array(rows, dtype=np.intc).reshape(num_tasks, num_tasks)
+
+
+def _address(array: np.ndarray) -> int:
+    return array.__array_interface__["data"][0]
+
+
+def _station_objective(
+    station_time: int, cycle_time: int, objective_kind: int
+) -> float:
+    """The balanced or imbalanced station objective of local_search."""
+    if objective_kind == BALANCED:
+        load = station_time / cycle_time
+        return load * load
+    return 1 / (cycle_time - station_time + IMBALANCE_EPS)
+
+
+def _evaluate_swaps(
+    pairs,
+    max_stations,
+    ids,
+    processing_times,
+    setup_times,
+    cycle_time,
+    station_starts,
+    station_of,
+    is_station_start,
+    contributions,
+    objective_prefix,
+    objective_kind,
+    num_stations_out,
+    objectives_out,
+) -> None:
+    """Evaluates the exchanges in `pairs` like SwapEvaluator.evaluate_swap and writes the
+    number of stations and the objective of each to the output arrays, -1 stations for None.
+    Tasks are identified by their position in the current sequence, `ids` maps them to the
+    rows and columns of the setup times."""
+    num_tasks = ids.shape[0]
+    num_current_stations = contributions.shape[0]
+
+    for k in range(pairs.shape[0]):
+        pos1 = pairs[k, 0]
+        pos2 = pairs[k, 1]
+
+        first_station = station_of[pos1 - 1] if pos1 > 0 else 0
+        start = station_starts[first_station]
+
+        num_stations = first_station
+        objective = objective_prefix[first_station]
+        resume_station = num_current_stations
+        aborted = False
+        closed = False
+
+        previous = pos2 if start == pos1 else start
+        station_time = processing_times[previous]
+        for position in range(start + 1, num_tasks):
+            if position == pos1:
+                task = pos2
+            elif position == pos2:
+                task = pos1
+            else:
+                task = position
+            additional_time = (
+                setup_times[ids[previous], ids[task]] + processing_times[task]
+            )
+
+            if station_time + additional_time <= cycle_time:
+                station_time += additional_time
+            else:
+                num_stations += 1
+                objective += _station_objective(
+                    station_time, cycle_time, objective_kind
+                )
+                if num_stations >= max_stations:
+                    aborted = True
+                    break
+
+                if position > pos2 and is_station_start[position]:
+                    resume_station = station_of[position]
+                    closed = True
+                    break
+
+                station_time = processing_times[task]
+            previous = task
+
+        if aborted:
+            num_stations_out[k] = -1
+            continue
+
+        if not closed:
+            num_stations += 1
+            objective += _station_objective(station_time, cycle_time, objective_kind)
+
+        num_stations += num_current_stations - resume_station
+        if num_stations > max_stations:
+            num_stations_out[k] = -1
+            continue
+
+        for station in range(resume_station, num_current_stations):
+            objective += contributions[station]
+        num_stations_out[k] = num_stations
+        objectives_out[k] = objective
+
+
+if is_available():
+    _station_objective = njit(cache=True)(_station_objective)
+    _evaluate_swaps = njit(cache=True)(_evaluate_swaps)
@@ -0,0 +1,73 @@
+from bisect import bisect_left, bisect_right, insort
+
+from sualbsp_solver.data_model import Graph, Station, Task, TaskList
+
+
+class ConstructionState:
+    """Keeps track of the tasks that can be assigned while a solution is constructed.
+
+    Instead of removing an assigned task from the predecessors of all other tasks, the number of
+    unassigned predecessors is counted down for its direct successors only. The tasks without
+    unassigned predecessors are kept in a list sorted by id and in a list sorted by processing
+    time, so the tasks that may fit into a station are a prefix of the second list. The graph
+    is never modified, so its tasks can be assigned to stations without copying them.
+    """
+
+    def __init__(self, instance: Graph) -> None:
+        self.tasks = instance.tasks
+        self.graph = instance.compile()
+
+        offsets = self.graph.predecessor_offsets
+        self.remaining_predecessors = [
+            offsets[task + 1] - offsets[task] for task in range(self.graph.num_tasks)
+        ]
+        self.available = [
+            task
+            for task, num_predecessors in enumerate(self.remaining_predecessors)
+            if not num_predecessors
+        ]
+        self.available_by_time = sorted(
+            (self.graph.processing_times[task], task) for task in self.available
+        )
+        self.num_unassigned = self.graph.num_tasks
+
+    def __len__(self) -> int:
+        """Returns the number of tasks that are not assigned yet."""
+        return self.num_unassigned
+
+    def get_available_tasks(self) -> TaskList:
+        """Returns a list of unassigned tasks whose predecessors are all assigned"""
+        return TaskList([self.tasks[task] for task in self.available])
+
+    def get_tasks_that_fit(self, station: Station) -> TaskList:
+        """Returns the available tasks that fit into the station, sorted by id. Only the tasks
+        whose processing time does not exceed the idle time of the station are checked."""
+        idle_time = station.cycle_time - station.station_time
+        end = bisect_right(self.available_by_time, (idle_time, self.graph.num_tasks))
+
+        if station.is_empty():
+            fitting = [task for _, task in self.available_by_time[:end]]
+        else:
+            setup_times = station[-1].setup_times
+            fitting = [
+                task
+                for processing_time, task in self.available_by_time[:end]
+                if setup_times[task] + processing_time <= idle_time
+            ]
+        fitting.sort()
+        return TaskList([self.tasks[task] for task in fitting])
+
+    def assign(self, task: Task) -> None:
+        """Mark the task as assigned and release the successors without unassigned predecessors"""
+        del self.available[bisect_left(self.available, task.id)]
+        processing_times = self.graph.processing_times
+        del self.available_by_time[
+            bisect_left(self.available_by_time, (processing_times[task.id], task.id))
+        ]
+        self.num_unassigned -= 1
+
+        for successor in self.graph.successors_of(task.id):
+            self.remaining_predecessors[successor] -= 1
+            if not self.remaining_predecessors[successor]:
+                insort(self.available, successor)
+                insort(self.available_by_time, (processing_times[successor], successor))
@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from sualbsp_solver.data_model import TaskList
+from sualbsp_solver.solver.local_search import balanced_station_objective
+from sualbsp_solver.solver.swap_evaluator import SwapEvaluator
+
+
+@dataclass(frozen=True, eq=False)
+class EliteSolution:
+    """A task sequence with the number of stations and the balanced objective it is
+    reassembled to. Lower values are better."""
+
+    sequence: TaskList
+    num_stations: int
+    objective: float
+
+    @property
+    def value(self) -> tuple[int, float]:
+        return self.num_stations, self.objective
+
+
+class ElitePool:
+    """Keeps the `size` best task sequences that differ from each other in at least
+    `min_distance` positions.
+
+    A new sequence is rejected if the pool holds an at least as good sequence within the
+    minimum distance. Otherwise it replaces all the worse sequences within the minimum
+    distance or, if the pool is full, the worst sequence, as long as it is better than that.
+    The minimum distance defaults to a tenth of the sequence length, but at least 2, so that
+    sequences of larger instances must differ in more than a few swaps.
+    """
+
+    def __init__(
+        self, size: int, cycle_time: int, min_distance: Optional[int] = None
+    ) -> None:
+        self.size = size
+        self.cycle_time = cycle_time
+        self.min_distance = min_distance
+        self._solutions: list[EliteSolution] = []
+
+    def __len__(self) -> int:
+        return len(self._solutions)
+
+    def __iter__(self) -> Iterator[EliteSolution]:
+        """Iterate over the solutions from the best to the worst."""
+        return iter(self._solutions)
+
+    def __getitem__(self, index: int) -> EliteSolution:
+        return self._solutions[index]
+
+    def evaluate(self, sequence: TaskList) -> EliteSolution:
+        """Returns the sequence with its number of stations and objective."""
+        evaluator = SwapEvaluator(sequence, self.cycle_time, balanced_station_objective)
+        return EliteSolution(sequence, evaluator.num_stations, evaluator.objective)
+
+    def add(self, sequence: TaskList) -> bool:
+        """Adds the sequence to the pool, returns True if it was added."""
+        candidate = self.evaluate(sequence)
+        min_distance = self.min_distance or default_min_distance(len(sequence))
+
+        similar = [
+            solution
+            for solution in self._solutions
+            if distance(solution.sequence, sequence) < min_distance
+        ]
+        if any(solution.value <= candidate.value for solution in similar):
+            return False
+
+        if not similar and len(self._solutions) >= self.size:
+            if candidate.value >= self._solutions[-1].value:
+                return False
+            similar = [self._solutions[-1]]
+
+        self._solutions = [
+            solution for solution in self._solutions if solution not in similar
+        ]
+        self._solutions.append(candidate)
+        self._solutions.sort(key=lambda solution: solution.value)
+        return True
+
+
+def distance(sequence: TaskList, other: TaskList) -> int:
+    """Returns the number of positions at which the sequences hold different tasks."""
+    return sum(task.id != other_task.id for task, other_task in zip(sequence, other))
+
+
+def default_min_distance(num_tasks: int) -> int:
+    """Returns the default minimum distance of sequences of `num_tasks` tasks."""
+    return max(2, num_tasks // 10)
@@ -1,59 +1,328 @@
-import copy
+import logging
 import random
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import count, islice
+from typing import Generator, Iterator, Optional
 
+from sualbsp_solver import profiling
 from sualbsp_solver.data_model.graph import Graph
 from sualbsp_solver.data_model.station import Station
 from sualbsp_solver.data_model.task_list import TaskList
+from sualbsp_solver.solver.construction import ConstructionState
+from sualbsp_solver.solver.elite_pool import ElitePool
 from sualbsp_solver.solver.local_search import improve_solution
+from sualbsp_solver.solver.lower_bound import lower_bound
+from sualbsp_solver.solver.neighbourhood import NeighbourhoodStrategy
 from sualbsp_solver.solver.optimizer import OptimizationProcedure
+from sualbsp_solver.solver.path_relinking import path_relinking
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Incumbent:
+    """Best solution of a GRASP run after `iteration` iterations and `runtime` seconds."""
+
+    solution: list[Station]
+    iteration: int
+    runtime: float
+
+    @property
+    def num_stations(self) -> int:
+        return len(self.solution)
 
 
 class GRASP(OptimizationProcedure):
-    """TODO Docstring"""
+    """Greedy Randomized Adaptive Search Procedure (GRASP).
+
+    Each iteration constructs a solution with a randomized greedy procedure and improves it by
+    local search. The best solution is the first one with the fewest stations.
+
+    The run stops after `num_iter` iterations, once `time_limit` seconds have passed or once
+    the best solution has at most `target_stations` stations or reaches the lower bound of the
+    instance, whichever comes first. At least one iteration is completed, the local search of
+    an iteration stops at the time limit and at the target. Without `num_iter`, a time limit is
+    required.
+
+    The iterations are independent of each other. Each iteration draws from its own random
+    generator, seeded from a sequence derived from `seed`, so the iterations can be run on
+    `workers` processes and the result only depends on `seed` unless the time limit is hit.
+    Without a seed, the seed is drawn from the global random generator.
+
+    The neighbourhood strategy of the local search defaults to best improvement.
+
+    With an `elite_size`, the run keeps a pool of the best diverse task sequences. Each new
+    solution is relinked with a random elite sequence and the best sequence on the path takes
+    its place if it is better. The elite sequences differ in at least `elite_distance`
+    positions, by default in a tenth of the tasks."""
+
+    # width of the restricted candidate list, between 0 (greedy) and 1 (random)
+    alpha: float = 0.3
+
+    def __init__(
+        self,
+        num_iter: Optional[int],
+        seed: Optional[int] = None,
+        workers: int = 1,
+        neighbourhood: Optional[NeighbourhoodStrategy] = None,
+        time_limit: Optional[float] = None,
+        target_stations: Optional[int] = None,
+        elite_size: int = 0,
+        elite_distance: Optional[int] = None,
+    ) -> None:
+        if num_iter is None and time_limit is None:
+            raise ValueError("GRASP needs a number of iterations or a time limit.")
 
-    def __init__(self, num_iter: int) -> None:
         self.num_iter = num_iter
+        self.seed = seed
+        self.workers = workers
+        self.neighbourhood = neighbourhood
+        self.time_limit = time_limit
+        self.target_stations = target_stations
+        self.elite_size = elite_size
+        self.elite_distance = elite_distance
+
+    def describe(self) -> str:
+        parts = [f"{self}"]
+        if self.num_iter is not None:
+            parts.append(f"{self.num_iter}")
+        if self.time_limit is not None:
+            parts.append(f"{self.time_limit:g}s")
+        if self.target_stations is not None:
+            parts.append(f"target{self.target_stations}")
+        if self.elite_size:
+            parts.append(f"elite{self.elite_size}")
+            if self.elite_distance is not None:
+                parts.append(f"distance{self.elite_distance}")
+        if self.neighbourhood is not None:
+            parts.append(f"{self.neighbourhood}")
+        return "-".join(parts)
+
+    def is_deterministic(self) -> bool:
+        """GRASP is deterministic with a seed, unless a time limit stops it."""
+        return self.seed is not None and self.time_limit is None
 
     def solve(self, instance: Graph) -> list[Station]:
-        print(f"Applying GRASP-{self.num_iter} Metaheuristic")
+        logger.info("Applying %s Metaheuristic", self.describe())
 
         best_solution: list[Station] = []
-        for iteration in range(1, self.num_iter + 1):
-            # print(f"\t>>> Iteration #{iteration}")
+        for incumbent in self.incumbents(instance):
+            best_solution = incumbent.solution
+
+        return best_solution
 
-            # get a mutable copy of the original task list
-            candidate_list = TaskList(copy.deepcopy(instance.tasks))
+    def incumbents(self, instance: Graph) -> Iterator[Incumbent]:
+        """Runs the iterations and yields the best solution whenever it improves. The last
+        yielded solution is the result of solve(). Closing the generator stops the run."""
 
-            solution = self.construct_solution(candidate_list, instance.cycle_time)
-            improved_solution = improve_solution(solution, instance.cycle_time)
+        start_time = time.monotonic()
+        stations_to_reach = self.get_stations_to_reach(instance)
+        deadline = start_time + self.time_limit if self.time_limit is not None else None
 
-            # the best solution has the lowest number of stations
-            if iteration == 1:
-                best_solution = improved_solution
-            elif len(improved_solution) < len(best_solution):
-                best_solution = improved_solution
+        iterations = self.get_iterations()
+        solutions: Generator[tuple[float, list[Station]], None, None]
+        if self.workers > 1 and self.num_iter != 1:
+            solutions = self._run_iterations_in_parallel(instance, iterations, deadline)
+        else:
+            solutions = (
+                (alpha, self.run_iteration(instance, seed, deadline, alpha))
+                for seed, alpha in iterations
+            )
 
-        return best_solution
+        elite_pool = None
+        if self.elite_size:
+            elite_pool = ElitePool(
+                self.elite_size, instance.cycle_time, self.elite_distance
+            )
+            relinking_rng = random.Random(
+                f"{self.seed}-relinking" if self.seed is not None else None
+            )
+
+        best_solution: Optional[list[Station]] = None
+        try:
+            for iteration, (alpha, solution) in enumerate(solutions, start=1):
+                self.record_iteration(alpha, solution)
+
+                if elite_pool is not None:
+                    solution = self.relink(
+                        solution, elite_pool, instance.cycle_time, relinking_rng
+                    )
+
+                # the best solution has the lowest number of stations
+                if best_solution is None or len(solution) < len(best_solution):
+                    best_solution = solution
+                    yield Incumbent(solution, iteration, time.monotonic() - start_time)
+
+                    if len(best_solution) <= stations_to_reach:
+                        break
+
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+        finally:
+            solutions.close()
+
+    def relink(
+        self,
+        solution: list[Station],
+        elite_pool: ElitePool,
+        cycle_time: int,
+        rng: random.Random,
+    ) -> list[Station]:
+        """Relinks the solution with a random sequence of the elite pool and offers both the
+        solution and the best sequence on the path to the pool. Returns the better of them."""
+
+        sequence = TaskList.from_solution(solution)
+        best = elite_pool.evaluate(sequence)
+
+        if len(elite_pool):
+            guiding = rng.choice(list(elite_pool)).sequence
+            with profiling.timer("path_relinking"):
+                relinked = path_relinking(sequence, guiding, cycle_time)
+            if relinked.value < best.value:
+                elite_pool.add(relinked.sequence)
+                best = relinked
+
+        elite_pool.add(sequence)
+        if best.sequence is sequence:
+            return solution
+        return best.sequence.reassemble(cycle_time)
+
+    def get_stations_to_reach(self, instance: Graph) -> int:
+        """Returns the number of stations at which the run stops: the lower bound of the
+        instance or the target, if it is larger."""
+        bound = lower_bound(instance.compile())
+        if self.target_stations is not None:
+            return max(bound, self.target_stations)
+        return bound
+
+    def get_iteration_seeds(self) -> Iterator[int]:
+        """Yields one seed per iteration, derived from the seed of the procedure.
+        Without a number of iterations, the seeds are unlimited."""
+        seed = self.seed if self.seed is not None else random.getrandbits(64)
+        seed_sequence = random.Random(seed)
+        iterations = range(self.num_iter) if self.num_iter is not None else count()
+        for _ in iterations:
+            yield seed_sequence.getrandbits(64)
+
+    def get_iterations(self) -> Iterator[tuple[int, float]]:
+        """Yields the seed and the alpha of each iteration. An iteration is only drawn when it
+        is started, after the solutions of the previous iterations have been recorded, except
+        for the iterations that are submitted ahead to the processes of a parallel run."""
+        for seed in self.get_iteration_seeds():
+            yield seed, self.alpha
+
+    def record_iteration(self, alpha: float, solution: list[Station]) -> None:
+        """Called with the alpha and the solution of each iteration, in iteration order."""
+        pass
+
+    def run_iteration(
+        self,
+        instance: Graph,
+        seed: int,
+        deadline: Optional[float] = None,
+        alpha: Optional[float] = None,
+    ) -> list[Station]:
+        """Construct a solution and improve it, using a random generator seeded with `seed`.
+        The local search stops at the `deadline` in terms of time.monotonic()."""
+        rng = random.Random(seed)
+        profiling.count("iterations")
+
+        with profiling.timer("construction"):
+            solution = self.construct_solution(instance, rng, alpha)
+        profiling.count("constructions")
+
+        with profiling.timer("local_search"):
+            return improve_solution(
+                solution,
+                instance.cycle_time,
+                rng=rng,
+                neighbourhood=self.neighbourhood,
+                deadline=deadline,
+                min_stations=self.get_stations_to_reach(instance),
+            )
+
+    def _run_iterations_in_parallel(
+        self,
+        instance: Graph,
+        iterations: Iterator[tuple[int, float]],
+        deadline: Optional[float] = None,
+    ) -> Generator[tuple[float, list[Station]], None, None]:
+        """Runs the iterations on a pool of processes and yields the solutions in the order of
+        the iterations. The instance is sent to each process once and the processes return
+        task sequences, which are reassembled here. At most two iterations per process are
+        submitted ahead; when the generator is closed, the pending iterations are cancelled
+        without waiting for the running ones. If profiling is active, the processes profile
+        their iterations and the profiles are merged into the active one."""
+
+        workers = self.workers
+        if self.num_iter is not None:
+            workers = min(workers, self.num_iter)
+
+        # the processes do not share the monotonic clock, so they get a wall-clock deadline
+        wall_deadline = None
+        if deadline is not None:
+            wall_deadline = time.time() + deadline - time.monotonic()
+
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_worker,
+            initargs=(self, instance),
+        )
+        pending: deque[tuple[float, Future]] = deque()
+        profile = profiling.active_profile()
+
+        def submit(num_iterations: int) -> None:
+            for seed, alpha in islice(iterations, num_iterations):
+                future = executor.submit(
+                    _run_worker_iteration,
+                    seed,
+                    alpha,
+                    wall_deadline,
+                    profile is not None,
+                )
+                pending.append((alpha, future))
+
+        try:
+            submit(2 * workers)
+            while pending:
+                alpha, future = pending.popleft()
+                sequence, worker_profile = future.result()
+                if profile is not None:
+                    profile.merge(worker_profile)
+                submit(1)
+                yield alpha, TaskList(
+                    [instance.tasks[task_id] for task_id in sequence]
+                ).reassemble(instance.cycle_time)
+        finally:
+            executor.shutdown(wait=not pending, cancel_futures=True)
 
     def construct_solution(
-        self, candidate_list: TaskList, cycle_time: int
+        self,
+        instance: Graph,
+        rng: Optional[random.Random] = None,
+        alpha: Optional[float] = None,
     ) -> list[Station]:
-        """Takes a `candidate_list` and assigns them to Stations with `cycle_time`.
+        """Assigns the tasks of `instance` to Stations with the instances cycle time.
+        Draws from `rng` if given, otherwise from the global random generator. The restricted
+        candidate lists have the width `alpha`, by default the alpha of the procedure."""
+
+        if alpha is None:
+            alpha = self.alpha
 
-        TODO: self is never used
-        """
+        cycle_time = instance.cycle_time
+        state = ConstructionState(instance)
 
         # Initialise solution with one empty station
         stations = [Station(cycle_time)]
         current_station = stations[-1]
 
-        while len(candidate_list):
+        while len(state):
 
-            # Condition 1: candidates are tasks that have no precedence relations
-            candidates = candidate_list.get_tasks_without_predecessors()
-
-            # Condition 2: tasks fit into the current station
-            candidates = candidates.get_tasks_that_fit_station(current_station)
+            # candidates are tasks without unassigned predecessors that fit into the station
+            candidates = state.get_tasks_that_fit(current_station)
 
             # if there are no candidates for the current station open a new empty station
             if not len(candidates):
@@ -65,7 +334,7 @@ class GRASP(OptimizationProcedure):
             greedy_indices = self.get_greedy_indices(candidates, current_station)
 
             # Compute threshold function
-            threshold = self.get_greedy_threshold(greedy_indices, alpha=0.3)
+            threshold = self.get_greedy_threshold(greedy_indices, alpha)
 
             # Find candidates that fulfill a threshold condition
             restricted_candidates = self.get_restricted_candidates(
@@ -73,14 +342,14 @@ class GRASP(OptimizationProcedure):
             )
 
             # next task to be sequenced is picked randomly from the restricted candidate list
-            next_task = random.choice(restricted_candidates)
+            if rng is not None:
+                next_task = rng.choice(restricted_candidates)
+            else:
+                next_task = random.choice(restricted_candidates)
 
-            # assign the next task to the current station and remove it from candidate list
+            # assign the next task to the current station and release its successors
             current_station.add_task(next_task)
-            candidate_list.remove(next_task)
-
-            # Remove the next task as a predecessor from all other candidates
-            candidate_list.remove_from_predecessors(next_task)
+            state.assign(next_task)
 
         return stations
 
@@ -118,3 +387,37 @@ class GRASP(OptimizationProcedure):
                 if greedy_index <= threshold
             ]
         )
+
+
+# State of a worker process running GRASP iterations, set once by the pool initializer
+_worker_grasp: Optional[GRASP] = None
+_worker_instance: Optional[Graph] = None
+
+
+def _initialize_worker(grasp: GRASP, instance: Graph) -> None:
+    global _worker_grasp, _worker_instance
+    _worker_grasp = grasp
+    _worker_instance = instance
+
+
+def _run_worker_iteration(
+    seed: int, alpha: float, wall_deadline: Optional[float], profile: bool
+) -> tuple[list[int], Optional[dict]]:
+    """Runs one iteration in a worker process and returns the ids of the sequenced tasks and,
+    if `profile` is True, the profile of the iteration. The deadline is given in terms of
+    time.time()."""
+    assert _worker_grasp is not None and _worker_instance is not None
+
+    deadline = None
+    if wall_deadline is not None:
+        deadline = time.monotonic() + wall_deadline - time.time()
+
+    if not profile:
+        solution = _worker_grasp.run_iteration(_worker_instance, seed, deadline, alpha)
+        return [task.id for station in solution for task in station], None
+
+    with profiling.profiling() as iteration_profile:
+        solution = _worker_grasp.run_iteration(_worker_instance, seed, deadline, alpha)
+    return [task.id for station in solution for task in station], (
+        iteration_profile.as_dict()
+    )
@@ -1,21 +1,46 @@
 import copy
 import random
-from typing import Callable
+import time
+from typing import Callable, Optional
 
+from sualbsp_solver import profiling
 from sualbsp_solver.data_model import Station, TaskList
+from sualbsp_solver.solver import accelerated
+from sualbsp_solver.solver.neighbourhood import BestImprovement, NeighbourhoodStrategy
+from sualbsp_solver.solver.swap_evaluator import (
+    StationObjective,
+    SwapEvaluator,
+    accumulate,
+)
+
+
+def balanced_station_objective(station_time: int, cycle_time: int) -> float:
+    """Contribution of a single station to the balanced objective"""
+    # plain arithmetic, so that the accelerated backend gives identical values
+    load = station_time / cycle_time
+    return load * load
+
+
+def imbalanced_station_objective(
+    station_time: int, cycle_time: int, eps: float = 0.001
+) -> float:
+    """Contribution of a single station to the imbalanced objective"""
+    return 1 / (cycle_time - station_time + eps)
 
 
 def balanced_objective(solution: list[Station]) -> float:
     """MINIMIZE the objective to create solutions with a balanced workload"""
-    return sum(
-        pow(station.station_time / station.cycle_time, 2) for station in solution
+    return accumulate(
+        balanced_station_objective(station.station_time, station.cycle_time)
+        for station in solution
     )
 
 
 def imbalanced_objective(solution: list[Station], eps: float = 0.001) -> float:
     """MAXIMIZE the objective to create solutions with an imbalanced workload"""
-    return sum(
-        pow(station.cycle_time - station.station_time + eps, -1) for station in solution
+    return accumulate(
+        imbalanced_station_objective(station.station_time, station.cycle_time, eps)
+        for station in solution
     )
 
 
@@ -29,81 +54,79 @@ def imbalanced_variation(objective1: float, objective2: float) -> float:
     return objective2 - objective1
 
 
-def get_objective_functions(probability_threshold: float) -> tuple[Callable, Callable]:
-    """Returns two objective functions based on a random behaviour."""
-    if random.random() <= probability_threshold:
-        return balanced_objective, balanced_variation
+def get_objective_functions(
+    probability_threshold: float, rng: Optional[random.Random] = None
+) -> tuple[Callable, Callable]:
+    """Returns a station objective and the matching variation based on a random behaviour.
+    Draws from `rng` if given, otherwise from the global random generator."""
+    value = rng.random() if rng is not None else random.random()
+    if value <= probability_threshold:
+        return balanced_station_objective, balanced_variation
     else:
-        return imbalanced_objective, imbalanced_variation
+        return imbalanced_station_objective, imbalanced_variation
+
+
+def create_evaluator(
+    sequence: TaskList, cycle_time: int, station_objective: StationObjective
+) -> SwapEvaluator:
+    """Returns a SwapEvaluator for the sequence, which evaluates exchanges in compiled code if
+    the numba backend is selected, see `accelerated.set_backend`."""
+    if accelerated.get_backend() == "numba":
+        if station_objective is balanced_station_objective:
+            return accelerated.AcceleratedSwapEvaluator(
+                sequence, cycle_time, station_objective, accelerated.BALANCED
+            )
+        if station_objective is imbalanced_station_objective:
+            return accelerated.AcceleratedSwapEvaluator(
+                sequence, cycle_time, station_objective, accelerated.IMBALANCED
+            )
+    return SwapEvaluator(sequence, cycle_time, station_objective)
 
 
 def improve_solution(
-    solution: list[Station], cycle_time: int, probability_threshold: float = 0.75
+    solution: list[Station],
+    cycle_time: int,
+    probability_threshold: float = 0.75,
+    rng: Optional[random.Random] = None,
+    neighbourhood: Optional[NeighbourhoodStrategy] = None,
+    deadline: Optional[float] = None,
+    min_stations: Optional[int] = None,
 ) -> list[Station]:
-    """Try to improve a solution by exchanging the position of tasks."""
+    """Try to improve a solution by exchanging the position of tasks. The neighbourhood
+    strategy decides which exchanges are evaluated and applied, by default the best one.
+    If a `deadline` in terms of time.monotonic() is given, the search stops before the next
+    search of the neighbourhood once the deadline has passed. It also stops once the solution
+    has no more than `min_stations` stations, e.g. a lower bound of the instance."""
+
+    if neighbourhood is None:
+        neighbourhood = BestImprovement()
 
     # create a flattened version of the solution
     solution_sequence = TaskList.from_solution(solution)
-    num_tasks = len(solution_sequence)
 
     current_sequence = copy.copy(solution_sequence)
 
-    while True:
-        # Container for valid solutions
-        valid_solutions = []
-
+    while deadline is None or time.monotonic() < deadline:
         # Randomly choose the objective functions
-        calculate_objective, calculate_variation = get_objective_functions(
-            probability_threshold
+        station_objective, calculate_variation = get_objective_functions(
+            probability_threshold, rng
         )
 
         # initialise current solution
-        current_solution = current_sequence.reassemble(cycle_time)
-        current_solution_value = calculate_objective(current_solution)
-        num_stations_current = len(current_solution)
-
-        """Iterate over all tasks but the last one and check
-        if an exchange with a task on the right is feasible"""
-        for i in range(num_tasks - 1):
-
-            for j in range(i + 1, num_tasks):
-                right_task = current_sequence[j]
-
-                # The exchange is feasible if right_task has no predecessors on his left in the sequence
-                if any(
-                    left_task.is_predecessor_of(right_task)
-                    for left_task in current_sequence[i:j]
-                ):
-                    print(f">>> Task {right_task} has predecessory")
-                    break
-
-                # Exchange the tasks and reassemble the modified sequence
-                modified_sequence = current_sequence.swap_tasks(i, j)
-                modified_solution = modified_sequence.reassemble(cycle_time)
-
-                # Save the modified sequence if at least as good than the current one
-                num_stations_modified = len(modified_solution)
-                if num_stations_modified <= num_stations_current:
-                    modified_solution_value = calculate_objective(modified_solution)
-                    variation = calculate_variation(
-                        modified_solution_value, current_solution_value
-                    )
-
-                    valid_solutions.append((num_stations_modified, variation, (i, j)))
-
-        """Find the best of all exchanges"""
-        # get best value in order min(m), min(var), min(key)
-        best_exchange = min(valid_solutions)
-        best_exchange_m = best_exchange[0]
-        best_exchange_variation = best_exchange[1]
-        i, j = best_exchange[2]
-
-        # is best_exchange better than current_solution?
-        has_fewer_stations = best_exchange_m < num_stations_current
-        has_positive_variation = best_exchange_variation < 0
-
-        if has_fewer_stations | has_positive_variation:
-            current_sequence = current_sequence.swap_tasks(i, j)
+        evaluator = create_evaluator(current_sequence, cycle_time, station_objective)
+        if min_stations is not None and evaluator.num_stations <= min_stations:
+            break
+
+        # Search the neighbourhood for an exchange that improves the current solution
+        exchange = neighbourhood.select_exchange(
+            current_sequence, evaluator, calculate_variation, rng
+        )
+        profiling.count("neighbourhood_searches")
+        profiling.count("evaluations", evaluator.num_evaluations)
+
+        if exchange is not None:
+            profiling.count("accepted_moves")
+            current_sequence = current_sequence.swap_tasks(*exchange)
         else:
             # Current sequence can't be improved -> end while-loop
             break
@@ -0,0 +1,134 @@
+from weakref import WeakKeyDictionary
+
+from sualbsp_solver.data_model import CompiledGraph
+
+# Lower bounds of the compiled instances, computed once per instance
+_lower_bounds: WeakKeyDictionary[CompiledGraph, int] = WeakKeyDictionary()
+
+
+def lower_bound(compiled: CompiledGraph) -> int:
+    """Returns the best of the lower bounds on the number of stations of the instance.
+
+    A station holds its tasks one after another, with a setup time between consecutive tasks
+    and no setup in front of the first task, so m stations for n tasks contain n - m setups.
+    """
+    if compiled not in _lower_bounds:
+        _lower_bounds[compiled] = max(
+            setup_bound(compiled),
+            bin_packing_bound(compiled),
+            incompatibility_bound(compiled),
+        )
+    return _lower_bounds[compiled]
+
+
+def setup_bound(compiled: CompiledGraph) -> int:
+    """Returns the smallest number of stations m whose capacity m * c is at least the total
+    processing time plus the n - m smallest of the minimum setup times into a task. The same
+    bound is computed for the minimum setup times out of a task and the larger one returned."""
+
+    num_tasks = compiled.num_tasks
+    if not num_tasks:
+        return 0
+
+    setups_out = sorted(
+        min(
+            (
+                setup_time
+                for j, setup_time in enumerate(compiled.setup_row(i))
+                if j != i
+            ),
+            default=0,
+        )
+        for i in range(num_tasks)
+    )
+    setups_in = sorted(min_setups_in(compiled))
+
+    total_processing_time = sum(compiled.processing_times)
+    cycle_time = compiled.cycle_time
+
+    bound = 0
+    for min_setups in (setups_in, setups_out):
+        # total of the k smallest minimum setup times
+        smallest_setups = [0]
+        for setup_time in min_setups:
+            smallest_setups.append(smallest_setups[-1] + setup_time)
+
+        num_stations = max(1, _ceil_div(total_processing_time, cycle_time))
+        while (
+            num_stations < num_tasks
+            and total_processing_time + smallest_setups[num_tasks - num_stations]
+            > num_stations * cycle_time
+        ):
+            num_stations += 1
+        bound = max(bound, num_stations)
+
+    return bound
+
+
+def bin_packing_bound(compiled: CompiledGraph) -> int:
+    """Returns the bound L2 of Martello and Toth (1990) on the processing times, which
+    ignores the setup times and the precedence relations."""
+
+    cycle_time = compiled.cycle_time
+    processing_times = sorted(compiled.processing_times)
+
+    bound = _ceil_div(sum(processing_times), cycle_time)
+    for k in {0, *(p for p in processing_times if 2 * p <= cycle_time)}:
+        num_large, num_medium, free_capacity, small_time = 0, 0, 0, 0
+        for processing_time in processing_times:
+            if processing_time > cycle_time - k:
+                num_large += 1
+            elif 2 * processing_time > cycle_time:
+                num_medium += 1
+                free_capacity += cycle_time - processing_time
+            elif processing_time >= k:
+                small_time += processing_time
+
+        # the small tasks that do not fit into the stations of the medium tasks
+        num_stations = num_large + num_medium
+        num_stations += max(0, _ceil_div(small_time - free_capacity, cycle_time))
+        bound = max(bound, num_stations)
+
+    return bound
+
+
+def incompatibility_bound(compiled: CompiledGraph) -> int:
+    """Returns the size of a set of tasks of which no two fit into the same station. The set
+    is built greedily, starting with the longest task.
+
+    Of two tasks in a station, the later one follows some task, so the station holds at least
+    the smaller of their minimum setup times into a task. The setup time between the two tasks
+    themselves is no bound, other tasks can be placed between them."""
+
+    cycle_time = compiled.cycle_time
+    processing_times = compiled.processing_times
+    setups_in = min_setups_in(compiled)
+
+    def is_incompatible(i: int, j: int) -> bool:
+        setup_time = min(setups_in[i], setups_in[j])
+        return processing_times[i] + processing_times[j] + setup_time > cycle_time
+
+    incompatible_tasks: list[int] = []
+    for task in sorted(
+        range(compiled.num_tasks), key=lambda task: -processing_times[task]
+    ):
+        if all(is_incompatible(task, other) for other in incompatible_tasks):
+            incompatible_tasks.append(task)
+
+    return len(incompatible_tasks)
+
+
+def min_setups_in(compiled: CompiledGraph) -> list[int]:
+    """Returns for each task the minimum setup time into it from any other task."""
+    num_tasks = compiled.num_tasks
+    return [
+        min(
+            (compiled.setup_time(i, j) for i in range(num_tasks) if i != j),
+            default=0,
+        )
+        for j in range(num_tasks)
+    ]
+
+
+def _ceil_div(numerator: int, denominator: int) -> int:
+    return -(-numerator // denominator)
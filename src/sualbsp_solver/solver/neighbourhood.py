@@ -0,0 +1,255 @@
+import random
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+
+from sualbsp_solver.data_model import TaskList
+from sualbsp_solver.solver.precedence import PrecedenceIndex
+from sualbsp_solver.solver.swap_evaluator import SwapEvaluator
+
+# An evaluated exchange: number of stations, variation of the objective and positions
+Exchange = tuple[int, float, tuple[int, int]]
+
+# Number of exchanges that are passed to the evaluator in one call
+BATCH_SIZE = 1024
+
+
+class NeighbourhoodStrategy(ABC):
+    """Abstract class that describes how the swap neighbourhood of a sequence is searched.
+
+    A strategy decides which exchanges of two tasks are evaluated and which of them is applied.
+    An exchange is improving if it reduces the number of stations or if it keeps the number of
+    stations and has a negative variation of the objective.
+    """
+
+    @abstractmethod
+    def select_exchange(
+        self,
+        sequence: TaskList,
+        evaluator: SwapEvaluator,
+        calculate_variation: Callable[[float, float], float],
+        rng: Optional[random.Random] = None,
+    ) -> Optional[tuple[int, int]]:
+        """Returns the positions of the exchange to apply or None if there is no improving one."""
+        pass
+
+    def __str__(self):
+        return self.__class__.__name__
+
+
+class BestImprovement(NeighbourhoodStrategy):
+    """Evaluates the full neighbourhood and applies the best exchange if it is improving"""
+
+    def select_exchange(
+        self,
+        sequence: TaskList,
+        evaluator: SwapEvaluator,
+        calculate_variation: Callable[[float, float], float],
+        rng: Optional[random.Random] = None,
+    ) -> Optional[tuple[int, int]]:
+        exchanges = evaluate_all_exchanges(
+            evaluator,
+            calculate_variation,
+            feasible_exchanges(sequence, range(len(sequence) - 1)),
+        )
+        return select_best(exchanges, evaluator.num_stations)
+
+
+class FirstImprovement(NeighbourhoodStrategy):
+    """Applies the first improving exchange, scanning the positions from left to right"""
+
+    def select_exchange(
+        self,
+        sequence: TaskList,
+        evaluator: SwapEvaluator,
+        calculate_variation: Callable[[float, float], float],
+        rng: Optional[random.Random] = None,
+    ) -> Optional[tuple[int, int]]:
+        exchanges = evaluate_exchanges(
+            evaluator,
+            calculate_variation,
+            feasible_exchanges(sequence, range(len(sequence) - 1)),
+        )
+        return select_first(exchanges, evaluator.num_stations)
+
+
+class RandomizedFirstImprovement(NeighbourhoodStrategy):
+    """Applies the first improving exchange, scanning the left positions in random order"""
+
+    def select_exchange(
+        self,
+        sequence: TaskList,
+        evaluator: SwapEvaluator,
+        calculate_variation: Callable[[float, float], float],
+        rng: Optional[random.Random] = None,
+    ) -> Optional[tuple[int, int]]:
+        positions = list(range(len(sequence) - 1))
+        if rng is not None:
+            rng.shuffle(positions)
+        else:
+            random.shuffle(positions)
+
+        exchanges = evaluate_exchanges(
+            evaluator,
+            calculate_variation,
+            feasible_exchanges(sequence, positions),
+        )
+        return select_first(exchanges, evaluator.num_stations)
+
+
+class BottleneckCandidates(NeighbourhoodStrategy):
+    """Only evaluates exchanges that move a task in or out of one of the `num_bottlenecks`
+    stations with the highest station time and applies the best one if it is improving"""
+
+    def __init__(self, num_bottlenecks: int = 2) -> None:
+        self.num_bottlenecks = num_bottlenecks
+
+    def select_exchange(
+        self,
+        sequence: TaskList,
+        evaluator: SwapEvaluator,
+        calculate_variation: Callable[[float, float], float],
+        rng: Optional[random.Random] = None,
+    ) -> Optional[tuple[int, int]]:
+        bottlenecks = set(
+            sorted(
+                range(evaluator.num_stations),
+                key=lambda station: evaluator.station_times[station],
+                reverse=True,
+            )[: self.num_bottlenecks]
+        )
+        candidates = [
+            position
+            for position, station in enumerate(evaluator.station_of)
+            if station in bottlenecks
+        ]
+
+        exchanges = evaluate_all_exchanges(
+            evaluator,
+            calculate_variation,
+            candidate_exchanges(sequence, candidates),
+        )
+        return select_best(exchanges, evaluator.num_stations)
+
+    def __str__(self):
+        return f"{self.__class__.__name__}-{self.num_bottlenecks}"
+
+
+def feasible_exchanges(
+    sequence: TaskList, positions: Iterable[int]
+) -> Iterator[tuple[int, int]]:
+    """Iterate over the given left positions and yield the exchanges with a task on the right
+    that keep the sequence feasible with respect to the precedence relations. The scan over
+    the right positions stops at the first task that has a predecessor between the positions."""
+    index = PrecedenceIndex(sequence)
+    for i in positions:
+        for j in range(i + 1, index.blocking_position[i]):
+            yield i, j
+
+
+def candidate_exchanges(
+    sequence: TaskList, candidates: Iterable[int]
+) -> Iterator[tuple[int, int]]:
+    """Yield each exchange that keeps the sequence feasible and moves a task at one of the
+    candidate positions once. Only the exchanges with a candidate position are generated:
+    the scan to the right of a candidate stops like in `feasible_exchanges`, the scan to the
+    left stops at the first position whose scan would not reach the candidate."""
+    index = PrecedenceIndex(sequence)
+    blocking_position = index.blocking_position
+    candidates = sorted(set(candidates))
+    is_candidate = set(candidates)
+
+    for i in candidates:
+        for j in range(i + 1, blocking_position[i]):
+            yield i, j
+
+    # the blocking positions do not decrease from left to right
+    for j in candidates:
+        i = j - 1
+        while i >= 0 and blocking_position[i] > j:
+            if i not in is_candidate:
+                yield i, j
+            i -= 1
+
+
+def evaluate_exchanges(
+    evaluator: SwapEvaluator,
+    calculate_variation: Callable[[float, float], float],
+    exchanges: Iterable[tuple[int, int]],
+) -> Iterator[Exchange]:
+    """Evaluate the exchanges one by one and yield those that do not increase the number of
+    stations."""
+    for i, j in exchanges:
+
+        # Evaluate the exchange of the tasks, skipping sequences with more stations
+        evaluation = evaluator.evaluate_swap(i, j, max_stations=evaluator.num_stations)
+
+        if evaluation is not None:
+            yield to_exchange(evaluator, calculate_variation, (i, j), evaluation)
+
+
+def evaluate_all_exchanges(
+    evaluator: SwapEvaluator,
+    calculate_variation: Callable[[float, float], float],
+    exchanges: Iterable[tuple[int, int]],
+) -> Iterator[Exchange]:
+    """Like `evaluate_exchanges`, but evaluates the exchanges in batches of BATCH_SIZE per
+    call of the evaluator, which an accelerated evaluator runs in compiled code. The batches
+    are taken lazily from `exchanges`."""
+    exchanges = iter(exchanges)
+    while batch := list(islice(exchanges, BATCH_SIZE)):
+        evaluations = evaluator.evaluate_swaps(
+            batch, max_stations=evaluator.num_stations
+        )
+        for exchange, evaluation in zip(batch, evaluations):
+            if evaluation is not None:
+                yield to_exchange(evaluator, calculate_variation, exchange, evaluation)
+
+
+def to_exchange(
+    evaluator: SwapEvaluator,
+    calculate_variation: Callable[[float, float], float],
+    positions: tuple[int, int],
+    evaluation: tuple[int, float],
+) -> Exchange:
+    num_stations_modified, modified_solution_value = evaluation
+    variation = calculate_variation(modified_solution_value, evaluator.objective)
+    return num_stations_modified, variation, positions
+
+
+def is_improving(exchange: Exchange, num_stations_current: int) -> bool:
+    """Returns True if the exchange is better than the current solution"""
+    num_stations, variation, _ = exchange
+    has_fewer_stations = num_stations < num_stations_current
+    has_positive_variation = variation < 0
+    return has_fewer_stations or has_positive_variation
+
+
+def select_best(
+    exchanges: Iterable[Exchange], num_stations_current: int
+) -> Optional[tuple[int, int]]:
+    """Returns the best of all exchanges if it is improving"""
+    # get best value in order min(m), min(var), min(key)
+    best_exchange = min(exchanges, default=None)
+    if best_exchange is None or not is_improving(best_exchange, num_stations_current):
+        return None
+    return best_exchange[2]
+
+
+def select_first(
+    exchanges: Iterable[Exchange], num_stations_current: int
+) -> Optional[tuple[int, int]]:
+    """Returns the first improving exchange"""
+    for exchange in exchanges:
+        if is_improving(exchange, num_stations_current):
+            return exchange[2]
+    return None
+
+
+def get_neighbourhood_strategies() -> list[NeighbourhoodStrategy]:
+    return [
+        BestImprovement(),
+        FirstImprovement(),
+        RandomizedFirstImprovement(),
+        BottleneckCandidates(),
+    ]
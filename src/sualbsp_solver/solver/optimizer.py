@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from sualbsp_solver.data_model import Graph, Station, TaskList
+from sualbsp_solver.data_model import Graph, Station
 
 
 class OptimizationProcedure(ABC):
@@ -32,10 +32,16 @@ class OptimizationProcedure(ABC):
         pass
 
     @abstractmethod
-    def construct_solution(
-        self, candidate_list: TaskList, cycle_time: int
-    ) -> list[Station]:
+    def construct_solution(self, instance: Graph) -> list[Station]:
         pass
 
     def __str__(self) -> str:
         return self.__class__.__name__
+
+    def describe(self) -> str:
+        """Returns a string that identifies the procedure and its configuration."""
+        return str(self)
+
+    def is_deterministic(self) -> bool:
+        """Returns True if the procedure always finds the same solution of an instance."""
+        return True
@@ -0,0 +1,68 @@
+from sualbsp_solver import profiling
+from sualbsp_solver.data_model import TaskList
+from sualbsp_solver.solver.elite_pool import EliteSolution
+from sualbsp_solver.solver.local_search import balanced_station_objective
+from sualbsp_solver.solver.swap_evaluator import SwapEvaluator
+
+
+def path_relinking(
+    initial: TaskList, guiding: TaskList, cycle_time: int
+) -> EliteSolution:
+    """Walks from the initial towards the guiding sequence and returns the best sequence on
+    the path, starting with the initial sequence.
+
+    Each step exchanges two tasks so that one more position holds the task of the guiding
+    sequence. Of all such exchanges that keep the precedence relations, the step applies the
+    one whose sequence reassembles to the fewest stations and the lowest balanced objective.
+    The walk stops at the guiding sequence or when no exchange keeps the precedence relations.
+    """
+
+    evaluator = SwapEvaluator(initial, cycle_time, balanced_station_objective)
+    best = EliteSolution(initial, evaluator.num_stations, evaluator.objective)
+
+    # the evaluator holds the current sequence and is updated by each step
+    current = evaluator.tasks
+    position = {task.id: index for index, task in enumerate(current)}
+    successors: dict[int, list[int]] = {task.id: [] for task in current}
+    for task in current:
+        for predecessor in task.predecessors:
+            if predecessor in successors:
+                successors[predecessor].append(task.id)
+
+    def is_feasible_exchange(pos1: int, pos2: int) -> bool:
+        """Returns True if no predecessor of the right task is in [pos1, pos2) and no
+        successor of the left task is in (pos1, pos2], see PrecedenceIndex."""
+        return all(
+            not pos1 <= position.get(predecessor, pos2) < pos2
+            for predecessor in current[pos2].predecessors
+        ) and all(
+            not pos1 < position[successor] <= pos2
+            for successor in successors[current[pos1].id]
+        )
+
+    while True:
+        best_step = None
+        for pos1, task in enumerate(guiding):
+            pos2 = position[task.id]
+            if pos2 == pos1:
+                continue
+
+            exchange = (min(pos1, pos2), max(pos1, pos2))
+            if not is_feasible_exchange(*exchange):
+                continue
+
+            value = evaluator.evaluate_swap(*exchange)
+            if value is not None and (best_step is None or value < best_step[0]):
+                best_step = (value, exchange)
+
+        if best_step is None:
+            return best
+
+        (num_stations, objective), (pos1, pos2) = best_step
+        profiling.count("relinking_steps")
+        evaluator.apply_swap(pos1, pos2)
+        position[current[pos1].id] = pos1
+        position[current[pos2].id] = pos2
+
+        if (num_stations, objective) < best.value:
+            best = EliteSolution(TaskList(list(current)), num_stations, objective)
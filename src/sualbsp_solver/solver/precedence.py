@@ -0,0 +1,51 @@
+from sualbsp_solver.data_model import TaskList
+
+
+class PrecedenceIndex:
+    """Positions of the direct precedence relations within a sequence of tasks.
+
+    For each position the index holds the position of the latest direct predecessor on the
+    left and of the earliest direct successor on the right. For each left position i of an
+    exchange it also holds the earliest position j > i whose task has a direct predecessor at
+    a position in [i, j), at which the scan over the right positions stops. Building the index
+    takes O(n + p), each lookup afterwards O(1).
+    """
+
+    def __init__(self, sequence: TaskList) -> None:
+        num_tasks = len(sequence)
+        position = {task.id: index for index, task in enumerate(sequence)}
+
+        self.latest_predecessor = [-1] * num_tasks
+        self.earliest_successor = [num_tasks] * num_tasks
+        for index, task in enumerate(sequence):
+            for predecessor in task.predecessors:
+                predecessor_position = position.get(predecessor, num_tasks)
+                if predecessor_position >= index:
+                    continue
+                if predecessor_position > self.latest_predecessor[index]:
+                    self.latest_predecessor[index] = predecessor_position
+                if index < self.earliest_successor[predecessor_position]:
+                    self.earliest_successor[predecessor_position] = index
+
+        # positions whose latest predecessor is at position i
+        blocked_by: list[list[int]] = [[] for _ in range(num_tasks)]
+        for index, predecessor_position in enumerate(self.latest_predecessor):
+            if predecessor_position >= 0:
+                blocked_by[predecessor_position].append(index)
+
+        # a position j blocks all left positions i <= latest_predecessor[j]
+        self.blocking_position = [num_tasks] * num_tasks
+        earliest_blocking = num_tasks
+        for i in reversed(range(num_tasks)):
+            for j in blocked_by[i]:
+                earliest_blocking = min(earliest_blocking, j)
+            self.blocking_position[i] = earliest_blocking
+
+    def is_feasible_exchange(self, pos1: int, pos2: int) -> bool:
+        """Returns True if exchanging the tasks at `pos1` < `pos2` keeps all precedence relations:
+        no predecessor of the right task is in [pos1, pos2) and no successor of the left task
+        is in (pos1, pos2]."""
+        return (
+            self.latest_predecessor[pos2] < pos1
+            and self.earliest_successor[pos1] > pos2
+        )
@@ -0,0 +1,138 @@
+import logging
+import random
+from typing import Iterator, Optional, Sequence
+
+from sualbsp_solver.data_model.graph import Graph
+from sualbsp_solver.data_model.station import Station
+from sualbsp_solver.solver.grasp import GRASP
+from sualbsp_solver.solver.neighbourhood import NeighbourhoodStrategy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ALPHAS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
+DEFAULT_UPDATE_INTERVAL = 5
+DEFAULT_AMPLIFICATION = 10
+
+
+class ReactiveGRASP(GRASP):
+    """GRASP that learns the width alpha of the restricted candidate lists (Prais and
+    Ribeiro, 2000).
+
+    Each iteration draws its alpha from a probability distribution over `alphas`, which starts
+    uniform. Every `update_interval` iterations, the probability of each alpha is set in
+    proportion to (best / mean) ** `amplification`, where best is the best solution value found
+    so far and mean the average value of the solutions built with the alpha. Alphas that have
+    not been drawn yet keep the highest weight of 1.
+
+    The value of a solution with m stations is m - 1 plus the load of its last station, so
+    solutions with the same number of stations are ranked by how close they are to one
+    station less.
+
+    The learned distribution is kept in `alpha_probabilities` after a run. In a parallel run,
+    the iterations submitted ahead are drawn from the distribution at the time of submission.
+    """
+
+    def __init__(
+        self,
+        num_iter: Optional[int],
+        seed: Optional[int] = None,
+        workers: int = 1,
+        neighbourhood: Optional[NeighbourhoodStrategy] = None,
+        time_limit: Optional[float] = None,
+        target_stations: Optional[int] = None,
+        elite_size: int = 0,
+        elite_distance: Optional[int] = None,
+        alphas: Sequence[float] = DEFAULT_ALPHAS,
+        update_interval: int = DEFAULT_UPDATE_INTERVAL,
+        amplification: float = DEFAULT_AMPLIFICATION,
+    ) -> None:
+        super().__init__(
+            num_iter,
+            seed,
+            workers,
+            neighbourhood,
+            time_limit,
+            target_stations,
+            elite_size,
+            elite_distance,
+        )
+        self.alphas = list(alphas)
+        self.update_interval = update_interval
+        self.amplification = amplification
+        self.reset_alpha_probabilities()
+
+    def describe(self) -> str:
+        parts = [super().describe()]
+        if tuple(self.alphas) != DEFAULT_ALPHAS:
+            parts.append("alphas" + ",".join(f"{alpha:g}" for alpha in self.alphas))
+        if self.update_interval != DEFAULT_UPDATE_INTERVAL:
+            parts.append(f"update{self.update_interval}")
+        if self.amplification != DEFAULT_AMPLIFICATION:
+            parts.append(f"amplification{self.amplification:g}")
+        return "-".join(parts)
+
+    def reset_alpha_probabilities(self) -> None:
+        """Starts over with a uniform distribution and no recorded solutions."""
+        self.alpha_probabilities = [1 / len(self.alphas)] * len(self.alphas)
+        self._num_solutions = [0] * len(self.alphas)
+        self._total_values = [0.0] * len(self.alphas)
+        self._best_value: Optional[float] = None
+
+    def get_alpha_distribution(self) -> dict[float, float]:
+        """Returns the probability of each alpha."""
+        return dict(zip(self.alphas, self.alpha_probabilities))
+
+    def solve(self, instance: Graph) -> list[Station]:
+        solution = super().solve(instance)
+
+        distribution = ", ".join(
+            f"{alpha:g}: {probability:.2f}"
+            for alpha, probability in self.get_alpha_distribution().items()
+        )
+        logger.info("Learned alpha distribution: %s", distribution)
+        return solution
+
+    def get_iterations(self) -> Iterator[tuple[int, float]]:
+        self.reset_alpha_probabilities()
+
+        # draw the alphas from their own sequence, so the iterations keep their seeds
+        alpha_rng = random.Random(
+            f"{self.seed}-alpha" if self.seed is not None else None
+        )
+        for seed in self.get_iteration_seeds():
+            (alpha,) = alpha_rng.choices(self.alphas, weights=self.alpha_probabilities)
+            yield seed, alpha
+
+    def record_iteration(self, alpha: float, solution: list[Station]) -> None:
+        value = solution_value(solution)
+        index = self.alphas.index(alpha)
+        self._num_solutions[index] += 1
+        self._total_values[index] += value
+        if self._best_value is None or value < self._best_value:
+            self._best_value = value
+
+        if sum(self._num_solutions) % self.update_interval == 0:
+            self.update_alpha_probabilities()
+
+    def update_alpha_probabilities(self) -> None:
+        """Sets the probabilities in proportion to the quality of the solutions per alpha."""
+        if not self._best_value:
+            return
+
+        weights = [
+            (self._best_value * num_solutions / total_value) ** self.amplification
+            if num_solutions
+            else 1.0
+            for num_solutions, total_value in zip(
+                self._num_solutions, self._total_values
+            )
+        ]
+        self.alpha_probabilities = [weight / sum(weights) for weight in weights]
+
+
+def solution_value(solution: list[Station]) -> float:
+    """Returns the number of stations minus the idle share of the last station."""
+    if not solution:
+        return 0.0
+    last_station = solution[-1]
+    return len(solution) - 1 + last_station.station_time / last_station.cycle_time
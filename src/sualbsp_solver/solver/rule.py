@@ -1,20 +1,51 @@
 import statistics
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
 
-from sualbsp_solver.data_model import Station, Task, TaskList
+from sualbsp_solver.data_model import CompiledGraph, Station, Task, TaskList
 
 
 class TaskOrderingRule(ABC):
     """Abstract class that decsribes a rule by which a list of tasks should be ordered.
 
+    A rule assigns a value to each candidate task and orders the candidates by their values,
+    descending if `descending` is True. Candidates with the same value keep their order.
+
     TODO: switch to functional approach for ordering rules
     """
 
+    descending: bool = False
+
     @abstractmethod
-    def order_tasks(self, candidates: TaskList, station: Station) -> TaskList:
+    def task_values(
+        self,
+        candidates: TaskList,
+        station: Station,
+        mean_setup_times: Optional[Sequence[float]] = None,
+    ) -> list[float]:
+        """Returns the value of each candidate. The mean setup times of the tasks by id are
+        computed from the tasks if not given."""
         pass
 
+    def order_tasks(self, candidates: TaskList, station: Station) -> TaskList:
+        values = self.task_values(candidates, station)
+        order = sorted(
+            range(len(candidates)), key=values.__getitem__, reverse=self.descending
+        )
+        return TaskList([candidates[index] for index in order])
+
+    def select_task(
+        self, candidates: TaskList, station: Station, graph: CompiledGraph
+    ) -> Task:
+        """Returns the first task of `order_tasks` without ordering the candidates. The mean
+        setup times are read from the compiled graph."""
+        values = self.task_values(candidates, station, graph.mean_setup_times)
+        if self.descending:
+            index = max(range(len(candidates)), key=values.__getitem__)
+        else:
+            index = min(range(len(candidates)), key=values.__getitem__)
+        return candidates[index]
+
     def __str__(self):
         return self.__class__.__name__
 
@@ -22,63 +53,111 @@ class TaskOrderingRule(ABC):
 class MaxTSOrdering(TaskOrderingRule):
     """Orders tasks by processing time plus setup time descending"""
 
-    def order_tasks(self, candidates: TaskList, station: Station) -> TaskList:
-        tasks_values = setups_plus_processing(candidates, station)
-        tasks_values_sorted = sorted(tasks_values, key=lambda x: x[1], reverse=True)
-        return TaskList([task for task, _ in tasks_values_sorted])
+    descending = True
+
+    def task_values(
+        self,
+        candidates: TaskList,
+        station: Station,
+        mean_setup_times: Optional[Sequence[float]] = None,
+    ) -> list[float]:
+        return [
+            value
+            for _, value in setups_plus_processing(
+                candidates, station, mean_setup_times
+            )
+        ]
 
 
 class MinTSOrdering(TaskOrderingRule):
     """Orders tasks by processing time plus setup time ascending"""
 
-    def order_tasks(self, candidates: TaskList, station: Station) -> TaskList:
-        tasks_values = setups_plus_processing(candidates, station)
-        tasks_values_sorted = sorted(tasks_values, key=lambda x: x[1])
-        return TaskList([task for task, _ in tasks_values_sorted])
+    descending = False
+
+    def task_values(
+        self,
+        candidates: TaskList,
+        station: Station,
+        mean_setup_times: Optional[Sequence[float]] = None,
+    ) -> list[float]:
+        return [
+            value
+            for _, value in setups_plus_processing(
+                candidates, station, mean_setup_times
+            )
+        ]
 
 
 class MaxSOrdering(TaskOrderingRule):
     """Orders tasks by setup time descending"""
 
-    def order_tasks(self, candidates: TaskList, station: Station) -> TaskList:
-        tasks_values = setups_only(candidates, station)
-        tasks_values_sorted = sorted(tasks_values, key=lambda x: x[1], reverse=True)
-        return TaskList([task for task, _ in tasks_values_sorted])
+    descending = True
+
+    def task_values(
+        self,
+        candidates: TaskList,
+        station: Station,
+        mean_setup_times: Optional[Sequence[float]] = None,
+    ) -> list[float]:
+        return [
+            value for _, value in setups_only(candidates, station, mean_setup_times)
+        ]
 
 
 class MinSOrdering(TaskOrderingRule):
     """Orders tasks by setup time ascending"""
 
-    def order_tasks(self, candidates: TaskList, station: Station) -> TaskList:
-        tasks_values = setups_only(candidates, station)
-        tasks_values_sorted = sorted(tasks_values, key=lambda x: x[1])
-        return TaskList([task for task, _ in tasks_values_sorted])
+    descending = False
+
+    def task_values(
+        self,
+        candidates: TaskList,
+        station: Station,
+        mean_setup_times: Optional[Sequence[float]] = None,
+    ) -> list[float]:
+        return [
+            value for _, value in setups_only(candidates, station, mean_setup_times)
+        ]
 
 
 def setups_plus_processing(
-    candidates: TaskList, station: Station
+    candidates: TaskList,
+    station: Station,
+    mean_setup_times: Optional[Sequence[float]] = None,
 ) -> List[Tuple[Task, float]]:
     """Return a tuple for each task in the candidate_list and its processing incl. setup time)"""
 
     if station.is_empty():
+        if mean_setup_times is None:
+            return [
+                (task, task.processing_time + statistics.mean(task.setup_times))
+                for task in candidates
+            ]
         return [
-            (task, task.processing_time + statistics.mean(task.setup_times))
+            (task, task.processing_time + mean_setup_times[task.id])
             for task in candidates
         ]
     else:
+        setup_times = station[-1].setup_times
         return [
-            (task, station[-1].setup_time(task) + task.processing_time)
-            for task in candidates
+            (task, setup_times[task.id] + task.processing_time) for task in candidates
         ]
 
 
-def setups_only(candidates: TaskList, station: Station) -> List[Tuple[Task, float]]:
+def setups_only(
+    candidates: TaskList,
+    station: Station,
+    mean_setup_times: Optional[Sequence[float]] = None,
+) -> List[Tuple[Task, float]]:
     """Return a tuple for each task in the candidate_list and its setup time"""
 
     if station.is_empty():
-        return [(task, statistics.mean(task.setup_times)) for task in candidates]
+        if mean_setup_times is None:
+            return [(task, statistics.mean(task.setup_times)) for task in candidates]
+        return [(task, mean_setup_times[task.id]) for task in candidates]
     else:
-        return [(task, station[-1].setup_time(task)) for task in candidates]
+        setup_times = station[-1].setup_times
+        return [(task, setup_times[task.id]) for task in candidates]
 
 
 def get_ordering_rules() -> list[TaskOrderingRule]:
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from typing import Callable, Iterable, Optional, Sequence
+
+from sualbsp_solver.data_model import Task, TaskList
+
+StationObjective = Callable[[int, int], float]
+
+
+def accumulate(contributions: Iterable[float]) -> float:
+    """Returns the sum of the contributions of the stations, added from left to right like in
+    SwapEvaluator. The result of sum() differs in the last digits since Python 3.12, because
+    it compensates rounding errors."""
+    objective = 0.0
+    for contribution in contributions:
+        objective += contribution
+    return objective
+
+
+class SwapEvaluator:
+    """Evaluates the exchange of two tasks in a sequence without reassembling it from scratch.
+
+    The evaluator keeps the station boundaries, station times and objective contributions of the
+    current sequence, as they would be produced by `TaskList.reassemble`. Evaluating a swap only
+    reassigns the tasks starting at the station that contains the task in front of the left position. As soon as a
+    station opens at an original station boundary to the right of both swapped positions, the
+    remaining stations are identical to the current ones and the evaluation stops.
+    """
+
+    def __init__(
+        self, sequence: TaskList, cycle_time: int, station_objective: StationObjective
+    ) -> None:
+        self.tasks: list[Task] = list(sequence)
+        self.cycle_time = cycle_time
+        self.station_objective = station_objective
+
+        # station_starts[k] is the position of the first task in station k
+        self.station_starts: list[int] = []
+        self.station_times: list[int] = []
+        self.station_of = [0] * len(self.tasks)
+        self.is_station_start = [False] * (len(self.tasks) + 1)
+        self.contributions: list[float] = []
+        # objective_prefix[k] is the sum of the contributions of the first k stations
+        self.objective_prefix = [0.0]
+        self.objective = 0.0
+        self.num_evaluations = 0
+        self._assign_stations(0, 0)
+
+    @property
+    def num_stations(self) -> int:
+        """Returns the number of stations of the current sequence."""
+        return len(self.station_times)
+
+    def evaluate_swap(
+        self, pos1: int, pos2: int, max_stations: Optional[int] = None
+    ) -> Optional[tuple[int, float]]:
+        """Returns the number of stations and the objective value of the sequence with the tasks
+        at `pos1` < `pos2` exchanged. If the modified sequence needs more than `max_stations`
+        stations, the evaluation is aborted and None is returned."""
+
+        self.num_evaluations += 1
+        tasks = self.tasks
+        cycle_time = self.cycle_time
+        station_objective = self.station_objective
+        num_tasks = len(tasks)
+        num_current_stations = len(self.station_times)
+
+        # the station in front of pos1 may also take a different task at pos1
+        first_station = self.station_of[pos1 - 1] if pos1 > 0 else 0
+        start = self.station_starts[first_station]
+        if max_stations is None:
+            max_stations = num_tasks + 1
+
+        # the stations are reassigned without storing them, only their number and objective
+        num_stations = first_station
+        objective = self.objective_prefix[first_station]
+        resume_station = num_current_stations
+
+        previous = tasks[pos2] if start == pos1 else tasks[start]
+        station_time = previous.processing_time
+        for position in range(start + 1, num_tasks):
+            if position == pos1:
+                task = tasks[pos2]
+            elif position == pos2:
+                task = tasks[pos1]
+            else:
+                task = tasks[position]
+            additional_time = previous.setup_times[task.id] + task.processing_time
+
+            if station_time + additional_time <= cycle_time:
+                station_time += additional_time
+            else:
+                num_stations += 1
+                objective += station_objective(station_time, cycle_time)
+                if num_stations >= max_stations:
+                    return None
+
+                # behind both swapped positions the stations re-synchronise with the current ones
+                if position > pos2 and self.is_station_start[position]:
+                    resume_station = self.station_of[position]
+                    break
+
+                station_time = task.processing_time
+            previous = task
+        else:
+            # the last station of the modified sequence has not been closed yet
+            num_stations += 1
+            objective += station_objective(station_time, cycle_time)
+
+        num_stations += num_current_stations - resume_station
+        if num_stations > max_stations:
+            return None
+
+        contributions = self.contributions
+        for station in range(resume_station, num_current_stations):
+            objective += contributions[station]
+        return num_stations, objective
+
+    def apply_swap(self, pos1: int, pos2: int) -> None:
+        """Exchanges the tasks at `pos1` < `pos2` in the current sequence. Only the stations
+        from the one that contains the task in front of `pos1` are reassigned."""
+        tasks = self.tasks
+        tasks[pos1], tasks[pos2] = tasks[pos2], tasks[pos1]
+
+        first_station = self.station_of[pos1 - 1] if pos1 > 0 else 0
+        self._assign_stations(first_station, self.station_starts[first_station])
+
+    def _assign_stations(self, first_station: int, start: int) -> None:
+        """Reassigns the tasks from position `start` on, which opens `first_station`."""
+        station_starts, station_times = TaskList(self.tasks[start:]).assign_stations(
+            self.cycle_time
+        )
+
+        for position in self.station_starts[first_station:]:
+            self.is_station_start[position] = False
+        del self.station_starts[first_station:]
+        del self.station_times[first_station:]
+        del self.contributions[first_station:]
+        del self.objective_prefix[first_station + 1 :]
+
+        station_ends = station_starts[1:] + [len(self.tasks) - start]
+        for offset, (station_start, station_end, station_time) in enumerate(
+            zip(station_starts, station_ends, station_times)
+        ):
+            station = first_station + offset
+            self.station_starts.append(start + station_start)
+            self.is_station_start[start + station_start] = True
+            self.station_of[start + station_start : start + station_end] = [station] * (
+                station_end - station_start
+            )
+
+            contribution = self.station_objective(station_time, self.cycle_time)
+            self.station_times.append(station_time)
+            self.contributions.append(contribution)
+            self.objective_prefix.append(self.objective_prefix[-1] + contribution)
+
+        self.objective = self.objective_prefix[-1]
+
+    def evaluate_swaps(
+        self, exchanges: Sequence[tuple[int, int]], max_stations: Optional[int] = None
+    ) -> list[Optional[tuple[int, float]]]:
+        """Returns the evaluation of each exchange, see `evaluate_swap`."""
+        return [
+            self.evaluate_swap(pos1, pos2, max_stations) for pos1, pos2 in exchanges
+        ]
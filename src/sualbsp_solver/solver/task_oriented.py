@@ -1,9 +1,13 @@
-import copy
+import logging
 
-from sualbsp_solver.data_model import Graph, Station, TaskList
+from sualbsp_solver import profiling
+from sualbsp_solver.data_model import Graph, Station
+from sualbsp_solver.solver.construction import ConstructionState
 from sualbsp_solver.solver.optimizer import OptimizationProcedure
 from sualbsp_solver.solver.rule import TaskOrderingRule
 
+logger = logging.getLogger(__name__)
+
 
 class TaskOrientedStrategy(OptimizationProcedure):
     """The task-oriented procedure (TH) is an iterative procedure which, at each iteration and
@@ -20,32 +24,36 @@ class TaskOrientedStrategy(OptimizationProcedure):
     def __init__(self, ordering_rule: TaskOrderingRule) -> None:
         self.ordering_rule = ordering_rule
 
+    def describe(self) -> str:
+        return f"{self}-{self.ordering_rule}"
+
     def solve(self, instance: Graph) -> list[Station]:
 
-        print(f"Applying {self} with {self.ordering_rule}")
-        task_list = TaskList(copy.deepcopy(instance.tasks))
-        solution = self.construct_solution(task_list, instance.cycle_time)
+        logger.info("Applying %s with %s", self, self.ordering_rule)
+        with profiling.timer("construction"):
+            solution = self.construct_solution(instance)
+        profiling.count("constructions")
         return solution
 
-    def construct_solution(self, task_list: TaskList, cycle_time: int) -> list[Station]:
+    def construct_solution(self, instance: Graph) -> list[Station]:
+
+        cycle_time = instance.cycle_time
+        state = ConstructionState(instance)
 
         # initialize stations
         stations: list[Station] = [Station(cycle_time)]
         current_station = stations[-1]
 
-        while len(task_list):
+        while len(state):
 
-            # Condition 1: candidates are tasks that have no precedence relations
-            candidates = task_list.get_tasks_without_predecessors()
+            # Condition 1: candidates are tasks that have no unassigned predecessors
+            candidates = state.get_available_tasks()
 
-            # order the list of station candidates
-            ordered_candidates = self.ordering_rule.order_tasks(
-                candidates, current_station
+            # next task to be sequenced is the first candidate in the order of the rule
+            next_task = self.ordering_rule.select_task(
+                candidates, current_station, state.graph
             )
 
-            # next task to be sequenced is first in the ordered list of candidates
-            next_task = ordered_candidates.first
-
             # assign next task to first station it fits in
             for station in stations:
                 if not station.can_fit(next_task):
@@ -57,11 +65,8 @@ class TaskOrientedStrategy(OptimizationProcedure):
                 stations.append(Station(cycle_time))  # open new station
                 current_station = stations[-1]
 
-            # assign the chosen task to the current station and remove it from candidate list
+            # assign the chosen task to the current station and release its successors
             current_station.add_task(next_task)
-            task_list.remove(next_task)
-
-            # Remove the chosen task as a predecessor from all other candidates
-            task_list.remove_from_predecessors(next_task)
+            state.assign(next_task)
 
         return stations
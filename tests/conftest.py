@@ -0,0 +1,57 @@
+from typing import Callable, Optional
+
+import pytest
+
+from sualbsp_solver.data_model import Graph, Task, TaskList
+
+# Setup and processing times of the small instances of the tests, instances with fewer tasks
+# use the first rows and columns
+SETUP_TIMES = [
+    [0, 1, 2, 1, 3, 2],
+    [2, 0, 1, 2, 1, 1],
+    [1, 3, 0, 1, 2, 2],
+    [2, 1, 1, 0, 1, 3],
+    [1, 2, 3, 2, 0, 1],
+    [3, 1, 2, 1, 2, 0],
+]
+PROCESSING_TIMES = [4, 3, 5, 2, 4, 3]
+
+CreateTasks = Callable[..., list[Task]]
+
+
+@pytest.fixture
+def create_tasks() -> CreateTasks:
+    """Returns a function that creates the first `num_tasks` tasks of the small instance,
+    optionally with the given predecessors."""
+
+    def create(
+        num_tasks: int, predecessors: Optional[list[list[int]]] = None
+    ) -> list[Task]:
+        return [
+            Task(
+                i,
+                PROCESSING_TIMES[i],
+                list(predecessors[i]) if predecessors else [],
+                SETUP_TIMES[i][:num_tasks],
+            )
+            for i in range(num_tasks)
+        ]
+
+    return create
+
+
+@pytest.fixture
+def sequence(create_tasks: CreateTasks) -> TaskList:
+    """Five tasks without precedence relations."""
+    return TaskList(create_tasks(5))
+
+
+@pytest.fixture
+def three_task_graph() -> Graph:
+    """Three tasks in a chain, task 2 also succeeds task 0."""
+    tasks = [
+        Task(0, 3, predecessors=[], setup_times=[0, 1, 2]),
+        Task(1, 4, predecessors=[0], setup_times=[2, 0, 1]),
+        Task(2, 5, predecessors=[0, 1], setup_times=[1, 3, 0]),
+    ]
+    return Graph(tasks, 10, "test")
@@ -0,0 +1,59 @@
+import pickle
+
+from sualbsp_solver.data_model import Graph, Task
+
+
+def test_compile_graph(three_task_graph: Graph) -> None:
+    compiled = three_task_graph.compile()
+
+    assert compiled.num_tasks == 3
+    assert list(compiled.processing_times) == [3, 4, 5]
+    assert compiled.setup_time(2, 1) == 3
+    assert list(compiled.predecessors_of(2)) == [0, 1]
+    assert list(compiled.successors_of(0)) == [1, 2]
+
+
+def test_compiled_graph_is_cached(three_task_graph: Graph) -> None:
+    assert three_task_graph.compile() is three_task_graph.compile()
+
+
+def test_create_tasks_does_not_share_predecessors(three_task_graph: Graph) -> None:
+    tasks = three_task_graph.compile().create_tasks()
+
+    tasks[2].predecessors.clear()
+    assert three_task_graph.compile().create_tasks()[2].predecessors == [0, 1]
+    assert tasks[2].setup_time(tasks[1]) == 3
+
+
+def test_pickle_compiled_graph(three_task_graph: Graph) -> None:
+    compiled = three_task_graph.compile()
+    restored = pickle.loads(pickle.dumps(compiled))
+
+    assert restored.name == compiled.name
+    assert restored.setup_times == compiled.setup_times
+    assert restored.successors == compiled.successors
+
+
+def test_precedence_masks() -> None:
+    compiled = Graph(
+        [
+            Task(0, 1, predecessors=[], setup_times=[0, 0, 0, 0]),
+            Task(1, 1, predecessors=[0], setup_times=[0, 0, 0, 0]),
+            Task(2, 1, predecessors=[1], setup_times=[0, 0, 0, 0]),
+            Task(3, 1, predecessors=[], setup_times=[0, 0, 0, 0]),
+        ],
+        10,
+        "chain",
+    ).compile()
+
+    assert compiled.predecessor_masks == (0b0, 0b1, 0b10, 0b0)
+    assert compiled.closure_masks == (0b0, 0b1, 0b11, 0b0)
+    assert compiled.is_predecessor(1, 2)
+    assert not compiled.is_predecessor(0, 2)
+    assert compiled.is_predecessor(0, 2, transitive=True)
+    assert not compiled.is_predecessor(3, 2, transitive=True)
+
+
+def test_mean_setup_times(three_task_graph: Graph) -> None:
+    compiled = three_task_graph.compile()
+    assert compiled.mean_setup_times == (1.0, 1.0, 4 / 3)
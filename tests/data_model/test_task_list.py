@@ -48,3 +48,19 @@ def test_remove_successful() -> None:
 def test_remove_fails() -> None:
     with pytest.raises(ValueError):
         TaskList().remove(Task(0, 1))
+
+
+def test_reassemble() -> None:
+    setup_times = [[0, 1, 2], [2, 0, 1], [1, 3, 0]]
+    tasks = TaskList([Task(i, 3, setup_times=setup_times[i]) for i in range(3)])
+
+    assert tasks.assign_stations(7) == ([0, 2], [7, 3])
+
+    solution = tasks.reassemble(7)
+    assert [[task.id for task in station] for station in solution] == [[0, 1], [2]]
+    assert [station.station_time for station in solution] == [7, 3]
+
+
+def test_reassemble_empty() -> None:
+    assert TaskList().assign_stations(5) == ([0], [0])
+    assert [len(station) for station in TaskList().reassemble(5)] == [0]
@@ -0,0 +1,19 @@
+import pytest
+
+from sualbsp_solver.solver import accelerated
+
+
+@pytest.fixture
+def restore_backend():
+    backend = accelerated.get_backend()
+    yield
+    accelerated.set_backend(backend)
+
+
+@pytest.fixture(params=accelerated.BACKENDS)
+def backend(request, restore_backend) -> str:
+    """Runs the test with each backend of the local search that is installed."""
+    if request.param == "numba" and not accelerated.is_available():
+        pytest.skip("numba is not installed")
+    accelerated.set_backend(request.param)
+    return request.param
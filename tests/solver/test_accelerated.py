@@ -0,0 +1,94 @@
+import pickle
+import random
+
+import pytest
+
+from sualbsp_solver.data_model.task import Task
+from sualbsp_solver.data_model.task_list import TaskList
+from sualbsp_solver.generator import generate_instance
+from sualbsp_solver.solver import accelerated
+from sualbsp_solver.solver.local_search import (
+    balanced_station_objective,
+    create_evaluator,
+    imbalanced_station_objective,
+    improve_solution,
+)
+from sualbsp_solver.solver.rule import get_ordering_rules
+from sualbsp_solver.solver.station_oriented import StationOrientedStrategy
+from sualbsp_solver.solver.swap_evaluator import SwapEvaluator
+
+
+def test_default_backend_is_python() -> None:
+    assert accelerated.get_backend() == "python"
+
+
+def test_set_backend(sequence: TaskList, restore_backend) -> None:
+    accelerated.set_backend("python")
+    assert accelerated.get_backend() == "python"
+    evaluator = create_evaluator(sequence, 10, balanced_station_objective)
+    assert type(evaluator) is SwapEvaluator
+
+    with pytest.raises(ValueError):
+        accelerated.set_backend("fortran")
+
+
+def test_numba_backend_requires_numba(restore_backend) -> None:
+    if accelerated.is_available():
+        pytest.skip("numba is installed")
+    with pytest.raises(ValueError):
+        accelerated.set_backend("numba")
+
+
+@pytest.mark.parametrize(
+    "station_objective", [balanced_station_objective, imbalanced_station_objective]
+)
+def test_accelerated_evaluator_matches_evaluator(station_objective) -> None:
+    pytest.importorskip("numba")
+    kind = (
+        accelerated.BALANCED
+        if station_objective is balanced_station_objective
+        else accelerated.IMBALANCED
+    )
+
+    graph = generate_instance(30, order_strength=0.2, seed=0)
+    sequence = TaskList(list(graph.tasks))
+    evaluator = SwapEvaluator(sequence, graph.cycle_time, station_objective)
+    accelerated_evaluator = accelerated.AcceleratedSwapEvaluator(
+        sequence, graph.cycle_time, station_objective, kind
+    )
+
+    exchanges = [(i, j) for i in range(30) for j in range(i + 1, 30)]
+    for max_stations in (None, evaluator.num_stations):
+        assert accelerated_evaluator.evaluate_swaps(
+            exchanges, max_stations
+        ) == evaluator.evaluate_swaps(exchanges, max_stations)
+
+
+def test_setup_matrix_views_the_compiled_setup_times() -> None:
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    graph = generate_instance(20, seed=0)
+    expected = np.array(graph.compile().setup_times).reshape(20, 20)
+
+    for tasks in (graph.tasks, pickle.loads(pickle.dumps(graph)).tasks):
+        matrix = accelerated.setup_matrix(tasks[::-1])
+        assert matrix.base is not None
+        assert (matrix == expected).all()
+
+    tasks = [
+        Task(task.id, 1, setup_times=list(task.setup_times)) for task in graph.tasks
+    ]
+    assert (accelerated.setup_matrix(tasks) == expected).all()
+
+
+def test_backends_improve_solution_identically(restore_backend) -> None:
+    pytest.importorskip("numba")
+    graph = generate_instance(40, seed=1)
+    solution = StationOrientedStrategy(get_ordering_rules()[0]).solve(graph)
+
+    def improve(backend: str) -> list[list[int]]:
+        accelerated.set_backend(backend)
+        improved = improve_solution(solution, graph.cycle_time, rng=random.Random(0))
+        return [[task.id for task in station] for station in improved]
+
+    assert improve("numba") == improve("python")
@@ -0,0 +1,39 @@
+from sualbsp_solver.data_model import Graph, Station, Task, TaskList
+from sualbsp_solver.solver.construction import ConstructionState
+from sualbsp_solver.solver.grasp import GRASP
+
+
+def test_available_tasks_after_assignment(three_task_graph: Graph) -> None:
+    state = ConstructionState(three_task_graph)
+    assert state.get_available_tasks() == TaskList([Task(0, 3)])
+
+    state.assign(three_task_graph.tasks[0])
+    assert state.get_available_tasks() == TaskList([Task(1, 4)])
+    assert len(state) == 2
+
+
+def test_tasks_that_fit_station() -> None:
+    tasks = [
+        Task(0, 3, predecessors=[], setup_times=[0, 1, 3, 1]),
+        Task(1, 6, predecessors=[], setup_times=[2, 0, 1, 4]),
+        Task(2, 5, predecessors=[], setup_times=[1, 3, 0, 1]),
+        Task(3, 4, predecessors=[], setup_times=[1, 1, 1, 0]),
+    ]
+    graph = Graph(tasks, 10, "test")
+    state = ConstructionState(graph)
+
+    station = Station(10)
+    assert state.get_tasks_that_fit(station) == TaskList(tasks)
+
+    station.add_task(tasks[0])
+    state.assign(tasks[0])
+    assert state.get_tasks_that_fit(station) == TaskList([tasks[1], tasks[3]])
+    assert state.get_tasks_that_fit(station) == (
+        state.get_available_tasks().get_tasks_that_fit_station(station)
+    )
+
+
+def test_construction_does_not_modify_graph(three_task_graph: Graph) -> None:
+    GRASP(1).construct_solution(three_task_graph)
+
+    assert three_task_graph.tasks[2].predecessors == [0, 1]
@@ -0,0 +1,55 @@
+from sualbsp_solver.data_model.task_list import TaskList
+from sualbsp_solver.solver.elite_pool import (
+    ElitePool,
+    default_min_distance,
+    distance,
+)
+
+
+def test_distance(create_tasks) -> None:
+    tasks = create_tasks(4)
+    sequence = TaskList(tasks)
+    assert distance(sequence, sequence) == 0
+    assert distance(sequence, sequence.swap_tasks(0, 3)) == 2
+
+
+def test_pool_rejects_duplicates(create_tasks) -> None:
+    pool = ElitePool(3, 10)
+    sequence = TaskList(create_tasks(4))
+
+    assert pool.add(sequence)
+    assert not pool.add(TaskList(create_tasks(4)))
+    assert len(pool) == 1
+
+
+def test_pool_keeps_best_solutions(create_tasks) -> None:
+    pool = ElitePool(2, 10)
+    sequence = TaskList(create_tasks(4))
+    for i, j in [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]:
+        pool.add(sequence.swap_tasks(i, j))
+
+    values = sorted(
+        pool.evaluate(sequence.swap_tasks(i, j)).value
+        for i, j in [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+    )
+    assert len(pool) == 2
+    assert pool[0].value == values[0]
+    assert pool[0].value <= pool[1].value
+
+
+def test_default_min_distance_scales_with_the_sequence_length() -> None:
+    assert default_min_distance(4) == 2
+    assert default_min_distance(45) == 4
+
+
+def test_pool_keeps_one_solution_within_the_min_distance(create_tasks) -> None:
+    pool = ElitePool(3, 10, min_distance=5)
+    sequence = TaskList(create_tasks(4))
+    candidates = [sequence.swap_tasks(i, j) for i in range(4) for j in range(i + 1, 4)]
+    for candidate in candidates:
+        pool.add(candidate)
+
+    assert len(pool) == 1
+    assert pool[0].value == min(
+        pool.evaluate(candidate).value for candidate in candidates
+    )
@@ -1,7 +1,11 @@
+import pytest
+
+from sualbsp_solver.data_model.graph import Graph
 from sualbsp_solver.data_model.station import Station
 from sualbsp_solver.data_model.task import Task
 from sualbsp_solver.data_model.task_list import TaskList
 from sualbsp_solver.solver.grasp import GRASP
+from sualbsp_solver.solver.lower_bound import lower_bound
 
 
 def test_get_greedy_indices_empty_station() -> None:
@@ -28,3 +32,72 @@ def test_get_restricted_candidates() -> None:
         GRASP(1).get_restricted_candidates(tasks, greedy_indices, threshold=0.4)[0]
         == tasks[1]
     )
+
+
+@pytest.fixture
+def graph(create_tasks) -> Graph:
+    return Graph(create_tasks(6, [[], [0], [0], [1], [1, 2], [4]]), 10, "test")
+
+
+def to_ids(solution: list[Station]) -> list[list[int]]:
+    return [[task.id for task in station] for station in solution]
+
+
+def test_solve_is_reproducible_with_seed(graph: Graph) -> None:
+    assert to_ids(GRASP(5, seed=42).solve(graph)) == to_ids(
+        GRASP(5, seed=42).solve(graph)
+    )
+
+
+def test_parallel_solve_matches_sequential_solve(graph: Graph) -> None:
+    sequential = GRASP(6, seed=7).solve(graph)
+    parallel = GRASP(6, seed=7, workers=2).solve(graph)
+    assert to_ids(parallel) == to_ids(sequential)
+    assert [station.station_time for station in parallel] == [
+        station.station_time for station in sequential
+    ]
+
+
+def test_incumbents_improve(graph: Graph) -> None:
+    incumbents = list(GRASP(10, seed=3).incumbents(graph))
+
+    assert incumbents[0].iteration == 1
+    num_stations = [incumbent.num_stations for incumbent in incumbents]
+    assert num_stations == sorted(set(num_stations), reverse=True)
+
+
+def test_solve_stops_at_target(graph: Graph) -> None:
+    incumbents = list(
+        GRASP(None, seed=3, time_limit=60, target_stations=100).incumbents(graph)
+    )
+    assert len(incumbents) == 1
+
+
+def test_solve_stops_at_time_limit(graph: Graph) -> None:
+    solution = GRASP(None, seed=3, time_limit=0.05).solve(graph)
+    assert sum(len(station) for station in solution) == 6
+
+
+def test_iterations_or_time_limit_required() -> None:
+    with pytest.raises(ValueError):
+        GRASP(None)
+
+
+def test_solve_stops_at_lower_bound(graph: Graph) -> None:
+    incumbents = list(GRASP(None, seed=3, time_limit=60).incumbents(graph))
+    assert incumbents[-1].num_stations == lower_bound(graph.compile())
+
+
+def test_solve_with_elite_pool(graph: Graph) -> None:
+    solution = GRASP(5, seed=4, elite_size=3).solve(graph)
+
+    assert sum(len(station) for station in solution) == 6
+    assert to_ids(solution) == to_ids(GRASP(5, seed=4, elite_size=3).solve(graph))
+
+
+def test_describe_includes_the_elite_parameters() -> None:
+    assert GRASP(10, elite_size=4).describe() == "GRASP-10-elite4"
+    assert (
+        GRASP(10, elite_size=4, elite_distance=3).describe()
+        == "GRASP-10-elite4-distance3"
+    )
@@ -0,0 +1,86 @@
+from itertools import permutations
+
+import pytest
+
+from sualbsp_solver.data_model import Graph, Task, TaskList
+from sualbsp_solver.generator import generate_instance
+from sualbsp_solver.solver.lower_bound import (
+    bin_packing_bound,
+    incompatibility_bound,
+    lower_bound,
+    setup_bound,
+)
+
+
+def create_graph(
+    processing_times: list[int], setup_time: int, cycle_time: int
+) -> Graph:
+    num_tasks = len(processing_times)
+    tasks = [
+        Task(
+            i,
+            processing_time,
+            [],
+            [0 if j == i else setup_time for j in range(num_tasks)],
+        )
+        for i, processing_time in enumerate(processing_times)
+    ]
+    return Graph(tasks, cycle_time, "test")
+
+
+def test_setup_bound() -> None:
+    # 4 tasks of 4 fit into 2 stations of 10 with setup times of 2, but not of 3
+    assert setup_bound(create_graph([4, 4, 4, 4], 2, 10).compile()) == 2
+    assert setup_bound(create_graph([4, 4, 4, 4], 3, 10).compile()) == 3
+
+
+def test_bin_packing_bound() -> None:
+    compiled = create_graph([6, 6, 6, 5, 5], 0, 10).compile()
+    assert bin_packing_bound(compiled) == 4
+
+
+def test_incompatibility_bound() -> None:
+    compiled = create_graph([5, 5, 5], 1, 10).compile()
+    assert incompatibility_bound(compiled) == 3
+    assert lower_bound(compiled) == 3
+
+
+def optimum(graph: Graph) -> int:
+    """Returns the fewest stations over all task sequences that respect the precedences."""
+    best = len(graph.tasks)
+    for sequence in permutations(graph.tasks):
+        positions = {task.id: position for position, task in enumerate(sequence)}
+        if all(
+            positions[predecessor] < positions[task.id]
+            for task in sequence
+            for predecessor in task.predecessors
+        ):
+            station_starts, _ = TaskList(list(sequence)).assign_stations(
+                graph.cycle_time
+            )
+            best = min(best, len(station_starts))
+    return best
+
+
+def test_incompatibility_bound_allows_tasks_in_between() -> None:
+    # the setup from task 0 to task 1 is cheaper through task 2
+    setup_times = [[0, 5, 0], [5, 0, 0], [0, 0, 0]]
+    tasks = [
+        Task(i, processing_time, [], setup_times[i])
+        for i, processing_time in enumerate([4, 4, 1])
+    ]
+    graph = Graph(tasks, 10, "test")
+    assert optimum(graph) == 1
+    assert lower_bound(graph.compile()) == 1
+
+
+@pytest.mark.parametrize("seed", range(150))
+def test_lower_bound_is_below_optimum(seed: int) -> None:
+    graph = generate_instance(
+        5,
+        order_strength=0.2,
+        cycle_time_tightness=1.0,
+        setup_variability=0.75,
+        seed=seed,
+    )
+    assert lower_bound(graph.compile()) <= optimum(graph)
@@ -0,0 +1,61 @@
+import random
+
+from sualbsp_solver.data_model.task_list import TaskList
+from sualbsp_solver.generator import generate_instance
+from sualbsp_solver.solver.local_search import improve_solution
+from sualbsp_solver.solver.neighbourhood import (
+    candidate_exchanges,
+    feasible_exchanges,
+    get_neighbourhood_strategies,
+    select_best,
+    select_first,
+)
+from sualbsp_solver.solver.rule import get_ordering_rules
+from sualbsp_solver.solver.station_oriented import StationOrientedStrategy
+
+
+def test_select_best() -> None:
+    exchanges = [(3, -0.1, (0, 1)), (3, -0.5, (0, 2)), (4, -0.9, (1, 2))]
+    assert select_best(exchanges, num_stations_current=4) == (0, 2)
+
+
+def test_select_best_without_improvement() -> None:
+    exchanges = [(3, 0.2, (0, 1)), (3, 0.1, (0, 2))]
+    assert select_best(exchanges, num_stations_current=3) is None
+
+
+def test_select_first() -> None:
+    exchanges = [(3, 0.2, (0, 1)), (3, -0.1, (0, 2)), (3, -0.5, (1, 2))]
+    assert select_first(exchanges, num_stations_current=3) == (0, 2)
+
+
+def test_strategies_keep_precedence_relations(create_tasks) -> None:
+    tasks = create_tasks(4, [[], [0], [], [2]])
+    solution = TaskList(tasks).reassemble(10)
+
+    for strategy in get_neighbourhood_strategies():
+        improved = improve_solution(
+            solution, 10, rng=random.Random(1), neighbourhood=strategy
+        )
+        sequence = [task.id for station in improved for task in station]
+        assert sorted(sequence) == [0, 1, 2, 3]
+        assert sequence.index(0) < sequence.index(1)
+        assert sequence.index(2) < sequence.index(3)
+
+
+def test_candidate_exchanges_match_feasible_exchanges() -> None:
+    graph = generate_instance(30, order_strength=0.3, seed=0)
+    solution = StationOrientedStrategy(get_ordering_rules()[0]).solve(graph)
+    sequence = TaskList.from_solution(solution)
+    rng = random.Random(0)
+
+    for _ in range(10):
+        candidates = set(rng.sample(range(30), 5))
+        expected = {
+            (i, j)
+            for i, j in feasible_exchanges(sequence, range(29))
+            if i in candidates or j in candidates
+        }
+        exchanges = list(candidate_exchanges(sequence, candidates))
+        assert len(exchanges) == len(expected)
+        assert set(exchanges) == expected
@@ -0,0 +1,27 @@
+from sualbsp_solver.data_model.task_list import TaskList
+from sualbsp_solver.solver.elite_pool import ElitePool
+from sualbsp_solver.solver.path_relinking import path_relinking
+
+
+def test_path_relinking_is_not_worse_than_its_ends(create_tasks) -> None:
+    tasks = create_tasks(5)
+    initial = TaskList(tasks)
+    guiding = TaskList([tasks[i] for i in [4, 2, 0, 3, 1]])
+
+    pool = ElitePool(2, 10)
+    best = path_relinking(initial, guiding, 10)
+
+    assert best.value <= pool.evaluate(initial).value
+    assert best.value <= pool.evaluate(guiding).value
+
+
+def test_path_relinking_keeps_precedence_relations(create_tasks) -> None:
+    tasks = create_tasks(5, [[], [0], [], [2], [1]])
+    initial = TaskList([tasks[i] for i in [0, 1, 2, 3, 4]])
+    guiding = TaskList([tasks[i] for i in [2, 3, 0, 1, 4]])
+
+    sequence = path_relinking(initial, guiding, 8).sequence
+    position = {task.id: index for index, task in enumerate(sequence)}
+    for task in sequence:
+        for predecessor in task.predecessors:
+            assert position[predecessor] < position[task.id]
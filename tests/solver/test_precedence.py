@@ -0,0 +1,55 @@
+import random
+
+from sualbsp_solver.data_model.task import Task
+from sualbsp_solver.data_model.task_list import TaskList
+from sualbsp_solver.solver.precedence import PrecedenceIndex
+
+
+def create_sequence(num_tasks: int, seed: int) -> TaskList:
+    rng = random.Random(seed)
+    tasks = [
+        Task(
+            i,
+            1,
+            [j for j in range(i) if rng.random() < 0.2],
+            [0] * num_tasks,
+        )
+        for i in range(num_tasks)
+    ]
+    return TaskList(tasks)
+
+
+def test_blocking_position() -> None:
+    for seed in range(5):
+        sequence = create_sequence(15, seed)
+        index = PrecedenceIndex(sequence)
+
+        for i in range(len(sequence)):
+            expected = next(
+                (
+                    j
+                    for j in range(i + 1, len(sequence))
+                    if any(
+                        left.is_predecessor_of(sequence[j]) for left in sequence[i:j]
+                    )
+                ),
+                len(sequence),
+            )
+            assert index.blocking_position[i] == expected
+
+
+def test_is_feasible_exchange() -> None:
+    for seed in range(5):
+        sequence = create_sequence(15, seed)
+        index = PrecedenceIndex(sequence)
+
+        for i in range(len(sequence)):
+            for j in range(i + 1, len(sequence)):
+                swapped = sequence.swap_tasks(i, j)
+                position = {task.id: k for k, task in enumerate(swapped)}
+                expected = all(
+                    position[predecessor] < position[task.id]
+                    for task in swapped
+                    for predecessor in task.predecessors
+                )
+                assert index.is_feasible_exchange(i, j) == expected
@@ -0,0 +1,60 @@
+import pytest
+
+from sualbsp_solver.data_model.graph import Graph
+from sualbsp_solver.data_model.station import Station
+from sualbsp_solver.data_model.task import Task
+from sualbsp_solver.solver.reactive_grasp import ReactiveGRASP, solution_value
+
+
+def to_ids(solution: list[Station]) -> list[list[int]]:
+    return [[task.id for task in station] for station in solution]
+
+
+def create_solution(station_times: list[int]) -> list[Station]:
+    solution = []
+    for station_time in station_times:
+        station = Station(10)
+        station.add_task(Task(0, station_time))
+        solution.append(station)
+    return solution
+
+
+def test_solution_value() -> None:
+    assert solution_value(create_solution([10, 10, 5])) == 2.5
+
+
+def test_better_alpha_gets_higher_probability() -> None:
+    grasp = ReactiveGRASP(10, alphas=[0.1, 0.5, 0.9], update_interval=4)
+    for alpha, station_times in [
+        (0.1, [10, 10, 10, 5]),
+        (0.5, [10, 10, 5]),
+        (0.1, [10, 10, 10, 5]),
+        (0.5, [10, 10, 5]),
+    ]:
+        grasp.record_iteration(alpha, create_solution(station_times))
+
+    probabilities = grasp.get_alpha_distribution()
+    assert sum(probabilities.values()) == pytest.approx(1)
+    assert probabilities[0.1] < probabilities[0.5]
+
+    # an alpha that has not been drawn keeps the highest weight
+    assert probabilities[0.5] == probabilities[0.9]
+
+
+def test_reactive_solve_is_reproducible_with_seed(create_tasks) -> None:
+    graph = Graph(create_tasks(4, [[], [0], [], [2]]), 8, "test")
+    first = ReactiveGRASP(10, seed=5, update_interval=2)
+    second = ReactiveGRASP(10, seed=5, update_interval=2)
+
+    assert to_ids(first.solve(graph)) == to_ids(second.solve(graph))
+    assert first.get_alpha_distribution() == second.get_alpha_distribution()
+
+
+def test_describe_includes_the_reactive_parameters() -> None:
+    assert ReactiveGRASP(10).describe() == "ReactiveGRASP-10"
+    assert (
+        ReactiveGRASP(
+            10, alphas=(0.2, 1.0), update_interval=3, amplification=2.5
+        ).describe()
+        == "ReactiveGRASP-10-alphas0.2,1-update3-amplification2.5"
+    )
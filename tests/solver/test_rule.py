@@ -0,0 +1,42 @@
+import pytest
+
+from sualbsp_solver.data_model import Graph, Station, Task, TaskList
+from sualbsp_solver.solver.rule import TaskOrderingRule, get_ordering_rules
+
+
+def create_graph() -> Graph:
+    tasks = [
+        Task(0, 3, setup_times=[0, 1, 2, 1]),
+        Task(1, 4, setup_times=[2, 0, 1, 1]),
+        Task(2, 4, setup_times=[1, 3, 0, 2]),
+        Task(3, 2, setup_times=[1, 2, 2, 0]),
+    ]
+    return Graph(tasks, 20, "test")
+
+
+@pytest.mark.parametrize("rule", get_ordering_rules(), ids=str)
+def test_select_task_matches_order_tasks(rule: TaskOrderingRule) -> None:
+    graph = create_graph()
+    compiled = graph.compile()
+    candidates = TaskList(graph.tasks[1:])
+
+    station = Station(20)
+    assert rule.select_task(candidates, station, compiled) == (
+        rule.order_tasks(candidates, station).first
+    )
+
+    station.add_task(graph.tasks[0])
+    assert rule.select_task(candidates, station, compiled) == (
+        rule.order_tasks(candidates, station).first
+    )
+
+
+def test_ties_keep_the_order_of_the_candidates() -> None:
+    graph = create_graph()
+    max_ts, min_ts, _, _ = get_ordering_rules()
+    candidates = TaskList([graph.tasks[2], graph.tasks[1]])
+
+    station = Station(20)
+    station.add_task(graph.tasks[3])
+    assert max_ts.select_task(candidates, station, graph.compile()) == graph.tasks[2]
+    assert min_ts.order_tasks(candidates, station) == candidates
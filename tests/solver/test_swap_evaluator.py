@@ -0,0 +1,62 @@
+from sualbsp_solver.data_model.task_list import TaskList
+from sualbsp_solver.solver.local_search import (
+    balanced_objective,
+    balanced_station_objective,
+    create_evaluator,
+)
+from sualbsp_solver.solver.swap_evaluator import SwapEvaluator
+
+
+def test_current_sequence_matches_reassemble(sequence: TaskList) -> None:
+    evaluator = SwapEvaluator(sequence, 10, balanced_station_objective)
+
+    solution = sequence.reassemble(10)
+    assert evaluator.num_stations == len(solution)
+    assert evaluator.station_times == [station.station_time for station in solution]
+    assert evaluator.objective == balanced_objective(solution)
+
+
+def test_evaluate_swap_matches_reassemble(sequence: TaskList, backend: str) -> None:
+    evaluator = create_evaluator(sequence, 10, balanced_station_objective)
+
+    for i in range(len(sequence) - 1):
+        for j in range(i + 1, len(sequence)):
+            solution = sequence.swap_tasks(i, j).reassemble(10)
+            assert evaluator.evaluate_swap(i, j) == (
+                len(solution),
+                balanced_objective(solution),
+            )
+
+
+def test_evaluate_swap_exceeds_max_stations(sequence: TaskList, backend: str) -> None:
+    evaluator = create_evaluator(sequence, 10, balanced_station_objective)
+
+    assert evaluator.evaluate_swap(0, 4, max_stations=1) is None
+
+
+def test_evaluate_swaps_matches_evaluate_swap(sequence: TaskList, backend: str) -> None:
+    evaluator = create_evaluator(sequence, 10, balanced_station_objective)
+    exchanges = [(i, j) for i in range(5) for j in range(i + 1, 5)]
+
+    assert evaluator.evaluate_swaps(exchanges, max_stations=3) == [
+        evaluator.evaluate_swap(i, j, max_stations=3) for i, j in exchanges
+    ]
+
+
+def test_apply_swap_matches_new_evaluator(sequence: TaskList, backend: str) -> None:
+    evaluator = create_evaluator(sequence, 10, balanced_station_objective)
+    exchanges = [(i, j) for i in range(5) for j in range(i + 1, 5)]
+
+    for i, j in [(2, 4), (0, 3), (1, 2)]:
+        evaluation = evaluator.evaluate_swap(i, j)
+        evaluator.apply_swap(i, j)
+        sequence = sequence.swap_tasks(i, j)
+        expected = SwapEvaluator(sequence, 10, balanced_station_objective)
+
+        assert (evaluator.num_stations, evaluator.objective) == evaluation
+        assert evaluator.tasks == expected.tasks
+        assert evaluator.station_starts == expected.station_starts
+        assert evaluator.station_of == expected.station_of
+        assert evaluator.is_station_start == expected.is_station_start
+        assert evaluator.objective_prefix == expected.objective_prefix
+        assert evaluator.evaluate_swaps(exchanges) == expected.evaluate_swaps(exchanges)
@@ -0,0 +1,41 @@
+import pytest
+
+from sualbsp_solver.batch import SharedGraph, release, solve_batch
+from sualbsp_solver.generator import generate_instance
+from sualbsp_solver.solver.grasp import GRASP
+from sualbsp_solver.solver.rule import get_ordering_rules
+from sualbsp_solver.solver.station_oriented import StationOrientedStrategy
+
+
+def test_shared_graph() -> None:
+    compiled = generate_instance(10, seed=0).compile()
+    shared_graph, memory = SharedGraph.create(compiled)
+
+    graph, attached_memory = shared_graph.attach()
+    attached = graph.compile()
+    assert attached.name == compiled.name
+    assert attached.cycle_time == compiled.cycle_time
+    assert attached.setup_times == compiled.setup_times
+    assert attached.successors == compiled.successors
+
+    del graph, attached
+    attached_memory.close()
+    release(memory)
+    with pytest.raises(FileNotFoundError):
+        shared_graph.attach()
+
+
+def test_parallel_batch_matches_sequential_batch() -> None:
+    instances = [generate_instance(20, seed=seed) for seed in range(3)]
+    optimizers = [StationOrientedStrategy(get_ordering_rules()[0]), GRASP(2, seed=0)]
+
+    def run(workers: int) -> dict:
+        return {
+            (result.instance_index, result.optimizer_index): result.result["Stations"]
+            for result in solve_batch(instances, optimizers, workers=workers)
+        }
+
+    sequential = run(workers=1)
+    assert len(sequential) == len(instances) * len(optimizers)
+    assert sorted(sum(sequential[0, 1], [])) == list(range(20))
+    assert run(workers=2) == sequential
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from sualbsp_solver.benchmark import (
+    benchmark_suite,
+    compare_results,
+    format_regression,
+    format_results,
+    read_results,
+    write_results,
+)
+
+
+def test_benchmark_suite(tmp_path: Path) -> None:
+    results = benchmark_suite(sizes=[10], repeat=1)
+    benchmarks = [result["Benchmark"] for result in results]
+    assert benchmarks[:3] == ["parse_graph", "reassemble", "improve_solution"]
+    assert "GRASP-10" in benchmarks
+
+    file_path = tmp_path / "benchmark.json"
+    write_results(results, file_path)
+    assert read_results(file_path) == results
+
+
+def test_compare_results() -> None:
+    baseline = [
+        {"Benchmark": "a", "Num_Tasks": 10, "Min_Runtime": 1.0},
+        {"Benchmark": "b", "Num_Tasks": 10, "Min_Runtime": 1.0},
+        {"Benchmark": "c", "Num_Tasks": 10, "Min_Runtime": 0.0001},
+    ]
+    results = [
+        {"Benchmark": "a", "Num_Tasks": 10, "Min_Runtime": 1.1},
+        {"Benchmark": "b", "Num_Tasks": 10, "Min_Runtime": 2.0},
+        {"Benchmark": "c", "Num_Tasks": 10, "Min_Runtime": 0.001},
+        {"Benchmark": "d", "Num_Tasks": 10, "Min_Runtime": 2.0},
+    ]
+
+    regressions = compare_results(results, baseline)
+    assert [result["Benchmark"] for result in regressions] == ["b"]
+    assert results[1]["Ratio"] == 2.0
+    assert "Ratio" not in results[3]
+    assert format_regression(regressions[0]) == (
+        "Regression: b on 10 tasks takes 2.00 times the baseline runtime"
+    )
+
+
+def test_format_results() -> None:
+    results = [
+        {"Benchmark": "parse_graph", "Num_Tasks": 10, "Min_Runtime": 0.5},
+        {"Benchmark": "a", "Num_Tasks": 100, "Min_Runtime": 1.25},
+    ]
+    assert format_results(results).splitlines() == [
+        "Benchmark    Num_Tasks  Min_Runtime",
+        "parse_graph  10         0.500000   ",
+        "a            100        1.250000   ",
+    ]
+    assert format_results([]) == "No results"
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pytest
+from sualbsp_solver.generator import generate_instance, order_strength, write_instances
+from sualbsp_solver.in2_parser import parse_graph
+
+
+def test_generate_instance_is_reproducible() -> None:
+    compiled = generate_instance(40, seed=3).compile()
+    other = generate_instance(40, seed=3).compile()
+
+    assert compiled.processing_times == other.processing_times
+    assert compiled.setup_times == other.setup_times
+    assert compiled.predecessors == other.predecessors
+    assert compiled.setup_times != generate_instance(40, seed=4).compile().setup_times
+
+
+def test_generate_instance_order_strength() -> None:
+    for target in [0.0, 0.3, 0.8]:
+        compiled = generate_instance(150, order_strength=target).compile()
+        assert order_strength(compiled) == pytest.approx(target, abs=0.05)
+        assert all(
+            predecessor < task
+            for task in range(compiled.num_tasks)
+            for predecessor in compiled.predecessors_of(task)
+        )
+
+
+def test_generate_instance_cycle_time_and_setups() -> None:
+    compiled = generate_instance(
+        50, cycle_time_tightness=0.5, setup_variability=0.25, setup_reference="min"
+    ).compile()
+    max_setup = int(0.25 * min(compiled.processing_times))
+
+    assert compiled.cycle_time == 2 * max(compiled.processing_times)
+    assert max(compiled.setup_times) <= max_setup
+    assert all(compiled.setup_time(task, task) == 0 for task in range(50))
+
+
+def test_generate_instance_validates_arguments() -> None:
+    with pytest.raises(ValueError):
+        generate_instance(10, order_strength=1.5)
+    with pytest.raises(ValueError):
+        generate_instance(10, cycle_time_tightness=0)
+
+
+def test_write_instances(tmp_path: Path) -> None:
+    file_paths = write_instances(tmp_path, [20], num_instances=2)
+
+    assert [file_path.name for file_path in file_paths] == [
+        "SYN20-OS0.5-CT0.2_TS0.25-med_EJ1.txt",
+        "SYN20-OS0.5-CT0.2_TS0.25-med_EJ2.txt",
+    ]
+    graph = parse_graph(file_paths[1])
+    assert (
+        graph.compile().setup_times
+        == generate_instance(20, seed=1).compile().setup_times
+    )
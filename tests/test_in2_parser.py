@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+from sualbsp_solver.in2_parser import ParseError, parse_graph, write_graph
+
+INSTANCE = """3
+2
+10
+0,4
+1,3
+2,5
+0,1
+0,2
+0,1,2
+2,0,1
+1,3,0
+"""
+
+
+def test_parse_graph(tmp_path: Path) -> None:
+    file_path = tmp_path / "instance.txt"
+    file_path.write_text(INSTANCE)
+
+    graph = parse_graph(file_path)
+    assert graph.name == "instance.txt"
+    assert graph.cycle_time == 10
+    assert [task.processing_time for task in graph.tasks] == [4, 3, 5]
+    assert graph.tasks[2].predecessors == [0]
+    assert list(graph.tasks[2].setup_times) == [1, 3, 0]
+    assert list(graph.compile().successors_of(0)) == [1, 2]
+
+
+def test_parse_graph_with_leading_zeros(tmp_path: Path) -> None:
+    file_path = tmp_path / "instance.txt"
+    file_path.write_text(INSTANCE.replace("2,0,1", "02,00,01"))
+
+    assert list(parse_graph(file_path).tasks[1].setup_times) == [2, 0, 1]
+
+
+def test_parse_graph_fails_on_missing_setup_times(tmp_path: Path) -> None:
+    file_path = tmp_path / "instance.txt"
+    file_path.write_text(INSTANCE.replace("1,3,0\n", "1,3\n"))
+
+    with pytest.raises(ParseError):
+        parse_graph(file_path)
+
+
+def test_write_graph(tmp_path: Path) -> None:
+    file_path = tmp_path / "instance.txt"
+    file_path.write_text(INSTANCE)
+    graph = parse_graph(file_path)
+
+    written_path = tmp_path / "written.txt"
+    write_graph(graph, written_path)
+    written = parse_graph(written_path)
+
+    assert written.cycle_time == graph.cycle_time
+    assert written.compile().processing_times == graph.compile().processing_times
+    assert written.compile().setup_times == graph.compile().setup_times
+    assert written.compile().predecessors == graph.compile().predecessors
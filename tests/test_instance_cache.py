@@ -0,0 +1,55 @@
+import os
+import pickle
+from pathlib import Path
+
+from sualbsp_solver.instance_cache import get_cache_path, load_graph
+
+INSTANCE = """3
+2
+{cycle_time}
+0,4
+1,3
+2,5
+0,1
+0,2
+0,1,2
+2,0,1
+1,3,0
+"""
+
+
+def write_instance(directory: Path, cycle_time: int = 10) -> Path:
+    file_path = directory / "instance.txt"
+    file_path.write_text(INSTANCE.format(cycle_time=cycle_time))
+    return file_path
+
+
+def test_cache_is_written_and_loaded(tmp_path: Path) -> None:
+    file_path = write_instance(tmp_path)
+    parsed = load_graph(file_path)
+    assert get_cache_path(file_path).exists()
+
+    cached = load_graph(file_path)
+    assert cached.name == parsed.name == "instance.txt"
+    assert cached.cycle_time == 10
+    assert cached.compile().setup_times == parsed.compile().setup_times
+    assert cached.tasks == parsed.tasks
+    assert cached.tasks[2].predecessors == [0]
+    assert cached.tasks[1].setup_time(cached.tasks[2]) == 1
+
+
+def test_modified_instance_is_parsed_again(tmp_path: Path) -> None:
+    file_path = write_instance(tmp_path)
+    load_graph(file_path)
+
+    write_instance(tmp_path, cycle_time=12)
+    os.utime(file_path, ns=(0, 0))
+    assert load_graph(file_path).cycle_time == 12
+
+
+def test_cached_graph_can_be_pickled(tmp_path: Path) -> None:
+    file_path = write_instance(tmp_path)
+    load_graph(file_path)
+
+    graph = pickle.loads(pickle.dumps(load_graph(file_path)))
+    assert graph.tasks[2].setup_time(graph.tasks[1]) == 3
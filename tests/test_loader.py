@@ -0,0 +1,31 @@
+import pytest
+from sualbsp_solver.loader import prefetch
+
+
+def test_prefetch_keeps_order() -> None:
+    assert list(prefetch(range(10), size=2)) == list(range(10))
+
+
+def test_prefetch_raises_errors_of_producer() -> None:
+    def produce():
+        yield 1
+        raise ValueError("broken")
+
+    items = prefetch(produce())
+    assert next(items) == 1
+    with pytest.raises(ValueError):
+        next(items)
+
+
+def test_prefetch_stays_bounded() -> None:
+    produced = []
+
+    def produce():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    items = prefetch(produce(), size=2)
+    assert next(items) == 0
+    items.close()
+    assert len(produced) <= 4
@@ -0,0 +1,68 @@
+import random
+
+from sualbsp_solver import profiling
+from sualbsp_solver.experiment import run_optimizer
+from sualbsp_solver.generator import generate_instance
+from sualbsp_solver.solver.grasp import GRASP
+from sualbsp_solver.solver.local_search import improve_solution
+from sualbsp_solver.solver.rule import get_ordering_rules
+from sualbsp_solver.solver.station_oriented import StationOrientedStrategy
+
+
+def test_profile_counters_and_timers() -> None:
+    with profiling.profiling() as profile:
+        profiling.count("a")
+        profiling.count("a", 2)
+        with profiling.timer("t"):
+            pass
+
+    assert profile.as_dict()["counters"] == {"a": 3}
+    assert list(profile.timers) == ["t"]
+
+    profile.merge({"counters": {"a": 1, "b": 1}, "timers": {"t": 1.0}})
+    assert profile.counters == {"a": 4, "b": 1}
+    assert profile.timers["t"] >= 1.0
+
+
+def test_nested_profiles() -> None:
+    with profiling.profiling() as outer:
+        profiling.count("a")
+        with profiling.profiling() as inner:
+            profiling.count("b")
+        profiling.count("a")
+
+    assert outer.counters == {"a": 2}
+    assert inner.counters == {"b": 1}
+    assert profiling.active_profile() is None
+
+
+def test_disabled_profiling_records_nothing() -> None:
+    profiling.count("a")
+    with profiling.timer("t"):
+        pass
+    assert profiling.active_profile() is None
+
+
+def test_local_search_is_profiled() -> None:
+    graph = generate_instance(30, seed=0)
+    solution = StationOrientedStrategy(get_ordering_rules()[0]).solve(graph)
+
+    with profiling.profiling() as profile:
+        improve_solution(solution, graph.cycle_time, rng=random.Random(0))
+
+    assert profile.counters["neighbourhood_searches"] >= 1
+    assert profile.counters["evaluations"] > 0
+    assert profile.counters["reassemblies"] >= 1
+
+
+def test_parallel_grasp_merges_worker_profiles() -> None:
+    graph = generate_instance(30, seed=0)
+
+    result = run_optimizer(graph, GRASP(4, seed=1, workers=2), profile=True)
+    profile = result["Profile"]
+    assert profile["Configuration"] == "GRASP-4"
+    assert 1 <= profile["counters"]["iterations"] <= 4
+    assert profile["counters"]["constructions"] == profile["counters"]["iterations"]
+    assert "local_search" in profile["timers"]
+
+    assert "Profile" not in run_optimizer(graph, GRASP(4, seed=1))
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from sualbsp_solver.results_store import ResultsStore
+
+
+def test_results_are_reloaded(tmp_path: Path) -> None:
+    filepath = tmp_path / "results.jsonl"
+    key = ResultsStore.key("abc", "GRASP-5", 42)
+
+    ResultsStore(filepath).add(key, {"Num_Stations": 3})
+    assert ResultsStore(filepath).get(key) == {"Num_Stations": 3}
+
+
+def test_incomplete_line_is_skipped(tmp_path: Path) -> None:
+    filepath = tmp_path / "results.jsonl"
+    store = ResultsStore(filepath)
+    store.add("a", {"Num_Stations": 3})
+    with filepath.open("a") as f:
+        f.write('{"key": "b", "res')
+
+    store = ResultsStore(filepath)
+    store.add("c", {"Num_Stations": 4})
+
+    assert len(ResultsStore(filepath)) == 2
+    assert "b" not in store
+
+
+def test_clear(tmp_path: Path) -> None:
+    filepath = tmp_path / "results.jsonl"
+    store = ResultsStore(filepath)
+    store.add("a", {"Num_Stations": 3})
+
+    store.clear()
+    assert not filepath.exists()
+    assert store.get("a") is None
@@ -0,0 +1,84 @@
+from pathlib import Path
+
+from sualbsp_solver.experiment import create_optimizers
+from sualbsp_solver.results_store import ResultsStore
+from sualbsp_solver.scheduler import ExperimentScheduler, count_tasks
+from sualbsp_solver.solution_cache import SolutionCache
+
+INSTANCE = """4
+3
+{cycle_time}
+0,4
+1,3
+2,5
+3,2
+0,1
+0,2
+2,3
+0,1,2,1
+2,0,1,2
+1,3,0,1
+2,1,1,0
+"""
+
+
+def write_instances(directory: Path, num_instances: int) -> list[Path]:
+    file_paths = []
+    for i in range(num_instances):
+        file_path = directory / f"instance_{i}.txt"
+        file_path.write_text(INSTANCE.format(cycle_time=10 + i))
+        file_paths.append(file_path)
+    return file_paths
+
+
+def test_count_tasks(tmp_path: Path) -> None:
+    file_path = write_instances(tmp_path, 1)[0]
+    assert count_tasks(file_path) == 4
+
+
+def test_parallel_run_matches_sequential_run(tmp_path: Path) -> None:
+    file_paths = write_instances(tmp_path, 2)
+
+    def run(workers: int) -> dict:
+        scheduler = ExperimentScheduler(file_paths, create_optimizers(), workers)
+        return {
+            file_path: [(r["Strategy"], r["Num_Stations"], r["ARD"]) for r in results]
+            for file_path, results in scheduler.run()
+        }
+
+    assert run(workers=2) == run(workers=1)
+
+
+def test_stored_results_are_skipped(tmp_path: Path) -> None:
+    file_paths = write_instances(tmp_path, 2)
+    store = ResultsStore(tmp_path / "results.jsonl")
+    optimizers = create_optimizers()
+
+    first_run = dict(ExperimentScheduler(file_paths, optimizers, store=store).run())
+    assert len(store) == len(file_paths) * len(optimizers)
+
+    scheduler = ExperimentScheduler(file_paths, optimizers, workers=2, store=store)
+    assert scheduler.create_jobs() == []
+    assert dict(scheduler.run()) == first_run
+
+
+def test_cached_results_are_not_solved_again(tmp_path: Path) -> None:
+    file_paths = write_instances(tmp_path, 2)
+    optimizers = create_optimizers()
+    cache = SolutionCache(tmp_path / "cache")
+
+    num_heuristics = len(optimizers) - 2
+
+    def run(workers: int) -> dict:
+        scheduler = ExperimentScheduler(file_paths, optimizers, workers, cache=cache)
+        return {
+            file_path: [(r["Stations"], r["Runtime"]) for r in results[:num_heuristics]]
+            for file_path, results in scheduler.run()
+        }
+
+    first_run = run(workers=1)
+    assert len(cache) == len(file_paths) * num_heuristics
+
+    # the runtimes of the cached runs are returned
+    assert run(workers=1) == first_run
+    assert run(workers=2) == first_run
@@ -0,0 +1,180 @@
+import asyncio
+import json
+
+import pytest
+
+from sualbsp_solver.generator import generate_instance
+from sualbsp_solver.server import SolverServer, graph_from_json, parse_instance
+
+INSTANCE = """4
+3
+10
+0,4
+1,3
+2,5
+3,2
+0,1
+0,2
+2,3
+0,1,2,1
+2,0,1,2
+1,3,0,1
+2,1,1,0
+"""
+
+
+async def request(server: SolverServer, *messages: dict) -> list[dict]:
+    """Sends the messages to the server and returns the events until all jobs are done."""
+    host, port = server._server.sockets[0].getsockname()[:2]
+    reader, writer = await asyncio.open_connection(host, port)
+    for message in messages:
+        writer.write(json.dumps(message).encode() + b"\n")
+    await writer.drain()
+
+    events = []
+    num_open = len(messages)
+    while num_open:
+        event = json.loads(await asyncio.wait_for(reader.readline(), timeout=30))
+        events.append(event)
+        if event["event"] in ("completed", "cancelled", "timeout", "error"):
+            num_open -= 1
+
+    writer.close()
+    await writer.wait_closed()
+    return events
+
+
+def run(workers: int, *messages: dict) -> list[dict]:
+    async def main() -> list[dict]:
+        server = SolverServer(workers)
+        await server.start()
+        try:
+            return await request(server, *messages)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_solve_in2_instance() -> None:
+    events = run(
+        1,
+        {"type": "solve", "instance": INSTANCE, "iterations": 3, "seed": 0},
+        {
+            "type": "solve",
+            "instance": INSTANCE,
+            "optimizer": "StationOrientedStrategy-MaxTSOrdering",
+        },
+    )
+
+    names = [event["event"] for event in events if event["job"] == 1]
+    assert names[:2] == ["queued", "started"]
+    assert "incumbent" in names
+    assert names[-1] == "completed"
+
+    completed = [event for event in events if event["event"] == "completed"]
+    assert len(completed) == 2
+    for event in completed:
+        assert sorted(sum(event["stations"], [])) == [0, 1, 2, 3]
+
+
+def test_cancel_running_job() -> None:
+    # the lower bound of this instance is not reached, so GRASP runs until it is cancelled
+    graph = generate_instance(100, setup_variability=1.0, seed=0)
+    compiled = graph.compile()
+    instance = {
+        "cycle_time": compiled.cycle_time,
+        "processing_times": list(compiled.processing_times),
+        "setup_times": [list(compiled.setup_row(task)) for task in range(100)],
+        "predecessors": [list(compiled.predecessors_of(task)) for task in range(100)],
+    }
+    assert graph_from_json(instance).compile().setup_times == compiled.setup_times
+
+    async def main() -> list[dict]:
+        server = SolverServer(1)
+        await server.start()
+        try:
+            host, port = server._server.sockets[0].getsockname()[:2]
+            reader, writer = await asyncio.open_connection(host, port)
+            solve = {"type": "solve", "instance": instance, "time_limit": 60}
+            writer.write(json.dumps(solve).encode() + b"\n")
+
+            events = []
+            while not events or events[-1]["event"] != "started":
+                events.append(json.loads(await reader.readline()))
+            writer.write(json.dumps({"type": "cancel", "job": 1}).encode() + b"\n")
+            while events[-1]["event"] != "cancelled":
+                events.append(
+                    json.loads(await asyncio.wait_for(reader.readline(), timeout=30))
+                )
+            writer.close()
+            return events
+        finally:
+            await server.close()
+
+    events = asyncio.run(main())
+    assert events[-1] == {"job": 1, "event": "cancelled"}
+
+
+def test_invalid_request() -> None:
+    events = run(1, {"type": "solve", "instance": "1\n"})
+    assert events[0]["event"] == "error"
+
+
+def test_invalid_options_do_not_block_the_worker() -> None:
+    heuristic = "StationOrientedStrategy-MaxTSOrdering"
+    events = run(
+        1,
+        {
+            "type": "solve",
+            "instance": INSTANCE,
+            "optimizer": heuristic,
+            "time_limit": "5",
+        },
+        {"type": "solve", "instance": INSTANCE, "iterations": -1},
+        {"type": "solve", "instance": INSTANCE, "optimizer": heuristic},
+    )
+
+    assert [event["event"] for event in events[:2]] == ["error", "error"]
+    assert events[-1]["event"] == "completed"
+
+
+@pytest.mark.parametrize(
+    "predecessors, processing_times",
+    [
+        ([[], [-1]], [4, 3]),
+        ([[], [2]], [4, 3]),
+        ([[1], [0]], [4, 3]),
+        ([[], [0]], [4, 11]),
+    ],
+)
+def test_invalid_instances_are_rejected(
+    predecessors: list[list[int]], processing_times: list[int]
+) -> None:
+    instance = {
+        "cycle_time": 10,
+        "processing_times": processing_times,
+        "setup_times": [[0, 1], [1, 0]],
+        "predecessors": predecessors,
+    }
+    with pytest.raises(ValueError):
+        parse_instance(instance)
+
+
+def test_jobs_wait_for_a_free_process() -> None:
+    events = run(
+        1,
+        {"type": "solve", "instance": INSTANCE, "optimizer": "GRASP", "iterations": 2},
+        {"type": "solve", "instance": INSTANCE, "optimizer": "GRASP", "iterations": 2},
+    )
+    lifecycle = [
+        (event["job"], event["event"])
+        for event in events
+        if event["event"] in ("started", "completed")
+    ]
+    assert lifecycle == [
+        (1, "started"),
+        (1, "completed"),
+        (2, "started"),
+        (2, "completed"),
+    ]
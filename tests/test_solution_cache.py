@@ -0,0 +1,86 @@
+from pathlib import Path
+
+from sualbsp_solver.batch import solve_batch
+from sualbsp_solver.experiment import run_optimizer
+from sualbsp_solver.generator import generate_instance
+from sualbsp_solver.solution_cache import SolutionCache
+from sualbsp_solver.solver.grasp import GRASP
+from sualbsp_solver.solver.reactive_grasp import ReactiveGRASP
+from sualbsp_solver.solver.rule import get_ordering_rules
+from sualbsp_solver.solver.station_oriented import StationOrientedStrategy
+
+
+def test_fingerprint_ignores_name() -> None:
+    graph = generate_instance(10, seed=0)
+    renamed = generate_instance(10, seed=0)
+    renamed.name = "renamed"
+
+    assert graph.compile().fingerprint == renamed.compile().fingerprint
+    assert (
+        graph.compile().fingerprint
+        != generate_instance(10, seed=1).compile().fingerprint
+    )
+
+
+def test_deterministic_runs_are_cached(tmp_path: Path) -> None:
+    graph = generate_instance(20, seed=0)
+    optimizer = StationOrientedStrategy(get_ordering_rules()[0])
+
+    result = run_optimizer(graph, optimizer, cache=SolutionCache(tmp_path))
+    cache = SolutionCache(tmp_path)
+    assert len(cache) == 1
+    assert cache.get(graph, optimizer) == result
+
+    # the key includes the ordering rule and the seed
+    assert cache.get(graph, StationOrientedStrategy(get_ordering_rules()[1])) is None
+    run_optimizer(graph, GRASP(2, seed=0), cache=cache)
+    assert cache.get(graph, GRASP(2, seed=1)) is None
+
+    # runs without a seed are not deterministic
+    run_optimizer(graph, GRASP(2), cache=cache)
+    assert len(cache) == 2
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path: Path) -> None:
+    graphs = [generate_instance(20, seed=seed) for seed in range(3)]
+    optimizer = StationOrientedStrategy(get_ordering_rules()[0])
+    result = {"Num_Stations": 3, "Stations": [[0], [1], [2]]}
+
+    cache = SolutionCache(tmp_path)
+    for graph in graphs[:2]:
+        cache.add(graph, optimizer, result)
+    cache.get(graphs[0], optimizer)
+
+    # the entries have the same size, the bound holds two of them
+    cache.max_size = cache.size
+    cache.add(graphs[2], optimizer, result)
+    assert len(cache) == 2
+    assert cache.get(graphs[1], optimizer) is None
+    assert cache.get(graphs[0], optimizer) is not None
+    assert len(list(tmp_path.glob("*.json"))) == 2
+
+
+def test_configurations_have_their_own_entries(tmp_path: Path) -> None:
+    graph = generate_instance(20, seed=0)
+    cache = SolutionCache(tmp_path)
+
+    run_optimizer(graph, ReactiveGRASP(4, seed=0), cache=cache)
+    assert cache.get(graph, ReactiveGRASP(4, seed=0, alphas=(1.0,))) is None
+    assert cache.get(graph, ReactiveGRASP(4, seed=0)) is not None
+
+
+def test_batch_uses_cache(tmp_path: Path) -> None:
+    instances = [generate_instance(20, seed=seed) for seed in range(2)]
+    optimizers = [StationOrientedStrategy(get_ordering_rules()[0]), GRASP(2, seed=0)]
+
+    def run(workers: int) -> dict:
+        cache = SolutionCache(tmp_path)
+        return {
+            (result.instance_index, result.optimizer_index): result.result
+            for result in solve_batch(instances, optimizers, workers, cache=cache)
+        }
+
+    solved = run(workers=2)
+    assert len(SolutionCache(tmp_path)) == 4
+    assert run(workers=2) == solved
+    assert run(workers=1) == solved